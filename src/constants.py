@@ -15,6 +15,7 @@ GEMINI_CODENAME = "nano-banana"
 # 토큰 및 비용
 GEMINI_TOKENS_PER_IMAGE = 1290
 GEMINI_COST_PER_IMAGE = 0.039  # USD
+GEMINI_COST_MICROS_PER_IMAGE = round(GEMINI_COST_PER_IMAGE * 1_000_000)  # 정수 집계용 (백만분의 1 USD)
 
 # 이미지 해상도 및 형식
 GEMINI_DEFAULT_RESOLUTION = (1024, 1024)
@@ -58,6 +59,14 @@ SUPPORTED_INPUT_FORMATS = [
 # 지원되는 출력 형식
 SUPPORTED_OUTPUT_FORMATS = ["png", "jpeg", "webp"]
 
+# API 응답 MIME 타입 → 출력 형식
+MIME_TO_FORMAT = {
+    "image/png": "png",
+    "image/jpeg": "jpeg",
+    "image/jpg": "jpeg",
+    "image/webp": "webp"
+}
+
 # 이미지 품질 설정
 IMAGE_QUALITY_LEVELS = {
     "low": 60,
@@ -144,6 +153,16 @@ CACHE_EXPIRY_TIMES = {
     "prompt": 7 * 24 * 60 * 60  # 7일
 }
 
+# 응답 캐시 키 버전 (프롬프트 템플릿 등 결과에 영향을 주는 변경 시 올려서 기존 항목 무효화)
+CACHE_VERSION = "1"
+
+# 인메모리 캐시 최대 항목 수
+CACHE_MAX_ENTRIES = {
+    "prompt": 4096,   # 최적화된 프롬프트
+    "response": 1024,  # API 응답 (저장된 결과 파일 참조)
+    "history_query": 64  # 이미지 기록 조회 결과 (limit, 작업 유형별)
+}
+
 # 캐시 파일 확장자
 CACHE_FILE_EXTENSIONS = {
     "image": ".png",
@@ -229,6 +248,22 @@ MIN_PROMPT_LENGTH = 3
 MAX_BATCH_SIZE = 4
 MAX_IMAGES_PER_REQUEST = 4
 
+# 상태 조회 시스템 정보 캐시 유지 시간
+SYSTEM_INFO_CACHE_TTL = 5  # 초
+STORAGE_STATS_CACHE_TTL = 15  # 초
+HEALTH_SUMMARY_CACHE_TTL = 1  # 초 (메모리 스냅샷 공유 포함)
+
+# 메타데이터/캐시 인덱스 지연 기록 (모아서 한 번에 쓰고 fsync)
+METADATA_FLUSH_INTERVAL = 0.5  # 초
+METADATA_FLUSH_BATCH_SIZE = 32  # 대기 항목이 이 수에 도달하면 즉시 기록
+
+# 디렉토리 탐색 (하위 디렉토리별로 스레드에서 병렬 scandir)
+DIRECTORY_SCAN_WORKERS = 8
+
+# 파일 일괄 삭제 (이 수 이상이면 스레드에서 병렬 unlink)
+FILE_DELETE_WORKERS = 16
+FILE_DELETE_PARALLEL_MIN = 16
+
 # ================================
 # 파일명 생성 관련
 # ================================
@@ -8,7 +8,7 @@ Google의 Gemini 2.5 Flash Image API와의 통신을 담당하는 클라이언
 import asyncio
 import logging
 import time
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, AsyncIterator
 from pathlib import Path
 from io import BytesIO
 
@@ -321,6 +321,95 @@ class GeminiClient:
                 "count": 0
             }
     
+    async def generate_image_stream(
+        self,
+        prompt: str,
+        aspect_ratio: Optional[str] = None,
+        style: Optional[str] = None,
+        quality: Optional[str] = "high",
+        candidate_count: int = 1
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        텍스트 프롬프트로부터 이미지 생성 (스트리밍)
+        
+        스트리밍 응답을 워커 스레드에서 소비하면서 이미지가 도착하는 즉시
+        (순번, {"data", "mime_type", "request_id"}) 형태로 전달하므로, 호출자는 나머지 후보를
+        수신하는 동안 앞선 후보의 후처리를 시작할 수 있습니다.
+        
+        Args:
+            prompt: 이미지 생성 프롬프트
+            aspect_ratio: 이미지 비율
+            style: 스타일
+            quality: 품질
+            candidate_count: 생성할 이미지 수
+            
+        Yields:
+            Tuple[int, Dict[str, Any]]: (0부터 시작하는 순번, 이미지 데이터)
+            
+        Raises:
+            GeminiAPIError: API 호출 실패 또는 이미지가 반환되지 않은 경우
+        """
+        # 요청 통계 업데이트
+        self._request_count += 1
+        
+        # 생성 설정
+        config = GenerateContentConfig(
+            candidate_count=min(candidate_count, 4),
+            temperature=0.7
+        )
+        
+        # 프롬프트 구성
+        full_prompt = self._build_image_prompt(prompt, aspect_ratio, style)
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        
+        def consume_stream() -> None:
+            """동기 스트림을 소비하며 이미지 파트를 이벤트 루프 큐로 전달"""
+            try:
+                for chunk in self._client.models.generate_content_stream(
+                    model=GEMINI_MODEL_NAME,
+                    contents=[full_prompt],
+                    config=config
+                ):
+                    for candidate in chunk.candidates or []:
+                        if candidate.content and candidate.content.parts:
+                            for part in candidate.content.parts:
+                                if hasattr(part, 'inline_data') and part.inline_data:
+                                    loop.call_soon_threadsafe(queue.put_nowait, {
+                                        "data": part.inline_data.data,
+                                        "mime_type": part.inline_data.mime_type,
+                                        "request_id": getattr(chunk, "response_id", None)
+                                    })
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+        
+        producer = asyncio.ensure_future(asyncio.to_thread(consume_stream))
+        count = 0
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"Image generation failed: {item}")
+                    raise GeminiAPIError(str(item)) from item
+                
+                yield count, item
+                count += 1
+        finally:
+            await producer
+            
+            # 통계 업데이트
+            self._total_images_generated += count
+            self._total_cost += count * GEMINI_COST_PER_IMAGE
+        
+        if count == 0:
+            raise GeminiAPIError("No images returned from API", "NO_IMAGES_ERROR")
+    
     async def edit_image(
         self,
         image_path: str,
@@ -577,6 +666,9 @@ class GeminiClient:
 # 전역 클라이언트 인스턴스 (싱글톤 패턴)
 _global_client: Optional[GeminiClient] = None
 
+# 클라이언트 생성 잠금 (동시 첫 호출이 헬스체크를 중복 수행하지 않도록, 최초 사용 시 생성)
+_client_lock: Optional[asyncio.Lock] = None
+
 
 async def create_gemini_client(settings=None) -> GeminiClient:
     """
@@ -588,18 +680,29 @@ async def create_gemini_client(settings=None) -> GeminiClient:
     Returns:
         GeminiClient: 초기화된 클라이언트
     """
-    global _global_client
+    global _global_client, _client_lock
     
-    if _global_client is None:
-        logger.info("Creating new Gemini client...")
-        _global_client = GeminiClient(settings=settings)
-        
-        # 헬스체크 실행
-        health = await _global_client.health_check()
-        if not health["api_accessible"]:
-            logger.warning(f"API accessibility check failed: {health.get('error', 'Unknown error')}")
-        else:
-            logger.info("✅ Gemini API health check passed")
+    # 이미 생성된 경우 잠금 없이 바로 반환
+    if _global_client is not None:
+        return _global_client
+    
+    if _client_lock is None:
+        _client_lock = asyncio.Lock()
+    
+    async with _client_lock:
+        # 잠금 대기 중 다른 호출이 생성을 마쳤을 수 있으므로 다시 확인
+        if _global_client is None:
+            logger.info("Creating new Gemini client...")
+            client = GeminiClient(settings=settings)
+            
+            # 헬스체크 실행
+            health = await client.health_check()
+            if not health["api_accessible"]:
+                logger.warning(f"API accessibility check failed: {health.get('error', 'Unknown error')}")
+            else:
+                logger.info("✅ Gemini API health check passed")
+            
+            _global_client = client
     
     return _global_client
 
@@ -6,6 +6,7 @@ Pydantic 데이터 모델 스키마
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 
@@ -654,6 +655,28 @@ def create_error_response(
     )
 
 
+@lru_cache(maxsize=64)
+def _error_response_template(code: str) -> Dict[str, Any]:
+    """에러 코드별 응답 템플릿 (검증/직렬화는 코드당 1회)"""
+    return create_error_response("", code).model_dump()
+
+
+def create_error_dict(message: str, code: str = "UNKNOWN_ERROR") -> Dict[str, Any]:
+    """
+    에러 응답 dict 생성 헬퍼 함수
+    
+    create_error_response(...).model_dump()와 같은 구조를 반환하지만,
+    에러 코드별로 검증된 템플릿을 복사하여 메시지와 응답 시간만 채웁니다.
+    """
+    template = _error_response_template(code)
+    return {
+        **template,
+        "message": message,
+        "timestamp": datetime.now(),
+        "error": {**template["error"], "message": message}
+    }
+
+
 def validate_model_data(model_class: BaseModel, data: Dict[str, Any]) -> ValidationResult:
     """모델 데이터 검증 헬퍼 함수"""
     
@@ -18,7 +18,7 @@ from .config import get_settings, setup_logging
 from .constants import PROJECT_NAME, PROJECT_VERSION, MCP_VERSION
 from .gemini_client import create_gemini_client, get_gemini_client
 from .tools import generate, edit, blend, status
-from .models.schemas import create_error_response
+from .models.schemas import create_error_dict
 
 # 설정 및 로깅 초기화
 settings = get_settings()
@@ -61,10 +61,10 @@ async def nanobanana_generate(
         )
     except Exception as e:
         logger.error(f"Error in nanobanana_generate: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Generation failed: {str(e)}",
             "GENERATION_ERROR"
-        ).dict()
+        )
 
 
 @mcp_server.tool()
@@ -88,10 +88,10 @@ async def nanobanana_edit(
         )
     except Exception as e:
         logger.error(f"Error in nanobanana_edit: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Edit failed: {str(e)}",
             "EDIT_ERROR"
-        ).dict()
+        )
 
 
 @mcp_server.tool()
@@ -115,10 +115,10 @@ async def nanobanana_blend(
         )
     except Exception as e:
         logger.error(f"Error in nanobanana_blend: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Blend failed: {str(e)}",
             "BLEND_ERROR"
-        ).dict()
+        )
 
 
 @mcp_server.tool()
@@ -136,10 +136,10 @@ async def nanobanana_status(
         )
     except Exception as e:
         logger.error(f"Error in nanobanana_status: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Status check failed: {str(e)}",
             "STATUS_ERROR"
-        ).dict()
+        )
 
 
 # ================================
@@ -18,14 +18,17 @@ from ..models.schemas import (
     BlendImagesRequest,
     BlendImagesResponse,
     ImageMetadata,
-    create_error_response,
+    create_error_dict,
     OperationType
 )
-from ..constants import GEMINI_MODEL_NAME, GEMINI_COST_PER_IMAGE
+from ..constants import GEMINI_MODEL_NAME, GEMINI_COST_PER_IMAGE, MIME_TO_FORMAT
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 일관성 유지 옵션 사용 시 추가되는 프롬프트 키워드
+_CONSISTENCY_KEYWORDS = ("consistent style", "coherent composition", "unified lighting")
+
 
 async def nanobanana_blend(
     image_paths: List[str],
@@ -74,10 +77,10 @@ async def nanobanana_blend(
             
         except Exception as e:
             logger.error(f"Request validation failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Invalid request parameters: {str(e)}",
                 "VALIDATION_ERROR"
-            ).dict()
+            )
         
         # 2. 소스 이미지들 검증 및 정보 수집
         try:
@@ -110,10 +113,10 @@ async def nanobanana_blend(
             
         except Exception as e:
             logger.error(f"Source images validation failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Failed to load or validate source images: {str(e)}",
                 "IMAGE_LOAD_ERROR"
-            ).dict()
+            )
         
         # 3. 프롬프트 최적화
         optimized_prompt = request.blend_prompt
@@ -121,16 +124,12 @@ async def nanobanana_blend(
             try:
                 optimizer = get_prompt_optimizer()
                 
-                # 일관성 유지 키워드 추가
-                additional_keywords = []
-                if request.maintain_consistency:
-                    additional_keywords.extend(["consistent style", "coherent composition", "unified lighting"])
-                
+                # 일관성 유지 키워드 추가 (불변 튜플이라 최적화 캐시 키로 그대로 사용됨)
                 optimized_prompt = optimizer.optimize_prompt(
                     prompt=request.blend_prompt,
                     category=PromptCategory.BLENDING,
                     quality_level=request.quality,
-                    additional_keywords=additional_keywords
+                    additional_keywords=_CONSISTENCY_KEYWORDS if request.maintain_consistency else ()
                 )
                 logger.info(f"Prompt optimized: '{request.blend_prompt}' -> '{optimized_prompt}'")
                 
@@ -158,17 +157,17 @@ async def nanobanana_blend(
             
         except GeminiAPIError as e:
             logger.error(f"Gemini API error: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Image blending failed: {e.message}",
                 e.code or "API_ERROR"
-            ).dict()
+            )
         
         except Exception as e:
             logger.error(f"Unexpected error during image blending: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Image blending failed: {str(e)}",
                 "BLENDING_ERROR"
-            ).dict()
+            )
         
         # 5. 블렌딩된 이미지 처리 및 저장
         try:
@@ -177,10 +176,10 @@ async def nanobanana_blend(
             
             if not blended_images:
                 logger.error("No blended image returned from API")
-                return create_error_response(
+                return create_error_dict(
                     "No blended image was generated",
                     "NO_RESULT_ERROR"
-                ).dict()
+                )
             
             # 첫 번째 (그리고 보통 유일한) 블렌딩된 이미지 처리
             blended_image_data = blended_images[0]
@@ -199,31 +198,31 @@ async def nanobanana_blend(
                         blended_image_data = image_handler.base64_to_bytes(base64_data)
                     else:
                         logger.error("No valid image data found in blended result")
-                        return create_error_response(
+                        return create_error_dict(
                             "Invalid blended image data format",
                             "DATA_FORMAT_ERROR"
-                        ).dict()
+                        )
                 elif isinstance(blended_image_data, str):
                     # 직접 base64 문자열인 경우
                     if hasattr(image_handler, 'base64_to_bytes'):
                         blended_image_data = image_handler.base64_to_bytes(blended_image_data)
                     else:
                         logger.error("Invalid blended image data format")
-                        return create_error_response(
+                        return create_error_dict(
                             "Invalid blended image data format",
                             "DATA_FORMAT_ERROR"
-                        ).dict()
+                        )
                 else:
                     logger.error(f"Invalid blended image data format: {type(blended_image_data)}")
-                    return create_error_response(
+                    return create_error_dict(
                         "Invalid blended image data format",
                         "DATA_FORMAT_ERROR"
-                    ).dict()
+                    )
             
             # 실제 파일 포맷 결정 (MIME 타입 우선, 사용자 요청 포맷 대체)
             if actual_mime_type:
-                # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpeg → jpeg)
-                actual_format = actual_mime_type.split('/')[-1].lower().replace('jpg', 'jpeg')
+                # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpg → jpeg, 미등록 타입은 서브타입 사용)
+                actual_format = MIME_TO_FORMAT.get(actual_mime_type.lower()) or actual_mime_type.rsplit('/', 1)[-1].lower()
                 
                 # 사용자 요청 포맷과 다른 경우 로깅
                 if actual_format != request.output_format:
@@ -261,10 +260,10 @@ async def nanobanana_blend(
             
             if not save_result["success"]:
                 logger.error("Failed to save blended image")
-                return create_error_response(
+                return create_error_dict(
                     "Failed to save blended image",
                     "SAVE_ERROR"
-                ).dict()
+                )
             
             # ImageMetadata 객체 생성 (실제 저장된 포맷 사용)
             blended_image_metadata = ImageMetadata(
@@ -288,10 +287,10 @@ async def nanobanana_blend(
             
         except Exception as e:
             logger.error(f"Image processing and saving failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Failed to process blended image: {str(e)}",
                 "PROCESSING_ERROR"
-            ).dict()
+            )
         
         # 6. 응답 생성
         try:
@@ -310,21 +309,21 @@ async def nanobanana_blend(
                 f"Blended {len(request.image_paths)} images. Cost: ${GEMINI_COST_PER_IMAGE:.4f}"
             )
             
-            return response.dict()
+            return response.model_dump()
             
         except Exception as e:
             logger.error(f"Response generation failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 "Failed to generate response",
                 "RESPONSE_ERROR"
-            ).dict()
+            )
     
     except Exception as e:
         logger.error(f"Unexpected error in nanobanana_blend: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Unexpected error: {str(e)}",
             "INTERNAL_ERROR"
-        ).dict()
+        )
 
 
 async def batch_blend_images(
@@ -342,30 +341,32 @@ async def batch_blend_images(
     try:
         logger.info(f"Starting batch image blending for {len(requests)} requests")
         
-        # 동시 실행 제한
+        # 동시 실행 제한: 고정 개수의 워커가 큐에서 요청을 꺼내 처리
         settings = get_settings()
-        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
-        
-        async def blend_with_semaphore(request_data: Dict[str, Any]) -> Dict[str, Any]:
-            async with semaphore:
-                return await nanobanana_blend(**request_data)
-        
-        # 모든 요청을 병렬로 실행
-        tasks = [blend_with_semaphore(req) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch blend request {i+1} failed: {result}")
-                error_response = create_error_response(
-                    f"Batch blend request {i+1} failed: {str(result)}",
-                    "BATCH_ERROR"
-                )
-                processed_results.append(error_response.dict())
-            else:
-                processed_results.append(result)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, request_data in enumerate(requests):
+            queue.put_nowait((index, request_data))
+        
+        processed_results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    index, request_data = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                try:
+                    processed_results[index] = await nanobanana_blend(**request_data)
+                except Exception as e:
+                    logger.error(f"Batch blend request {index+1} failed: {e}")
+                    processed_results[index] = create_error_dict(
+                        f"Batch blend request {index+1} failed: {str(e)}",
+                        "BATCH_ERROR"
+                    )
+        
+        worker_count = max(1, min(settings.max_concurrent_requests, len(requests)))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
         
         successful_count = sum(1 for r in processed_results if r.get("success", False))
         logger.info(f"Batch blending completed: {successful_count}/{len(requests)} successful")
@@ -374,11 +375,10 @@ async def batch_blend_images(
         
     except Exception as e:
         logger.error(f"Batch blending failed: {e}")
-        error_response = create_error_response(
+        return [create_error_dict(
             f"Batch blending failed: {str(e)}",
             "BATCH_PROCESSING_ERROR"
-        )
-        return [error_response.dict()]
+        )]
 
 
 def validate_blend_request(data: Dict[str, Any]) -> BlendImagesRequest:
@@ -7,25 +7,41 @@ Gemini 2.5 Flash Image API를 사용하여 기존 이미지를 자연어 명령
 import asyncio
 import logging
 import time
+from collections import Counter
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..gemini_client import get_gemini_client, create_gemini_client, GeminiAPIError
 from ..utils.prompt_optimizer import get_prompt_optimizer, PromptCategory
 from ..utils.image_handler import get_image_handler
 from ..utils.file_manager import get_file_manager
+from ..utils.response_cache import get_response_cache, ResponseCache
 from ..models.schemas import (
     EditImageRequest,
     EditImageResponse,
     ImageMetadata,
-    create_error_response,
-    OperationType
+    create_error_dict,
+    OperationType,
+    ImageFormat,
+    QualityLevel
+)
+from ..constants import (
+    CACHE_VERSION,
+    GEMINI_MODEL_NAME,
+    GEMINI_COST_PER_IMAGE,
+    SUPPORTED_INPUT_FORMATS,
+    MIME_TO_FORMAT,
+    MIN_PROMPT_LENGTH,
+    MAX_PROMPT_LENGTH
 )
-from ..constants import GEMINI_MODEL_NAME, GEMINI_COST_PER_IMAGE
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 요청 검증기 (모델 __init__을 거치지 않고 스키마 검증기를 직접 호출)
+_EDIT_REQUEST_VALIDATOR = EditImageRequest.__pydantic_validator__
+
 
 async def nanobanana_edit(
     image_path: str,
@@ -34,6 +50,7 @@ async def nanobanana_edit(
     output_format: Optional[str] = "png",
     quality: Optional[str] = "high",
     optimize_prompt: Optional[bool] = True,
+    preloaded_bytes: Optional[Dict[str, bytes]] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -46,91 +63,125 @@ async def nanobanana_edit(
         output_format: 출력 이미지 형식 ("png", "jpeg", "webp")
         quality: 이미지 품질 ("auto", "high", "medium", "low")
         optimize_prompt: 프롬프트 자동 최적화 여부 (기본값: True)
+        preloaded_bytes: 미리 읽어 둔 파일 내용 {절대 경로: 바이트} (배치 편집용)
         **kwargs: 추가 설정
         
     Returns:
         Dict: MCP 응답 형식의 편집 결과
     """
-    start_time = time.time()
-    settings = get_settings()
+    start_time = time.perf_counter()
     
     try:
-        logger.info(f"Starting image editing: '{image_path}' with prompt: '{edit_prompt[:100]}...'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting image editing: '%s' with prompt: '%s...'", image_path, edit_prompt[:100])
         
         # 1. 요청 파라미터 검증
         try:
-            request_data = {
-                "image_path": image_path,
-                "edit_prompt": edit_prompt,
-                "mask_path": mask_path,
-                "output_format": output_format,
-                "quality": quality,
-                "optimize_prompt": optimize_prompt if optimize_prompt is not None else True
-            }
+            request = None
             
-            # Pydantic 모델로 검증
-            request = EditImageRequest(**request_data)
+            # 가장 흔한 형태(마스크 없음, 기본 형식/품질)는 직접 검사 후 검증 없이 모델 구성
+            if (
+                mask_path is None
+                and output_format == "png"
+                and quality == "high"
+                and optimize_prompt in (True, None)
+            ):
+                request = _construct_default_edit_request(image_path, edit_prompt)
+            
+            if request is None:
+                request_data = {
+                    "image_path": image_path,
+                    "edit_prompt": edit_prompt,
+                    "mask_path": mask_path,
+                    "output_format": output_format,
+                    "quality": quality,
+                    "optimize_prompt": optimize_prompt if optimize_prompt is not None else True
+                }
+                
+                # Pydantic 모델로 검증
+                request = _EDIT_REQUEST_VALIDATOR.validate_python(request_data)
             logger.debug("Request validation successful")
             
+            # 절대 경로는 한 번만 계산하여 메타데이터/응답에서 재사용
+            image_abs_path = str(Path(request.image_path).absolute())
+            mask_abs_path = str(Path(request.mask_path).absolute()) if request.mask_path else None
+            
         except Exception as e:
-            logger.error(f"Request validation failed: {e}")
-            return create_error_response(
+            logger.error("Request validation failed: %s", e)
+            return create_error_dict(
                 f"Invalid request parameters: {str(e)}",
                 "VALIDATION_ERROR"
-            ).dict()
+            )
+        
+        # 2. 이미지 헤더 검증 (API 클라이언트가 경로에서 직접 읽으므로 픽셀 디코딩은 하지 않음)
+        #    및 3. 프롬프트 최적화 (이미지와 무관하므로 같은 gather에서 스레드로 동시에 수행)
+        image_handler = get_image_handler()
+        preloaded_bytes = preloaded_bytes or {}
+        
+        optimize_future = None
+        if request.optimize_prompt:
+            optimize_future = asyncio.ensure_future(asyncio.to_thread(_optimize_edit_prompt, request))
         
-        # 2. 이미지 파일 검증 및 정보 추출
         try:
-            image_handler = get_image_handler()
-            
-            # 원본 이미지 로드 및 검증
-            original_image = image_handler.load_image(request.image_path)
-            image_info = image_handler.get_image_info(original_image)
+            load_tasks = [asyncio.to_thread(
+                _read_image_info, image_handler, request.image_path, preloaded_bytes.get(image_abs_path)
+            )]
+            if request.mask_path:
+                load_tasks.append(asyncio.to_thread(
+                    _read_image_info, image_handler, request.mask_path, preloaded_bytes.get(mask_abs_path)
+                ))
+            loaded_images = await asyncio.gather(*load_tasks)
             
-            logger.info(f"Loaded original image: {image_info['size']}, format: {image_info.get('format', 'unknown')}")
+            image_info = loaded_images[0]
+            logger.info(
+                "Loaded original image: %s, format: %s",
+                image_info['size'], image_info.get('format', 'unknown')
+            )
             
             # 마스크 이미지 검증 (있는 경우)
-            mask_image = None
             if request.mask_path:
-                mask_image = image_handler.load_image(request.mask_path)
-                mask_info = image_handler.get_image_info(mask_image)
-                logger.info(f"Loaded mask image: {mask_info['size']}")
+                mask_info = loaded_images[1]
+                logger.info("Loaded mask image: %s", mask_info['size'])
                 
                 # 마스크와 원본 이미지 크기 호환성 확인
                 if mask_info['size'] != image_info['size']:
-                    logger.warning(f"Mask size {mask_info['size']} differs from image size {image_info['size']}")
+                    logger.warning("Mask size %s differs from image size %s", mask_info['size'], image_info['size'])
             
         except Exception as e:
-            logger.error(f"Image validation failed: {e}")
-            return create_error_response(
+            logger.error("Image validation failed: %s", e)
+            if optimize_future is not None:
+                optimize_future.cancel()
+            return create_error_dict(
                 f"Failed to load or validate images: {str(e)}",
                 "IMAGE_LOAD_ERROR"
-            ).dict()
+            )
         
-        # 3. 프롬프트 최적화
         optimized_prompt = request.edit_prompt
-        if request.optimize_prompt:
-            try:
-                optimizer = get_prompt_optimizer()
-                optimized_prompt = optimizer.optimize_prompt(
-                    prompt=request.edit_prompt,
-                    category=PromptCategory.EDITING,
-                    quality_level=request.quality
+        if optimize_future is not None:
+            optimized_prompt = await optimize_future
+        
+        # 3-1. 응답 캐시 조회 (동일한 이미지 + 프롬프트 + 마스크 조합은 API 재호출 생략)
+        response_cache = get_response_cache()
+        cache_key = None
+        if not kwargs:
+            # 미리 읽은 내용이 없으면 원본/마스크 전체를 읽고 해시하므로 이벤트 루프 밖에서 수행
+            cache_key = await asyncio.to_thread(
+                _build_edit_cache_key, request, optimized_prompt, preloaded_bytes
+            )
+        if cache_key:
+            cached = response_cache.get("edit", cache_key)
+            if cached:
+                cached_response = _build_cached_edit_response(
+                    request, image_abs_path, optimized_prompt, cached, start_time
                 )
-                logger.info(f"Prompt optimized: '{request.edit_prompt}' -> '{optimized_prompt}'")
-                
-            except Exception as e:
-                logger.warning(f"Prompt optimization failed, using original: {e}")
-                optimized_prompt = request.edit_prompt
+                if cached_response is not None:
+                    return cached_response
+                response_cache.invalidate("edit", cache_key)
         
         # 4. Gemini API를 통한 이미지 편집
         try:
-            gemini_client = get_gemini_client()
-            
-            # MCP 호출 시 클라이언트가 None인 경우 새로 생성
-            if gemini_client is None:
-                logger.info("Creating new Gemini client for MCP call")
-                gemini_client = await create_gemini_client()
+            # 전역 클라이언트 재사용 (최초 호출 시에만 잠금 하에 한 번 생성)
+            gemini_client = get_gemini_client() or await create_gemini_client()
             
             # API 호출
             api_result = await gemini_client.edit_image(
@@ -140,21 +191,21 @@ async def nanobanana_edit(
                 **kwargs
             )
             
-            logger.info(f"Successfully edited image via Gemini API")
+            logger.info("Successfully edited image via Gemini API")
             
         except GeminiAPIError as e:
-            logger.error(f"Gemini API error: {e}")
-            return create_error_response(
+            logger.error("Gemini API error: %s", e)
+            return create_error_dict(
                 f"Image editing failed: {e.message}",
                 e.code or "API_ERROR"
-            ).dict()
+            )
         
         except Exception as e:
-            logger.error(f"Unexpected error during image editing: {e}")
-            return create_error_response(
+            logger.error("Unexpected error during image editing: %s", e)
+            return create_error_dict(
                 f"Image editing failed: {str(e)}",
                 "EDITING_ERROR"
-            ).dict()
+            )
         
         # 5. 편집된 이미지 처리 및 저장
         try:
@@ -163,73 +214,61 @@ async def nanobanana_edit(
             
             if not edited_images:
                 logger.error("No edited image returned from API")
-                return create_error_response(
+                return create_error_dict(
                     "No edited image was generated",
                     "NO_RESULT_ERROR"
-                ).dict()
+                )
             
             # 첫 번째 (그리고 보통 유일한) 편집된 이미지 처리
             edited_image_data = edited_images[0]
             
-            # MIME 타입 추출 (파일 포맷 감지용)
-            actual_mime_type = None
+            # 페이로드 타입별 디코더로 바이트 데이터 및 MIME 타입(파일 포맷 감지용) 추출
+            decoder = _find_payload_decoder(edited_image_data)
+            if decoder is None:
+                logger.error("Invalid edited image data format: %s", type(edited_image_data))
+                return create_error_dict(
+                    "Invalid edited image data format",
+                    "DATA_FORMAT_ERROR"
+                )
             
-            # 이미지 데이터가 bytes가 아닌 경우 변환
-            if not isinstance(edited_image_data, bytes):
-                # dict 형태인 경우 실제 데이터 및 MIME 타입 추출
-                if isinstance(edited_image_data, dict):
-                    base64_data = edited_image_data.get('data') or edited_image_data.get('bytes') or edited_image_data.get('image_data')
-                    actual_mime_type = edited_image_data.get('mime_type')  # 실제 포맷 정보 추출
-                    
-                    if base64_data and hasattr(image_handler, 'base64_to_bytes'):
-                        edited_image_data = image_handler.base64_to_bytes(base64_data)
-                    else:
-                        logger.error("No valid image data found in edited result")
-                        return create_error_response(
-                            "Invalid edited image data format",
-                            "DATA_FORMAT_ERROR"
-                        ).dict()
-                elif isinstance(edited_image_data, str):
-                    # 직접 base64 문자열인 경우
-                    if hasattr(image_handler, 'base64_to_bytes'):
-                        edited_image_data = image_handler.base64_to_bytes(edited_image_data)
-                    else:
-                        logger.error("Invalid edited image data format")
-                        return create_error_response(
-                            "Invalid edited image data format",
-                            "DATA_FORMAT_ERROR"
-                        ).dict()
-                else:
-                    logger.error(f"Invalid edited image data format: {type(edited_image_data)}")
-                    return create_error_response(
-                        "Invalid edited image data format",
-                        "DATA_FORMAT_ERROR"
-                    ).dict()
+            try:
+                edited_image_data, actual_mime_type = decoder(image_handler, edited_image_data)
+            except ValueError as e:
+                logger.error("Invalid edited image data: %s", e)
+                return create_error_dict(
+                    "Invalid edited image data format",
+                    "DATA_FORMAT_ERROR"
+                )
             
             # 실제 파일 포맷 결정 (MIME 타입 우선, 사용자 요청 포맷 대체)
             if actual_mime_type:
-                # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpeg → jpeg)
-                actual_format = actual_mime_type.split('/')[-1].lower().replace('jpg', 'jpeg')
+                # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpg → jpeg, 미등록 타입은 서브타입 사용)
+                actual_format = MIME_TO_FORMAT.get(actual_mime_type.lower()) or actual_mime_type.rsplit('/', 1)[-1].lower()
                 
                 # 사용자 요청 포맷과 다른 경우 로깅
                 if actual_format != request.output_format:
-                    logger.info(f"Format adjusted for edited image: requested '{request.output_format}' → actual '{actual_format}' (API returned {actual_mime_type})")
+                    logger.info(
+                        "Format adjusted for edited image: requested '%s' → actual '%s' (API returned %s)",
+                        request.output_format, actual_format, actual_mime_type
+                    )
                 
                 final_output_format = actual_format
             else:
                 # MIME 타입이 없으면 사용자 요청 포맷 사용
                 final_output_format = request.output_format
-                logger.debug(f"Using requested format '{request.output_format}' for edited image (no MIME type from API)")
+                logger.debug("Using requested format '%s' for edited image (no MIME type from API)", request.output_format)
             
             # 편집 메타데이터 준비
-            processing_time = time.time() - start_time
+            # 처리 시간과 생성 시각은 한 번만 측정하여 메타데이터/응답에 공통 사용
+            processing_time = time.perf_counter() - start_time
+            completed_at = datetime.now()
             metadata = {
                 "model_used": GEMINI_MODEL_NAME,
-                "original_image": str(Path(request.image_path).absolute()),
+                "original_image": image_abs_path,
                 "original_prompt": request.edit_prompt,
                 "optimized_prompt": optimized_prompt,
                 "mask_used": bool(request.mask_path),
-                "mask_path": str(Path(request.mask_path).absolute()) if request.mask_path else None,
+                "mask_path": mask_abs_path,
                 "processing_time": processing_time,
                 "cost_usd": GEMINI_COST_PER_IMAGE,
                 "original_image_info": image_info,
@@ -242,15 +281,16 @@ async def nanobanana_edit(
                 operation_type="edited",
                 metadata=metadata,
                 prompt=request.edit_prompt,
-                output_format=final_output_format
+                output_format=final_output_format,
+                created_at=completed_at.isoformat()
             )
             
             if not save_result["success"]:
                 logger.error("Failed to save edited image")
-                return create_error_response(
+                return create_error_dict(
                     "Failed to save edited image",
                     "SAVE_ERROR"
-                ).dict()
+                )
             
             # ImageMetadata 객체 생성 (실제 저장된 포맷 사용)
             edited_image_metadata = ImageMetadata(
@@ -270,47 +310,295 @@ async def nanobanana_edit(
                 hash=save_result["metadata"]["hash"]
             )
             
-            logger.info(f"Successfully saved edited image: {save_result['filepath']}")
+            logger.info("Successfully saved edited image: %s", save_result['filepath'])
+            
+            if cache_key:
+                response_cache.set("edit", cache_key, {"edited_image": edited_image_metadata.model_dump(mode="json")})
             
         except Exception as e:
-            logger.error(f"Image processing and saving failed: {e}")
-            return create_error_response(
+            logger.error("Image processing and saving failed: %s", e)
+            return create_error_dict(
                 f"Failed to process edited image: {str(e)}",
                 "PROCESSING_ERROR"
-            ).dict()
+            )
         
         # 6. 응답 생성
         try:
             response = EditImageResponse(
                 success=True,
                 message="Image editing completed successfully",
-                original_image=str(Path(request.image_path).absolute()),
+                original_image=image_abs_path,
                 edited_image=edited_image_metadata,
                 edit_prompt=request.edit_prompt,
                 optimized_prompt=optimized_prompt,
-                processing_time=processing_time
+                processing_time=processing_time,
+                timestamp=completed_at
             )
             
             logger.info(
-                f"Image editing completed successfully in {processing_time:.2f}s. "
-                f"Cost: ${GEMINI_COST_PER_IMAGE:.4f}"
+                "Image editing completed successfully in %.2fs. Cost: $%.4f",
+                processing_time, GEMINI_COST_PER_IMAGE
             )
             
-            return response.dict()
+            return response.model_dump()
             
         except Exception as e:
-            logger.error(f"Response generation failed: {e}")
-            return create_error_response(
+            logger.error("Response generation failed: %s", e)
+            return create_error_dict(
                 "Failed to generate response",
                 "RESPONSE_ERROR"
-            ).dict()
+            )
     
     except Exception as e:
-        logger.error(f"Unexpected error in nanobanana_edit: {e}")
-        return create_error_response(
+        logger.error("Unexpected error in nanobanana_edit: %s", e)
+        return create_error_dict(
             f"Unexpected error: {str(e)}",
             "INTERNAL_ERROR"
-        ).dict()
+        )
+
+
+def _optimize_edit_prompt(request: EditImageRequest) -> str:
+    """
+    편집 프롬프트 최적화 (실패 시 원본 프롬프트 사용)
+    
+    Args:
+        request: 검증된 편집 요청
+        
+    Returns:
+        str: 최적화된 프롬프트
+    """
+    try:
+        optimizer = get_prompt_optimizer()
+        optimized_prompt = optimizer.optimize_prompt(
+            prompt=request.edit_prompt,
+            category=PromptCategory.EDITING,
+            quality_level=request.quality
+        )
+        logger.info("Prompt optimized: '%s' -> '%s'", request.edit_prompt, optimized_prompt)
+        return optimized_prompt
+        
+    except Exception as e:
+        logger.warning("Prompt optimization failed, using original: %s", e)
+        return request.edit_prompt
+
+
+def _decode_bytes_payload(image_handler, payload: bytes) -> Tuple[bytes, Optional[str]]:
+    """이미 바이트인 편집 결과"""
+    return payload, None
+
+
+def _decode_dict_payload(image_handler, payload: Dict[str, Any]) -> Tuple[bytes, Optional[str]]:
+    """dict 형태 편집 결과 (실제 데이터 및 MIME 타입 추출)"""
+    base64_data = payload.get('data') or payload.get('bytes') or payload.get('image_data')
+    if not base64_data:
+        raise ValueError("No valid image data found in edited result")
+    return image_handler.base64_to_bytes(base64_data), payload.get('mime_type')
+
+
+def _decode_str_payload(image_handler, payload: str) -> Tuple[bytes, Optional[str]]:
+    """직접 base64 문자열인 편집 결과"""
+    return image_handler.base64_to_bytes(payload), None
+
+
+# 편집 결과 페이로드 타입 → 디코더
+_PAYLOAD_DECODERS = {
+    bytes: _decode_bytes_payload,
+    dict: _decode_dict_payload,
+    str: _decode_str_payload
+}
+
+
+def _find_payload_decoder(payload: Any):
+    """
+    편집 결과 페이로드에 맞는 디코더 조회
+    
+    Args:
+        payload: API가 반환한 이미지 데이터
+        
+    Returns:
+        Optional[Callable]: 디코더 (지원하지 않는 타입이면 None)
+    """
+    decoder = _PAYLOAD_DECODERS.get(type(payload))
+    if decoder is None:
+        # 하위 클래스 (OrderedDict 등) 대응
+        for payload_type, candidate in _PAYLOAD_DECODERS.items():
+            if isinstance(payload, payload_type):
+                return candidate
+    return decoder
+
+
+def _construct_default_edit_request(image_path: Any, edit_prompt: Any) -> Optional[EditImageRequest]:
+    """
+    기본 옵션 편집 요청을 Pydantic 검증 없이 구성
+    
+    EditImageRequest 검증기와 같은 검사(경로 존재, 프롬프트 길이)를 직접 수행하며,
+    하나라도 만족하지 않으면 None을 반환하여 전체 검증 경로에서 오류 메시지를 만들도록 합니다.
+    
+    Args:
+        image_path: 편집할 이미지 파일 경로
+        edit_prompt: 편집 지시사항
+        
+    Returns:
+        Optional[EditImageRequest]: 구성된 요청 (검사 실패 시 None)
+    """
+    if not isinstance(image_path, str) or not isinstance(edit_prompt, str):
+        return None
+    if not MIN_PROMPT_LENGTH <= len(edit_prompt) <= MAX_PROMPT_LENGTH:
+        return None
+    
+    path = Path(image_path)
+    if not path.exists():
+        return None
+    
+    return EditImageRequest.model_construct(
+        image_path=str(path.absolute()),
+        edit_prompt=edit_prompt,
+        mask_path=None,
+        output_format=ImageFormat.PNG.value,
+        quality=QualityLevel.HIGH.value,
+        optimize_prompt=True
+    )
+
+
+def _read_image_info(
+    image_handler,
+    source: str,
+    data: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    이미지 헤더 검증 및 정보 추출 (스레드 실행용)
+    
+    Args:
+        image_handler: 이미지 핸들러
+        source: 이미지 파일 경로
+        data: 미리 읽어 둔 파일 내용 (있으면 파일을 다시 읽지 않음)
+        
+    Returns:
+        Dict: 이미지 정보
+    """
+    return image_handler.get_image_info_fast(data if data is not None else source)
+
+
+async def _prefetch_source_bytes(paths: List[Optional[str]]) -> Tuple[Dict[str, bytes], set]:
+    """
+    배치 요청의 원본/마스크 파일을 중복 없이 동시에 읽기
+    
+    경로는 요청 모델과 같은 방식(str(Path(p).absolute()))으로 정규화하여 키로 사용하므로
+    상대 경로로 요청해도 검증된 요청의 경로로 조회됩니다.
+    
+    Args:
+        paths: 파일 경로 리스트 (None 허용)
+        
+    Returns:
+        Tuple[Dict[str, bytes], set]: {절대 경로: 파일 내용}과 존재하지 않는 절대 경로 집합
+    """
+    unique_paths = [
+        path for path in dict.fromkeys(str(Path(path).absolute()) for path in paths if path)
+        if Path(path).suffix.lower() in SUPPORTED_INPUT_FORMATS
+    ]
+    contents = await asyncio.gather(
+        *(asyncio.to_thread(Path(path).read_bytes) for path in unique_paths),
+        return_exceptions=True
+    )
+    
+    # 그 외 읽기 실패한 파일은 개별 요청에서 기존 경로로 처리되어 에러가 보고됨
+    preloaded = {}
+    missing = set()
+    for path, data in zip(unique_paths, contents):
+        if isinstance(data, bytes):
+            preloaded[path] = data
+        elif isinstance(data, FileNotFoundError):
+            missing.add(path)
+    
+    return preloaded, missing
+
+
+def _build_edit_cache_key(
+    request: EditImageRequest,
+    optimized_prompt: str,
+    preloaded_bytes: Optional[Dict[str, bytes]] = None
+) -> Optional[str]:
+    """
+    편집 응답 캐시 키 생성 (파일을 읽고 해시하므로 스레드 실행용)
+    
+    Args:
+        request: 검증된 편집 요청
+        optimized_prompt: 최적화된 편집 프롬프트
+        preloaded_bytes: 미리 읽어 둔 파일 내용
+        
+    Returns:
+        Optional[str]: 캐시 키 (원본/마스크 파일을 읽을 수 없으면 None)
+    """
+    preloaded_bytes = preloaded_bytes or {}
+    try:
+        # 미리 읽은 내용은 절대 경로로 저장되어 있음 (요청 모델 경로와 같은 정규화)
+        image_bytes = preloaded_bytes.get(str(Path(request.image_path).absolute()))
+        if image_bytes is None:
+            image_bytes = Path(request.image_path).read_bytes()
+        
+        mask_bytes = None
+        if request.mask_path:
+            mask_bytes = preloaded_bytes.get(str(Path(request.mask_path).absolute()))
+            if mask_bytes is None:
+                mask_bytes = Path(request.mask_path).read_bytes()
+    except OSError as e:
+        logger.debug("Skipping edit response cache: %s", e)
+        return None
+    
+    return ResponseCache.make_key(
+        CACHE_VERSION,
+        GEMINI_MODEL_NAME,
+        image_bytes,
+        optimized_prompt,
+        mask_bytes,
+        request.quality,
+        request.output_format
+    )
+
+
+def _build_cached_edit_response(
+    request: EditImageRequest,
+    image_abs_path: str,
+    optimized_prompt: str,
+    cached: Dict[str, Any],
+    start_time: float
+) -> Optional[Dict[str, Any]]:
+    """
+    캐시된 편집 결과로 응답 생성
+    
+    Args:
+        request: 검증된 편집 요청
+        image_abs_path: 원본 이미지 절대 경로
+        optimized_prompt: 최적화된 편집 프롬프트
+        cached: 캐시된 값
+        start_time: 요청 시작 시각 (time.perf_counter 기준)
+        
+    Returns:
+        Optional[Dict]: MCP 응답 (캐시된 파일이 없으면 None)
+    """
+    try:
+        edited_image_metadata = ImageMetadata(**cached["edited_image"])
+        if not Path(edited_image_metadata.filepath).exists():
+            logger.info("Cached edited image no longer exists: %s", edited_image_metadata.filepath)
+            return None
+        
+        processing_time = time.perf_counter() - start_time
+        response = EditImageResponse(
+            success=True,
+            message="Image editing completed successfully (cached)",
+            original_image=image_abs_path,
+            edited_image=edited_image_metadata,
+            edit_prompt=request.edit_prompt,
+            optimized_prompt=optimized_prompt,
+            processing_time=processing_time
+        )
+        
+        logger.info("Returning cached edit result: %s", edited_image_metadata.filepath)
+        return response.model_dump()
+        
+    except Exception as e:
+        logger.warning("Failed to use cached edit result: %s", e)
+        return None
 
 
 async def batch_edit_images(
@@ -326,45 +614,62 @@ async def batch_edit_images(
         List[Dict]: 편집 결과 리스트
     """
     try:
-        logger.info(f"Starting batch image editing for {len(requests)} requests")
+        logger.info("Starting batch image editing for %s requests", len(requests))
         
         # 동시 실행 제한
         settings = get_settings()
         semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
         
-        async def edit_with_semaphore(request_data: Dict[str, Any]) -> Dict[str, Any]:
-            async with semaphore:
-                return await nanobanana_edit(**request_data)
-        
-        # 모든 요청을 병렬로 실행
-        tasks = [edit_with_semaphore(req) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch edit request {i+1} failed: {result}")
-                error_response = create_error_response(
-                    f"Batch edit request {i+1} failed: {str(result)}",
+        # 원본/마스크 파일을 한 번에 미리 읽어 요청 간에 공유 (존재 여부 사전 점검 겸용)
+        preloaded_bytes, missing_paths = await _prefetch_source_bytes(
+            [path for req in requests for path in (req.get("image_path"), req.get("mask_path"))]
+        )
+        logger.debug("Prefetched %s source files for batch edit", len(preloaded_bytes))
+        
+        processed_results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        pending = []
+        
+        for index, request_data in enumerate(requests):
+            # 존재하지 않는 파일을 참조하는 요청은 편집 태스크 없이 바로 실패 처리
+            missing = [
+                path for path in (request_data.get("image_path"), request_data.get("mask_path"))
+                if path and str(Path(path).absolute()) in missing_paths
+            ]
+            if missing:
+                processed_results[index] = create_error_dict(
+                    f"Failed to load or validate images: Image file not found: {missing[0]}",
+                    "IMAGE_LOAD_ERROR"
+                )
+                continue
+            
+            # 실행 슬롯이 비었을 때만 태스크를 생성하여 동시에 떠 있는 요청 수를 제한
+            await semaphore.acquire()
+            task = asyncio.create_task(nanobanana_edit(**request_data, preloaded_bytes=preloaded_bytes))
+            task.add_done_callback(lambda _: semaphore.release())
+            pending.append((index, task))
+        
+        # 결과 수집 (예외 처리)
+        for index, task in pending:
+            try:
+                processed_results[index] = await task
+            except Exception as e:
+                logger.error("Batch edit request %s failed: %s", index+1, e)
+                processed_results[index] = create_error_dict(
+                    f"Batch edit request {index+1} failed: {str(e)}",
                     "BATCH_ERROR"
                 )
-                processed_results.append(error_response.dict())
-            else:
-                processed_results.append(result)
         
         successful_count = sum(1 for r in processed_results if r.get("success", False))
-        logger.info(f"Batch editing completed: {successful_count}/{len(requests)} successful")
+        logger.info("Batch editing completed: %s/%s successful", successful_count, len(requests))
         
         return processed_results
         
     except Exception as e:
-        logger.error(f"Batch editing failed: {e}")
-        error_response = create_error_response(
+        logger.error("Batch editing failed: %s", e)
+        return [create_error_dict(
             f"Batch editing failed: {str(e)}",
             "BATCH_PROCESSING_ERROR"
-        )
-        return [error_response.dict()]
+        )]
 
 
 def validate_edit_request(data: Dict[str, Any]) -> EditImageRequest:
@@ -381,9 +686,9 @@ def validate_edit_request(data: Dict[str, Any]) -> EditImageRequest:
         ValueError: 검증 실패 시
     """
     try:
-        return EditImageRequest(**data)
+        return _EDIT_REQUEST_VALIDATOR.validate_python(data)
     except Exception as e:
-        logger.error(f"Edit request validation failed: {e}")
+        logger.error("Edit request validation failed: %s", e)
         raise ValueError(f"Invalid edit request data: {str(e)}")
 
 
@@ -406,45 +711,50 @@ def get_edit_statistics() -> Dict[str, Any]:
         # 편집 횟수 통계
         total_edits = len(edited_images)
         
-        # 최근 편집 (지난 24시간)
-        from datetime import datetime, timedelta
-        recent_cutoff = datetime.now() - timedelta(hours=24)
-        recent_edits = [
-            img for img in edited_images
-            if datetime.fromisoformat(img.get("created_at", "1970-01-01")) > recent_cutoff
-        ]
+        # 최근 편집 (지난 24시간), 프롬프트 길이, 파일 형식을 한 번의 순회로 집계
+        # created_at은 ISO-8601 문자열이므로 파싱 없이 문자열 비교로 기준 시각과 비교
+        recent_cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
+        
+        recent_count = 0
+        prompt_length_sum = 0
+        prompt_count = 0
+        format_stats = Counter()
+        for img in edited_images:
+            if img.get("created_at", "") > recent_cutoff:
+                recent_count += 1
+            
+            prompt = img.get("prompt")
+            if prompt:
+                prompt_length_sum += len(prompt)
+                prompt_count += 1
+            
+            format_stats[img.get("format", "unknown")] += 1
         
         # 비용 계산
         total_cost = total_edits * GEMINI_COST_PER_IMAGE
-        recent_cost = len(recent_edits) * GEMINI_COST_PER_IMAGE
+        recent_cost = recent_count * GEMINI_COST_PER_IMAGE
         
         # 사용된 프롬프트 분석
-        prompt_lengths = [len(img.get("prompt", "")) for img in edited_images if img.get("prompt")]
-        avg_prompt_length = sum(prompt_lengths) / len(prompt_lengths) if prompt_lengths else 0
-        
-        # 파일 형식 통계
-        format_stats = {}
-        for img in edited_images:
-            fmt = img.get("format", "unknown")
-            format_stats[fmt] = format_stats.get(fmt, 0) + 1
+        avg_prompt_length = prompt_length_sum / prompt_count if prompt_count else 0
         
         return {
             "total_edits": total_edits,
-            "recent_edits_24h": len(recent_edits),
+            "recent_edits_24h": recent_count,
             "total_cost_usd": round(total_cost, 4),
             "recent_cost_usd": round(recent_cost, 4),
             "cost_per_edit": GEMINI_COST_PER_IMAGE,
             "average_prompt_length": round(avg_prompt_length, 1),
-            "format_distribution": format_stats,
+            "format_distribution": dict(format_stats),
             "model_info": {
                 "name": GEMINI_MODEL_NAME,
                 "provider": "Google"
             },
-            "storage_info": file_manager.get_storage_stats().get("output_stats", {})
+            "storage_info": file_manager.get_storage_stats().get("output_stats", {}),
+            "prompt_cache": get_prompt_optimizer().get_cache_stats()
         }
         
     except Exception as e:
-        logger.error(f"Failed to get edit statistics: {e}")
+        logger.error("Failed to get edit statistics: %s", e)
         return {"error": str(e)}
 
 
@@ -460,7 +770,6 @@ def analyze_edit_chain(image_path: str) -> Dict[str, Any]:
     """
     try:
         file_manager = get_file_manager()
-        all_edits = file_manager.get_image_history(operation_type="edited")
         
         # 해당 이미지를 원본으로 사용한 편집들 찾기
         image_path = str(Path(image_path).absolute())
@@ -469,27 +778,24 @@ def analyze_edit_chain(image_path: str) -> Dict[str, Any]:
         current_path = image_path
         
         while True:
-            # current_path를 원본으로 사용한 편집 찾기
-            next_edits = [
-                edit for edit in all_edits
-                if edit.get("original_image") == current_path
-            ]
+            # current_path를 원본으로 사용한 편집 찾기 (편집 그래프 조회)
+            next_edits = file_manager.get_children(current_path)
             
             if not next_edits:
                 break
                 
             # 가장 최근 편집 선택 (여러 개 있을 수 있음)
-            next_edit = sorted(next_edits, key=lambda x: x.get("created_at", ""))[-1]
+            next_edit = max(next_edits, key=lambda x: x.get("created_at") or "")
             chain.append({
                 "step": len(chain) + 1,
-                "original": next_edit.get("original_image"),
-                "edited": next_edit.get("filepath"),
+                "original": next_edit.get("parent"),
+                "edited": next_edit.get("child"),
                 "prompt": next_edit.get("prompt"),
                 "created_at": next_edit.get("created_at")
             })
             
             # 다음 단계를 위해 경로 업데이트
-            current_path = next_edit.get("filepath")
+            current_path = next_edit.get("child")
             
             # 무한 루프 방지
             if len(chain) > 20:
@@ -504,7 +810,7 @@ def analyze_edit_chain(image_path: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Failed to analyze edit chain: {e}")
+        logger.error("Failed to analyze edit chain: %s", e)
         return {"error": str(e)}
 
 
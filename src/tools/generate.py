@@ -7,20 +7,23 @@ Gemini 2.5 Flash Image API를 사용하여 텍스트 프롬프트로부터 이
 import asyncio
 import logging
 import time
+from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..gemini_client import get_gemini_client, create_gemini_client, GeminiAPIError
 from ..utils.prompt_optimizer import get_prompt_optimizer, PromptCategory
 from ..utils.image_handler import get_image_handler
-from ..utils.file_manager import get_file_manager
+from ..utils.file_manager import get_file_manager, CONTENT_HASH_ALGO
+from ..utils.response_cache import get_response_cache, ResponseCache
 from ..models.schemas import (
     GenerateImageRequest,
     GenerateImageResponse,
     ImageMetadata,
-    create_error_response,
+    create_error_dict,
     OperationType
 )
-from ..constants import GEMINI_MODEL_NAME, GEMINI_COST_PER_IMAGE
+from ..constants import CACHE_VERSION, GEMINI_MODEL_NAME, GEMINI_COST_PER_IMAGE, MIME_TO_FORMAT
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -79,10 +82,10 @@ async def nanobanana_generate(
             
         except Exception as e:
             logger.error(f"Request validation failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 f"Invalid request parameters: {str(e)}",
                 "VALIDATION_ERROR"
-            ).dict()
+            )
         
         # 2. 프롬프트 최적화
         optimized_prompt = request.prompt
@@ -103,279 +106,156 @@ async def nanobanana_generate(
                 logger.warning(f"Prompt optimization failed, using original: {e}")
                 optimized_prompt = request.prompt
         
-        # 3. Gemini API를 통한 이미지 생성
+        # 2-1. 응답 캐시 조회 (동일한 프롬프트 + 파라미터 조합은 API 재호출 생략)
+        response_cache = get_response_cache()
+        cache_key = _build_generate_cache_key(request, optimized_prompt) if not kwargs else None
+        if cache_key:
+            cached = response_cache.get("generate", cache_key)
+            if cached:
+                cached_response = _build_cached_generate_response(
+                    request, optimized_prompt, cached, start_time
+                )
+                if cached_response is not None:
+                    return cached_response
+                response_cache.invalidate("generate", cache_key)
+        
+        # 3. Gemini API 스트리밍 호출 (후보가 도착하는 즉시 처리/저장 시작)
+        image_handler = get_image_handler()
+        file_manager = get_file_manager()
+        received_images = []
+        tasks = []
+        api_error = None
+        stream_started = False
         try:
-            gemini_client = get_gemini_client()
-            logger.info(f"DEBUG: gemini_client type: {type(gemini_client)}, is None: {gemini_client is None}")
+            # 전역 클라이언트 재사용 (최초 호출 시에만 잠금 하에 한 번 생성)
+            gemini_client = get_gemini_client() or await create_gemini_client()
             
-            # MCP 호출 시 클라이언트가 None인 경우 새로 생성
-            if gemini_client is None:
-                logger.info("Creating new Gemini client for MCP call")
-                gemini_client = await create_gemini_client()
-            
-            logger.info(f"DEBUG: final gemini_client type: {type(gemini_client)}, has generate_image: {hasattr(gemini_client, 'generate_image')}")
-            
-            # API 호출
-            api_result = await gemini_client.generate_image(
+            # 앞선 후보의 디코딩/저장을 스레드에서 진행하는 동안 다음 후보를 수신
+            stream_started = True
+            async for i, image_data in gemini_client.generate_image_stream(
                 prompt=optimized_prompt,
                 aspect_ratio=request.aspect_ratio,
                 quality=request.quality,
                 candidate_count=request.candidate_count,
                 **kwargs
-            )
-            
-            # API 응답 검증
-            if not api_result.get("success", False):
-                logger.error(f"Gemini API returned unsuccessful result: {api_result}")
-                return create_error_response(
-                    f"API request unsuccessful: {api_result.get('error', 'Unknown error')}",
-                    "API_ERROR"
-                ).dict()
+            ):
+                received_images.append(image_data)
+                tasks.append(asyncio.create_task(asyncio.to_thread(
+                    _process_generated_image,
+                    i, request.candidate_count, image_data, request, optimized_prompt,
+                    start_time, image_handler, file_manager
+                )))
             
-            if not api_result.get("images"):
+            if not received_images:
                 logger.error("Gemini API returned no images")
-                return create_error_response(
+                return create_error_dict(
                     "No images returned from API",
                     "NO_IMAGES_ERROR"
-                ).dict()
-            
-            logger.info(f"Generated {len(api_result.get('images', []))} image(s) from Gemini API")
+                )
             
+            logger.info(f"Generated {len(received_images)} image(s) from Gemini API")
+        
         except GeminiAPIError as e:
             logger.error(f"Gemini API error: {e}")
             # 상세 에러 정보 로깅
             if hasattr(e, 'details') and e.details:
                 logger.error(f"API error details: {e.details}")
-            return create_error_response(
-                f"Image generation failed: {e.message}",
-                e.code or "API_ERROR"
-            ).dict()
+            if e.code == "NO_IMAGES_ERROR":
+                api_error = create_error_dict(
+                    "No images returned from API",
+                    "NO_IMAGES_ERROR"
+                )
+            elif stream_started and not e.code:
+                # 스트림 수신 중 실패 (API 요청 자체가 실패한 경우)
+                api_error = create_error_dict(
+                    f"API request unsuccessful: {e.message}",
+                    "API_ERROR"
+                )
+            else:
+                api_error = create_error_dict(
+                    f"Image generation failed: {e.message}",
+                    e.code or "API_ERROR"
+                )
         
         except Exception as e:
             logger.error(f"Unexpected error during image generation: {e}")
             # 디버그 정보 추가
-            import traceback
-            logger.debug(f"Full traceback: {traceback.format_exc()}")
-            return create_error_response(
-                f"Image generation failed: {str(e)}",
-                "GENERATION_ERROR"
-            ).dict()
-        
-        # 4. 생성된 이미지들 처리 및 저장
+            logger.debug("Full traceback:", exc_info=True)
+            if stream_started:
+                api_error = create_error_dict(
+                    f"API request unsuccessful: {str(e)}",
+                    "API_ERROR"
+                )
+            else:
+                api_error = create_error_dict(
+                    f"Image generation failed: {str(e)}",
+                    "GENERATION_ERROR"
+                )
+        
+        if api_error is not None:
+            if not tasks:
+                return api_error
+            # 스트림이 중간에 끊긴 경우 이미 받은 후보는 저장을 마치고 부분 결과로 반환
+            logger.warning(f"Gemini stream interrupted after {len(tasks)} image(s); returning partial results")
+        
+        # 4. 후보별 처리/저장 결과 수집
         try:
-            image_handler = get_image_handler()
-            file_manager = get_file_manager()
             processed_images = []
             
-            for i, image_data in enumerate(api_result.get("images", [])):
-                logger.debug(f"Processing image {i+1}/{len(api_result['images'])}")
-                
-                # MIME 타입 추출 (파일 포맷 감지용)
-                actual_mime_type = None
-                
-                # 이미지 데이터가 bytes가 아닌 경우 변환
-                if not isinstance(image_data, bytes):
-                    # dict 형태인 경우 실제 데이터 추출
-                    if isinstance(image_data, dict):
-                        # Gemini API 응답에서 base64 데이터 및 MIME 타입 추출
-                        base64_data = image_data.get('data') or image_data.get('bytes') or image_data.get('image_data')
-                        actual_mime_type = image_data.get('mime_type')  # 실제 포맷 정보 추출
-                        
-                        if base64_data:
-                            # Base64 문자열인지 확인
-                            if isinstance(base64_data, str) and image_handler.is_base64_string(base64_data):
-                                logger.debug(f"Converting base64 string to bytes for image {i+1}")
-                                image_data = image_handler.base64_to_bytes(base64_data)
-                            else:
-                                logger.warning(f"Base64 data validation failed for image {i+1}")
-                                image_data = image_handler.base64_to_bytes(base64_data)  # 시도해봄
-                        else:
-                            logger.error(f"No valid image data found in dict for image {i+1}: {list(image_data.keys())}")
-                            continue
-                    elif isinstance(image_data, str):
-                        # 직접 base64 문자열인 경우 - 검증 후 변환
-                        if image_handler.is_base64_string(image_data):
-                            logger.debug(f"Converting base64 string to bytes for image {i+1}")
-                            image_data = image_handler.base64_to_bytes(image_data)
-                        else:
-                            logger.warning(f"String data doesn't appear to be valid base64 for image {i+1}")
-                            # 그래도 시도해봄
-                            try:
-                                image_data = image_handler.base64_to_bytes(image_data)
-                            except Exception as decode_error:
-                                logger.error(f"Failed to decode string data for image {i+1}: {decode_error}")
-                                continue
-                    else:
-                        logger.error(f"Invalid image data format for image {i+1}: {type(image_data)}")
-                        continue
-                
-                # 변환된 바이너리 데이터 검증
-                validation_result = image_handler.validate_image_data(image_data)
-                if not validation_result.get('is_valid', False):
-                    logger.error(f"Image {i+1} validation failed: {validation_result}")
-                    # 검증 실패해도 계속 진행 (일부 뷰어에서만 문제일 수 있음)
-                    logger.warning(f"Proceeding with potentially invalid image {i+1}")
-                else:
-                    logger.debug(f"Image {i+1} validation passed: {validation_result.get('detected_format')}")
-                
-                # MIME 타입이 없는 경우 검증 결과에서 가져오기
-                if not actual_mime_type and validation_result.get('detected_format'):
-                    detected_format = validation_result['detected_format']
-                    actual_mime_type = f"image/{detected_format}"
-                    logger.info(f"MIME type inferred from image signature for image {i+1}: {actual_mime_type}")
-                
-                # 실제 파일 포맷 결정 (MIME 타입 우선, 사용자 요청 포맷 대체)
-                if actual_mime_type:
-                    # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpeg → jpeg)
-                    actual_format = actual_mime_type.split('/')[-1].lower().replace('jpg', 'jpeg')
-                    
-                    # 사용자 요청 포맷과 다른 경우 로깅
-                    if actual_format != request.output_format:
-                        logger.info(f"Format adjusted for image {i+1}: requested '{request.output_format}' → actual '{actual_format}' (API returned {actual_mime_type})")
-                    
-                    final_output_format = actual_format
-                else:
-                    # MIME 타입이 없으면 사용자 요청 포맷 사용
-                    final_output_format = request.output_format
-                    logger.debug(f"Using requested format '{request.output_format}' for image {i+1} (no MIME type from API)")
-                
-                # 메타데이터 준비
-                from datetime import datetime
-                metadata = {
-                    "model_used": GEMINI_MODEL_NAME,
-                    "original_prompt": request.prompt,
-                    "optimized_prompt": optimized_prompt,
-                    "aspect_ratio": request.aspect_ratio,
-                    "style": request.style,
-                    "quality": request.quality,
-                    "generation_time": time.time() - start_time,
-                    "cost_usd": GEMINI_COST_PER_IMAGE,
-                    "request_id": api_result.get("metadata", {}).get("request_id"),
-                    "created_at": datetime.now().isoformat()
-                }
-                
-                # Pillow를 통한 재처리 및 저장 (호환성 개선)
-                try:
-                    # 방법 1: Pillow로 재처리하여 메타데이터 정리 및 호환성 개선
-                    processed_path = image_handler.save_bytes_as_image(
-                        image_bytes=image_data,
-                        output_path=file_manager.output_dir / "generated" / file_manager.generate_filename(
-                            operation_type="generated",
-                            prompt=request.prompt,
-                            extension=final_output_format
-                        ),
-                        format=final_output_format,
-                        quality=request.quality,
-                        process_with_pillow=True  # 호환성을 위해 Pillow 재처리 사용
-                    )
-                    
-                    # 메타데이터와 함께 저장 결과 구성
-                    save_result = {
-                        "success": True,
-                        "filepath": str(processed_path),
-                        "filename": processed_path.name,
-                        "metadata": {
-                            **metadata,
-                            "processed_with_pillow": True,
-                            "file_size": processed_path.stat().st_size if processed_path.exists() else len(image_data),
-                            "created_at": metadata.get("created_at"),
-                            "filename": processed_path.name,
-                            "filepath": str(processed_path)
-                        }
-                    }
-                    
-                    logger.info(f"Image {i+1} processed with Pillow for better compatibility: {processed_path}")
-                    
-                except Exception as pillow_error:
-                    logger.warning(f"Pillow processing failed for image {i+1}: {pillow_error}")
-                    logger.info(f"Falling back to direct binary save for image {i+1}")
-                    
-                    # 방법 2: 직접 바이너리 저장 (폴백)
-                    save_result = file_manager.save_image_with_metadata(
-                        image_data=image_data,
-                        operation_type="generated",
-                        metadata=metadata,
-                        prompt=request.prompt,
-                        output_format=final_output_format
-                    )
-                
-                if save_result["success"]:
-                    # ImageMetadata 객체 생성 (실제 저장된 포맷 사용)
-                    from datetime import datetime
-                    
-                    # created_at이 문자열이면 datetime 객체로 변환
-                    created_at_value = save_result["metadata"]["created_at"]
-                    if isinstance(created_at_value, str):
-                        try:
-                            created_at_value = datetime.fromisoformat(created_at_value.replace('Z', '+00:00'))
-                        except:
-                            created_at_value = datetime.now()
-                    elif not isinstance(created_at_value, datetime):
-                        created_at_value = datetime.now()
-                    
-                    image_metadata = ImageMetadata(
-                        filename=save_result["filename"],
-                        filepath=save_result["filepath"],
-                        operation_type=OperationType.GENERATION,
-                        created_at=created_at_value,
-                        file_size=save_result["metadata"]["file_size"],
-                        format=final_output_format,  # 실제 저장된 포맷
-                        width=None,  # 실제 이미지에서 추출하면 더 좋음
-                        height=None,
-                        prompt=request.prompt,
-                        optimized_prompt=optimized_prompt,
-                        model_used=GEMINI_MODEL_NAME,
-                        generation_time=metadata["generation_time"],
-                        cost_usd=GEMINI_COST_PER_IMAGE,
-                        hash=save_result["metadata"].get("hash", "")
-                    )
-                    
-                    processed_images.append(image_metadata)
-                    logger.info(f"Successfully saved image {i+1}: {save_result['filepath']}")
-                else:
-                    logger.error(f"Failed to save image {i+1}")
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logger.error(f"Processing failed for image {i+1}: {result}")
+                elif result is not None:
+                    processed_images.append(result)
             
             if not processed_images:
                 logger.error("No images were successfully processed and saved")
                 # 디버그 정보 추가
-                logger.error(f"API returned {len(api_result.get('images', []))} images")
-                logger.error(f"Processing attempted on {len(api_result.get('images', []))} images")
+                logger.error(f"API returned {len(received_images)} images")
+                logger.error(f"Processing attempted on {len(tasks)} images")
                 
-                # 진단 정보 추가
-                from ..utils.debug_tools import validate_base64_string
-                for i, img_data in enumerate(api_result.get('images', [])):
-                    if isinstance(img_data, str):
-                        validation = validate_base64_string(img_data)
-                        logger.error(f"Image {i+1} base64 validation: {validation}")
-                    elif isinstance(img_data, dict):
-                        base64_data = img_data.get('data', '')
-                        if isinstance(base64_data, str):
-                            validation = validate_base64_string(base64_data)
-                            logger.error(f"Image {i+1} base64 validation: {validation}")
+                # 진단 정보 추가 (페이로드 전체를 다시 검사하므로 디버그 로깅 시에만 수행)
+                if logger.isEnabledFor(logging.DEBUG):
+                    from ..utils.debug_tools import validate_base64_string
+                    for i, img_data in enumerate(received_images):
+                        if isinstance(img_data, str):
+                            logger.debug("Image %s base64 validation: %s", i+1, validate_base64_string(img_data))
+                        elif isinstance(img_data, dict):
+                            base64_data = img_data.get('data', '')
+                            if isinstance(base64_data, str):
+                                logger.debug("Image %s base64 validation: %s", i+1, validate_base64_string(base64_data))
                 
-                return create_error_response(
+                return create_error_dict(
                     "Failed to save generated images - see logs for details",
                     "SAVE_ERROR"
-                ).dict()
+                )
             
+            # 요청한 이미지가 모두 저장된 경우에만 캐싱 (부분 결과 재사용 방지)
+            if cache_key and len(processed_images) == request.candidate_count:
+                response_cache.set("generate", cache_key, {
+                    "images": [image.model_dump(mode="json") for image in processed_images]
+                })
+        
         except Exception as e:
             logger.error(f"Image processing and saving failed: {e}")
             # 상세 디버그 정보
-            import traceback
-            logger.debug(f"Processing error traceback: {traceback.format_exc()}")
-            logger.error(f"API result structure: {type(api_result)} - {list(api_result.keys()) if isinstance(api_result, dict) else 'Not a dict'}")
+            logger.debug("Processing error traceback:", exc_info=True)
+            logger.error(f"Received {len(received_images)} image(s) from API stream")
             
-            return create_error_response(
+            return create_error_dict(
                 f"Failed to process generated images: {str(e)}",
                 "PROCESSING_ERROR"
-            ).dict()
+            )
         
         # 5. 응답 생성
         total_time = time.time() - start_time
         total_cost = len(processed_images) * GEMINI_COST_PER_IMAGE
         
         try:
-            response = GenerateImageResponse(
+            # 내부에서 검증된 값만 사용하므로 응답 모델은 재검증 없이 구성
+            response = GenerateImageResponse.model_construct(
                 success=True,
                 message=f"Successfully generated {len(processed_images)} image(s)",
                 images=processed_images,
@@ -396,21 +276,297 @@ async def nanobanana_generate(
                 f"Cost: ${total_cost:.4f}"
             )
             
-            return response.dict()
+            return response.model_dump()
             
         except Exception as e:
             logger.error(f"Response generation failed: {e}")
-            return create_error_response(
+            return create_error_dict(
                 "Failed to generate response",
                 "RESPONSE_ERROR"
-            ).dict()
+            )
     
     except Exception as e:
         logger.error(f"Unexpected error in nanobanana_generate: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Unexpected error: {str(e)}",
             "INTERNAL_ERROR"
-        ).dict()
+        )
+
+
+def _process_generated_image(
+    i: int,
+    total: int,
+    image_data: Any,
+    request: GenerateImageRequest,
+    optimized_prompt: str,
+    start_time: float,
+    image_handler,
+    file_manager
+) -> Optional[ImageMetadata]:
+    """
+    생성된 이미지 한 장을 디코딩/검증/저장 (스레드 실행용)
+    
+    Args:
+        i: 이미지 인덱스
+        total: 전체 이미지 수
+        image_data: API가 반환한 이미지 데이터 (bytes, dict, base64 문자열)
+        request: 검증된 생성 요청
+        optimized_prompt: 최적화된 프롬프트
+        start_time: 요청 시작 시각
+        image_handler: 이미지 핸들러
+        file_manager: 파일 매니저
+        
+    Returns:
+        Optional[ImageMetadata]: 저장된 이미지 메타데이터 (실패 시 None)
+    """
+    logger.debug("Processing image %s/%s", i+1, total)
+    
+    # API 요청 ID (스트림 응답에서 전달된 경우)
+    request_id = image_data.get('request_id') if isinstance(image_data, dict) else None
+    
+    # MIME 타입 추출 (파일 포맷 감지용)
+    actual_mime_type = None
+    
+    # 이미지 데이터가 bytes가 아닌 경우 변환
+    if not isinstance(image_data, bytes):
+        # dict 형태인 경우 실제 데이터 추출
+        if isinstance(image_data, dict):
+            # Gemini API 응답에서 base64 데이터 및 MIME 타입 추출
+            base64_data = image_data.get('data') or image_data.get('bytes') or image_data.get('image_data')
+            actual_mime_type = image_data.get('mime_type')  # 실제 포맷 정보 추출
+            
+            if base64_data:
+                # 이미 디코딩된 바이너리 데이터인 경우 그대로 사용
+                if isinstance(base64_data, (bytes, bytearray)):
+                    image_data = bytes(base64_data)
+                else:
+                    # 사전 검사 없이 검증 디코딩 한 번으로 base64 여부 확인과 변환을 함께 수행
+                    logger.debug("Converting base64 string to bytes for image %s", i+1)
+                    try:
+                        image_data = image_handler.base64_to_bytes(base64_data, validate=True)
+                    except Exception as decode_error:
+                        logger.error(f"Failed to decode base64 data for image {i+1}: {decode_error}")
+                        return None
+            else:
+                logger.error(f"No valid image data found in dict for image {i+1}: {list(image_data.keys())}")
+                return None
+        elif isinstance(image_data, str):
+            # 직접 base64 문자열인 경우 - 검증 디코딩 한 번으로 변환
+            logger.debug("Converting base64 string to bytes for image %s", i+1)
+            try:
+                image_data = image_handler.base64_to_bytes(image_data, validate=True)
+            except Exception as decode_error:
+                logger.error(f"Failed to decode string data for image {i+1}: {decode_error}")
+                return None
+        else:
+            logger.error(f"Invalid image data format for image {i+1}: {type(image_data)}")
+            return None
+    
+    # 변환된 바이너리 데이터 검증
+    validation_result = image_handler.validate_image_data(image_data)
+    if not validation_result.get('is_valid', False):
+        logger.error(f"Image {i+1} validation failed: {validation_result}")
+        # 검증 실패해도 계속 진행 (일부 뷰어에서만 문제일 수 있음)
+        logger.warning(f"Proceeding with potentially invalid image {i+1}")
+    else:
+        logger.debug("Image %s validation passed: %s", i+1, validation_result.get('detected_format'))
+    
+    # MIME 타입이 없는 경우 검증 결과에서 가져오기
+    if not actual_mime_type and validation_result.get('detected_format'):
+        detected_format = validation_result['detected_format']
+        actual_mime_type = f"image/{detected_format}"
+        logger.info(f"MIME type inferred from image signature for image {i+1}: {actual_mime_type}")
+    
+    # 실제 파일 포맷 결정 (MIME 타입 우선, 사용자 요청 포맷 대체)
+    if actual_mime_type:
+        # MIME 타입에서 확장자 추출 (image/webp → webp, image/jpg → jpeg, 미등록 타입은 서브타입 사용)
+        actual_format = MIME_TO_FORMAT.get(actual_mime_type.lower()) or actual_mime_type.rsplit('/', 1)[-1].lower()
+        
+        # 사용자 요청 포맷과 다른 경우 로깅
+        if actual_format != request.output_format:
+            logger.info(f"Format adjusted for image {i+1}: requested '{request.output_format}' → actual '{actual_format}' (API returned {actual_mime_type})")
+        
+        final_output_format = actual_format
+    else:
+        # MIME 타입이 없으면 사용자 요청 포맷 사용
+        final_output_format = request.output_format
+        logger.debug("Using requested format '%s' for image %s (no MIME type from API)", request.output_format, i+1)
+    
+    # 메타데이터 준비
+    metadata = {
+        "model_used": GEMINI_MODEL_NAME,
+        "original_prompt": request.prompt,
+        "optimized_prompt": optimized_prompt,
+        "aspect_ratio": request.aspect_ratio,
+        "style": request.style,
+        "quality": request.quality,
+        "generation_time": time.time() - start_time,
+        "cost_usd": GEMINI_COST_PER_IMAGE,
+        "request_id": request_id,
+        "created_at": datetime.now().isoformat()
+    }
+    
+    # 여러 후보가 같은 초에 저장되어도 파일명이 겹치지 않도록 후보 번호 부여
+    filename_suffix = str(i + 1) if total > 1 else None
+    
+    # Pillow를 통한 재처리 및 저장 (호환성 개선)
+    try:
+        # 방법 1: Pillow로 재처리하여 메타데이터 정리 및 호환성 개선
+        processed_path, content_hash, file_size = image_handler.save_bytes_as_image(
+            image_bytes=image_data,
+            output_path=file_manager.output_dir / "generated" / file_manager.generate_filename(
+                operation_type="generated",
+                prompt=request.prompt,
+                extension=final_output_format,
+                suffix=filename_suffix
+            ),
+            format=final_output_format,
+            quality=request.quality,
+            process_with_pillow=True,  # 호환성을 위해 Pillow 재처리 사용
+            return_hash=True  # 인코딩 버퍼에서 해시와 크기를 구하여 파일 재읽기/stat 방지
+        )
+        
+        # 메타데이터와 함께 저장 결과 구성
+        save_result = {
+            "success": True,
+            "filepath": str(processed_path),
+            "filename": processed_path.name,
+            "metadata": {
+                **metadata,
+                "processed_with_pillow": True,
+                "file_size": file_size,
+                "hash": content_hash,
+                "hash_algo": CONTENT_HASH_ALGO,
+                "created_at": metadata.get("created_at"),
+                "filename": processed_path.name,
+                "filepath": str(processed_path)
+            }
+        }
+        
+        logger.info(f"Image {i+1} processed with Pillow for better compatibility: {processed_path}")
+        
+    except Exception as pillow_error:
+        logger.warning(f"Pillow processing failed for image {i+1}: {pillow_error}")
+        logger.info(f"Falling back to direct binary save for image {i+1}")
+        
+        # 방법 2: 직접 바이너리 저장 (폴백)
+        save_result = file_manager.save_image_with_metadata(
+            image_data=image_data,
+            operation_type="generated",
+            metadata=metadata,
+            prompt=request.prompt,
+            output_format=final_output_format,
+            filename_suffix=filename_suffix
+        )
+    
+    if save_result["success"]:
+        # ImageMetadata 객체 생성 (실제 저장된 포맷 사용)
+        # created_at이 문자열이면 datetime 객체로 변환
+        created_at_value = save_result["metadata"]["created_at"]
+        if isinstance(created_at_value, str):
+            try:
+                created_at_value = datetime.fromisoformat(created_at_value.replace('Z', '+00:00'))
+            except:
+                created_at_value = datetime.now()
+        elif not isinstance(created_at_value, datetime):
+            created_at_value = datetime.now()
+        
+        image_metadata = ImageMetadata(
+            filename=save_result["filename"],
+            filepath=save_result["filepath"],
+            operation_type=OperationType.GENERATION,
+            created_at=created_at_value,
+            file_size=save_result["metadata"]["file_size"],
+            format=final_output_format,  # 실제 저장된 포맷
+            width=None,  # 실제 이미지에서 추출하면 더 좋음
+            height=None,
+            prompt=request.prompt,
+            optimized_prompt=optimized_prompt,
+            model_used=GEMINI_MODEL_NAME,
+            generation_time=metadata["generation_time"],
+            cost_usd=GEMINI_COST_PER_IMAGE,
+            hash=save_result["metadata"].get("hash", "")
+        )
+        
+        logger.info(f"Successfully saved image {i+1}: {save_result['filepath']}")
+        return image_metadata
+    
+    logger.error(f"Failed to save image {i+1}")
+    return None
+
+
+def _build_generate_cache_key(request: GenerateImageRequest, optimized_prompt: str) -> str:
+    """
+    생성 응답 캐시 키 생성
+    
+    Args:
+        request: 검증된 생성 요청
+        optimized_prompt: 최적화된 프롬프트
+        
+    Returns:
+        str: 캐시 키
+    """
+    return ResponseCache.make_key(
+        CACHE_VERSION,
+        GEMINI_MODEL_NAME,
+        request.prompt,
+        optimized_prompt,
+        request.aspect_ratio,
+        request.style,
+        request.quality,
+        request.output_format,
+        str(request.candidate_count),
+        "\x1f".join(sorted(request.additional_keywords or []))
+    )
+
+
+def _build_cached_generate_response(
+    request: GenerateImageRequest,
+    optimized_prompt: str,
+    cached: Dict[str, Any],
+    start_time: float
+) -> Optional[Dict[str, Any]]:
+    """
+    캐시된 생성 결과로 응답 생성
+    
+    Args:
+        request: 검증된 생성 요청
+        optimized_prompt: 최적화된 프롬프트
+        cached: 캐시된 값
+        start_time: 요청 시작 시각
+        
+    Returns:
+        Optional[Dict]: MCP 응답 (캐시된 파일 중 하나라도 없으면 None)
+    """
+    try:
+        images = [ImageMetadata(**image) for image in cached["images"]]
+        for image in images:
+            if not Path(image.filepath).exists():
+                logger.info(f"Cached generated image no longer exists: {image.filepath}")
+                return None
+        
+        # 캐시 적중 시 API 비용이 발생하지 않음 (이미지 메타데이터는 위에서 검증됨)
+        response = GenerateImageResponse.model_construct(
+            success=True,
+            message=f"Successfully generated {len(images)} image(s) (cached)",
+            images=images,
+            original_prompt=request.prompt,
+            optimized_prompt=optimized_prompt,
+            generation_time=time.time() - start_time,
+            total_cost=0.0,
+            model_info={
+                "model_name": GEMINI_MODEL_NAME,
+                "version": "2.5-flash-image-preview",
+                "provider": "Google"
+            }
+        )
+        
+        logger.info(f"Returning cached generation result: {len(images)} image(s)")
+        return response.model_dump()
+        
+    except Exception as e:
+        logger.warning(f"Failed to use cached generation result: {e}")
+        return None
 
 
 async def batch_generate_images(
@@ -428,30 +584,32 @@ async def batch_generate_images(
     try:
         logger.info(f"Starting batch image generation for {len(requests)} requests")
         
-        # 동시 실행 제한
+        # 동시 실행 제한: 고정 개수의 워커가 큐에서 요청을 꺼내 처리
         settings = get_settings()
-        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
-        
-        async def generate_with_semaphore(request_data: Dict[str, Any]) -> Dict[str, Any]:
-            async with semaphore:
-                return await nanobanana_generate(**request_data)
-        
-        # 모든 요청을 병렬로 실행
-        tasks = [generate_with_semaphore(req) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 예외 처리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch request {i+1} failed: {result}")
-                error_response = create_error_response(
-                    f"Batch request {i+1} failed: {str(result)}",
-                    "BATCH_ERROR"
-                )
-                processed_results.append(error_response.dict())
-            else:
-                processed_results.append(result)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, request_data in enumerate(requests):
+            queue.put_nowait((index, request_data))
+        
+        processed_results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    index, request_data = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                try:
+                    processed_results[index] = await nanobanana_generate(**request_data)
+                except Exception as e:
+                    logger.error(f"Batch request {index+1} failed: {e}")
+                    processed_results[index] = create_error_dict(
+                        f"Batch request {index+1} failed: {str(e)}",
+                        "BATCH_ERROR"
+                    )
+        
+        worker_count = max(1, min(settings.max_concurrent_requests, len(requests)))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
         
         successful_count = sum(1 for r in processed_results if r.get("success", False))
         logger.info(f"Batch generation completed: {successful_count}/{len(requests)} successful")
@@ -460,11 +618,10 @@ async def batch_generate_images(
         
     except Exception as e:
         logger.error(f"Batch generation failed: {e}")
-        error_response = create_error_response(
+        return [create_error_dict(
             f"Batch generation failed: {str(e)}",
             "BATCH_PROCESSING_ERROR"
-        )
-        return [error_response.dict()]
+        )]
 
 
 def validate_generation_request(data: Dict[str, Any]) -> GenerateImageRequest:
@@ -10,22 +10,25 @@ import platform
 import psutil
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..gemini_client import get_gemini_client, create_gemini_client
 from ..utils.file_manager import get_file_manager
-from ..models.schemas import (
-    ServerStatusResponse,
-    create_error_response
-)
+from ..models.schemas import create_error_dict
 from ..constants import (
     GEMINI_MODEL_NAME, 
     PROJECT_NAME, 
     PROJECT_VERSION, 
     MCP_VERSION,
-    GEMINI_COST_PER_IMAGE
+    GEMINI_COST_PER_IMAGE,
+    GEMINI_COST_MICROS_PER_IMAGE,
+    SYSTEM_INFO_CACHE_TTL,
+    STORAGE_STATS_CACHE_TTL,
+    HEALTH_SUMMARY_CACHE_TTL
 )
 from ..config import get_settings
 
@@ -34,6 +37,40 @@ logger = logging.getLogger(__name__)
 # 서버 시작 시간 (전역 변수)
 _server_start_time = time.time()
 
+# 통계 집계 대상 작업 유형
+_OPERATION_TYPES = ("generated", "edited", "blended")
+
+# 전체 상태 판정표: (API 정상 << 2 | 스토리지 여유 << 1 | 메모리 여유) -> 상태
+_OVERALL_STATUS_TABLE = (
+    "unhealthy", "unhealthy", "unhealthy", "unhealthy",
+    "degraded", "degraded", "degraded", "healthy"
+)
+
+# CPU 사용률은 직전 호출 이후의 값을 반환하므로 모듈 로드 시 기준점을 잡아 둠 (대기 없는 측정)
+_process = psutil.Process()
+psutil.cpu_percent(interval=None)
+_process.cpu_percent(interval=None)
+
+# 실행 중 바뀌지 않는 CPU/프로세스 정보 (매 호출마다 /proc를 다시 읽지 않도록 한 번만 조회)
+_CPU_CORES = psutil.cpu_count(logical=False)
+_CPU_THREADS = psutil.cpu_count(logical=True)
+_PROCESS_CREATE_TIME = datetime.fromtimestamp(_process.create_time()).isoformat()
+
+# 플랫폼 정보 (platform 모듈은 내부적으로 파일 읽기/하위 프로세스 실행이 있을 수 있어 한 번만 조회)
+_PLATFORM = platform.platform()
+_ARCHITECTURE = platform.architecture()[0]
+_PYTHON_VERSION = sys.version
+
+# 시스템 정보 캐시: detailed 여부 -> (수집 시각, 결과)
+_system_info_cache: Dict[bool, Tuple[float, Dict[str, Any]]] = {}
+
+# 스토리지 통계 캐시: (수집 시각, 결과)
+_storage_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# 상태 요약 캐시와 공유 메모리 스냅샷: (수집 시각, 결과)
+_health_summary_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_memory_snapshot: Optional[Tuple[float, Any]] = None
+
 
 async def nanobanana_status(
     detailed: Optional[bool] = True,
@@ -57,43 +94,77 @@ async def nanobanana_status(
         logger.info("Collecting server status information")
         start_time = time.time()
         
+        # 응답 내 시각은 호출 단위로 한 번만 생성하여 공유
+        now_iso = datetime.now().isoformat()
+        
         # 통계 초기화 (요청된 경우)
         if reset_stats:
             try:
-                gemini_client = get_gemini_client()
-                if gemini_client is None:
-                    logger.info("Creating new Gemini client for MCP call")
-                    gemini_client = await create_gemini_client()
+                # 전역 클라이언트 재사용 (최초 호출 시에만 잠금 하에 한 번 생성)
+                gemini_client = get_gemini_client() or await create_gemini_client()
                 gemini_client.reset_statistics()
                 logger.info("Statistics reset requested and completed")
             except Exception as e:
                 logger.warning(f"Failed to reset statistics: {e}")
         
-        # 병렬로 상태 정보 수집
-        tasks = [
-            collect_api_status(),
-            collect_server_info(),
-            collect_performance_stats(detailed),
-            collect_storage_stats(),
-            collect_system_info(detailed)
-        ]
-        
-        if include_history:
-            tasks.append(collect_recent_history())
+        # 간소화 응답(상태 확인용)은 API 상태와 가동 시간만 필요하므로 무거운 수집을 건너뜀
+        # (응답 형태는 detailed로만 결정되며 include_history는 상세 응답에서만 반영)
+        if not detailed:
+            api_status, health_summary, disk_usage = await asyncio.gather(
+                collect_api_status(now_iso),
+                asyncio.to_thread(get_health_summary),
+                asyncio.to_thread(_disk_usage_info)
+            )
+            
+            system_info = {}
+            if "memory_usage_percent" in health_summary:
+                system_info["memory"] = {"percent_used": health_summary["memory_usage_percent"]}
+            # 디렉토리 순회 없이 디스크 사용률만 조회하여 스토리지 상태도 판정에 반영
+            overall_status = calculate_overall_status(api_status, {"disk_usage": disk_usage}, system_info)
+            
+            logger.info(f"Status summary completed in {time.time() - start_time:.3f}s. Overall status: {overall_status}")
+            
+            return {
+                "success": True,
+                "message": f"Server status: {overall_status}",
+                "server_name": PROJECT_NAME,
+                "version": PROJECT_VERSION,
+                "uptime": health_summary.get("uptime", calculate_uptime()),
+                "api_accessible": api_status.get("api_accessible", False),
+                "overall_status": overall_status,
+                "timestamp": now_iso
+            }
         
-        # 모든 정보 동시 수집
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 이미지 기록은 한 번만 읽어 성능 통계와 최근 히스토리에서 함께 사용
+        history = await asyncio.to_thread(get_file_manager().get_image_history)
         
-        # 결과 처리
-        api_status = results[0] if not isinstance(results[0], Exception) else {"error": str(results[0])}
-        server_info = results[1] if not isinstance(results[1], Exception) else {"error": str(results[1])}
-        performance_stats = results[2] if not isinstance(results[2], Exception) else {"error": str(results[2])}
-        storage_stats = results[3] if not isinstance(results[3], Exception) else {"error": str(results[3])}
-        system_info = results[4] if not isinstance(results[4], Exception) else {"error": str(results[4])}
+        # 병렬로 상태 정보 수집 (이름으로 결과를 조회)
+        collectors = {
+            "api_status": collect_api_status(now_iso),
+            "server_info": collect_server_info(),
+            "performance_stats": collect_performance_stats(detailed, history),
+            "storage_stats": collect_storage_stats(),
+            "system_info": collect_system_info(detailed)
+        }
         
-        recent_history = {}
-        if include_history and len(results) > 5:
-            recent_history = results[5] if not isinstance(results[5], Exception) else {"error": str(results[5])}
+        if include_history:
+            collectors["recent_history"] = collect_recent_history(history)
+        
+        # 모든 정보 동시 수집 (각 수집기는 오류를 {"error": ...}로 반환하므로 남은 예외만 변환)
+        results = dict(zip(
+            collectors,
+            await asyncio.gather(*collectors.values(), return_exceptions=True)
+        ))
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                results[name] = {"error": str(result)}
+        
+        api_status = results["api_status"]
+        server_info = results["server_info"]
+        performance_stats = results["performance_stats"]
+        storage_stats = results["storage_stats"]
+        system_info = results["system_info"]
+        recent_history = results.get("recent_history", {})
         
         # 전체 상태 판정
         overall_status = calculate_overall_status(api_status, storage_stats, system_info)
@@ -106,7 +177,7 @@ async def nanobanana_status(
             response_data = {
                 "success": True,
                 "message": f"Server status: {overall_status}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
                 "server_name": server_info.get("name", PROJECT_NAME),
                 "version": server_info.get("version", PROJECT_VERSION),
                 "uptime": server_info.get("uptime", 0),
@@ -123,46 +194,33 @@ async def nanobanana_status(
             if include_history:
                 response_data["recent_history"] = recent_history
             
-            if not detailed:
-                # 간소화된 응답
-                response_data = {
-                    "success": True,
-                    "message": f"Server status: {overall_status}",
-                    "server_name": PROJECT_NAME,
-                    "version": PROJECT_VERSION,
-                    "uptime": server_info.get("uptime", 0),
-                    "api_accessible": api_status.get("api_accessible", False),
-                    "overall_status": overall_status,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            response = ServerStatusResponse(**response_data)
+            # 이미 응답 형태로 구성된 dict이므로 스키마 검증/재직렬화 없이 그대로 반환
+            # (ServerStatusResponse로 검증하면 간소화 응답과 선택 필드가 누락됨)
             logger.info(f"Status collection completed in {collection_time:.3f}s. Overall status: {overall_status}")
             
-            return response.dict()
+            return response_data
             
         except Exception as e:
             logger.error(f"Failed to create status response: {e}")
-            return create_error_response(
+            return create_error_dict(
                 "Failed to generate status response",
                 "RESPONSE_ERROR"
-            ).dict()
+            )
     
     except Exception as e:
         logger.error(f"Unexpected error in nanobanana_status: {e}")
-        return create_error_response(
+        return create_error_dict(
             f"Unexpected error: {str(e)}",
             "INTERNAL_ERROR"
-        ).dict()
+        )
 
 
-async def collect_api_status() -> Dict[str, Any]:
-    """API 상태 정보 수집"""
+async def collect_api_status(checked_at: Optional[str] = None) -> Dict[str, Any]:
+    """API 상태 정보 수집 (checked_at: 호출자가 생성한 확인 시각, 생략 시 현재 시각)"""
+    checked_at = checked_at or datetime.now().isoformat()
     try:
-        gemini_client = get_gemini_client()
-        if gemini_client is None:
-            logger.info("Creating new Gemini client for MCP call")
-            gemini_client = await create_gemini_client()
+        # 전역 클라이언트 재사용 (최초 호출 시에만 잠금 하에 한 번 생성)
+        gemini_client = get_gemini_client() or await create_gemini_client()
         
         # API 연결 상태 확인
         health_result = await gemini_client.health_check()
@@ -175,7 +233,7 @@ async def collect_api_status() -> Dict[str, Any]:
             "model": health_result.get("model", GEMINI_MODEL_NAME),
             "status": health_result.get("status", "unknown"),
             "vertex_ai": health_result.get("vertex_ai", False),
-            "last_check": datetime.now().isoformat(),
+            "last_check": checked_at,
             "statistics": stats,
             "error": health_result.get("error")
         }
@@ -186,27 +244,35 @@ async def collect_api_status() -> Dict[str, Any]:
             "api_accessible": False,
             "status": "error",
             "error": str(e),
-            "last_check": datetime.now().isoformat()
+            "last_check": checked_at
         }
 
 
+@lru_cache(maxsize=1)
+def _build_server_info_static() -> Dict[str, Any]:
+    """요청마다 바뀌지 않는 서버 정보 (최초 1회 생성, 시작 시간 재설정 시 초기화)"""
+    settings = get_settings()
+    return {
+        "name": settings.server_name or PROJECT_NAME,
+        "version": settings.server_version or PROJECT_VERSION,
+        "mcp_version": MCP_VERSION,
+        "started_at": datetime.fromtimestamp(_server_start_time).isoformat(),
+        "dev_mode": settings.dev_mode,
+        "debug": settings.debug,
+        "host": settings.host,
+        "port": settings.port
+    }
+
+
 async def collect_server_info() -> Dict[str, Any]:
     """서버 정보 수집"""
     try:
-        settings = get_settings()
         uptime = calculate_uptime()
         
         return {
-            "name": settings.server_name or PROJECT_NAME,
-            "version": settings.server_version or PROJECT_VERSION,
-            "mcp_version": MCP_VERSION,
+            **_build_server_info_static(),
             "uptime": uptime,
-            "uptime_human": format_uptime(uptime),
-            "started_at": datetime.fromtimestamp(_server_start_time).isoformat(),
-            "dev_mode": settings.dev_mode,
-            "debug": settings.debug,
-            "host": settings.host,
-            "port": settings.port
+            "uptime_human": format_uptime(uptime)
         }
         
     except Exception as e:
@@ -218,55 +284,67 @@ async def collect_server_info() -> Dict[str, Any]:
         }
 
 
-async def collect_performance_stats(detailed: bool = True) -> Dict[str, Any]:
-    """성능 통계 수집"""
+async def collect_performance_stats(
+    detailed: bool = True,
+    history: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """성능 통계 수집 (파일 읽기/집계는 스레드에서 수행)"""
+    return await asyncio.to_thread(_collect_performance_stats_sync, detailed, history)
+
+
+def _collect_performance_stats_sync(
+    detailed: bool = True,
+    history: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """성능 통계 수집 (최신순 이미지 기록을 한 번 순회하며 집계)"""
     try:
         file_manager = get_file_manager()
+        if history is None:
+            history = file_manager.get_image_history()
         
-        # 기본 통계
-        total_generated = len(file_manager.get_image_history(operation_type="generated", limit=10000))
-        total_edited = len(file_manager.get_image_history(operation_type="edited", limit=10000))  
-        total_blended = len(file_manager.get_image_history(operation_type="blended", limit=10000))
+        counts = dict.fromkeys(_OPERATION_TYPES, 0)
+        recent_counts = dict.fromkeys(_OPERATION_TYPES, 0)
+        processing_times = []
         
-        total_operations = total_generated + total_edited + total_blended
+        if detailed:
+            # 최근 24시간 기록은 시각순 색인에서 이진 탐색으로 바로 가져옴
+            for img in file_manager.get_history_since(time.time() - 24 * 60 * 60):
+                op_type = img.get("operation_type")
+                if op_type in recent_counts:
+                    recent_counts[op_type] += 1
+        
+        for index, img in enumerate(history):
+            # 평균 처리 시간은 최근 100건 기준
+            if detailed and index < 100 and img.get("generation_time"):
+                processing_times.append(img["generation_time"])
+            
+            op_type = img.get("operation_type")
+            if op_type not in counts:
+                continue
+            
+            counts[op_type] += 1
         
-        # 비용 계산
-        total_cost = total_operations * GEMINI_COST_PER_IMAGE
+        # 기본 통계
+        total_operations = sum(counts.values())
         
+        # 비용 계산 (정수 마이크로 달러로 곱한 뒤 한 번만 나눠 부동소수점 오차 방지)
         stats = {
             "total_operations": total_operations,
-            "operations_breakdown": {
-                "generated": total_generated,
-                "edited": total_edited,
-                "blended": total_blended
-            },
-            "total_cost_usd": round(total_cost, 4),
+            "operations_breakdown": dict(counts),
+            "total_cost_usd": total_operations * GEMINI_COST_MICROS_PER_IMAGE / 1_000_000,
             "cost_per_operation": GEMINI_COST_PER_IMAGE
         }
         
         if detailed:
             # 최근 24시간 통계
-            recent_cutoff = datetime.now() - timedelta(hours=24)
-            recent_operations = 0
-            
-            for op_type in ["generated", "edited", "blended"]:
-                recent_ops = [
-                    img for img in file_manager.get_image_history(operation_type=op_type, limit=1000)
-                    if datetime.fromisoformat(img.get("created_at", "1970-01-01")) > recent_cutoff
-                ]
-                recent_operations += len(recent_ops)
-                stats["operations_breakdown"][f"recent_{op_type}_24h"] = len(recent_ops)
+            for op_type, count in recent_counts.items():
+                stats["operations_breakdown"][f"recent_{op_type}_24h"] = count
             
+            recent_operations = sum(recent_counts.values())
             stats["recent_operations_24h"] = recent_operations
-            stats["recent_cost_24h"] = round(recent_operations * GEMINI_COST_PER_IMAGE, 4)
+            stats["recent_cost_24h"] = recent_operations * GEMINI_COST_MICROS_PER_IMAGE / 1_000_000
             
             # 평균 처리 시간 (가능한 경우)
-            all_images = file_manager.get_image_history(limit=100)
-            processing_times = [
-                img.get("generation_time", 0) for img in all_images 
-                if img.get("generation_time")
-            ]
-            
             if processing_times:
                 stats["average_processing_time"] = round(sum(processing_times) / len(processing_times), 2)
                 stats["min_processing_time"] = round(min(processing_times), 2)
@@ -280,26 +358,27 @@ async def collect_performance_stats(detailed: bool = True) -> Dict[str, Any]:
 
 
 async def collect_storage_stats() -> Dict[str, Any]:
+    """스토리지 통계 수집 (STORAGE_STATS_CACHE_TTL 동안 캐싱, 디렉토리 순회/디스크 조회는 스레드에서 수행)"""
+    global _storage_stats_cache
+    
+    now = time.monotonic()
+    if _storage_stats_cache and now - _storage_stats_cache[0] < STORAGE_STATS_CACHE_TTL:
+        return _storage_stats_cache[1]
+    
+    storage_stats = await asyncio.to_thread(_collect_storage_stats_sync)
+    if "error" not in storage_stats:
+        _storage_stats_cache = (now, storage_stats)
+    return storage_stats
+
+
+def _collect_storage_stats_sync() -> Dict[str, Any]:
     """스토리지 통계 수집"""
     try:
         file_manager = get_file_manager()
         storage_info = file_manager.get_storage_stats()
         
         # 추가 디스크 공간 정보
-        settings = get_settings()
-        
-        try:
-            disk_usage = psutil.disk_usage(str(settings.output_dir))
-            disk_info = {
-                "total_gb": round(disk_usage.total / (1024**3), 2),
-                "used_gb": round(disk_usage.used / (1024**3), 2),
-                "free_gb": round(disk_usage.free / (1024**3), 2),
-                "used_percent": round((disk_usage.used / disk_usage.total) * 100, 1)
-            }
-            storage_info["disk_usage"] = disk_info
-        except Exception as e:
-            logger.warning(f"Failed to get disk usage: {e}")
-            storage_info["disk_usage"] = {"error": str(e)}
+        storage_info["disk_usage"] = _disk_usage_info()
         
         return storage_info
         
@@ -308,19 +387,47 @@ async def collect_storage_stats() -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def _disk_usage_info() -> Dict[str, Any]:
+    """출력 디렉토리가 있는 디스크의 사용량 (psutil 조회 한 번, 실패 시 {"error": ...})"""
+    try:
+        disk_usage = psutil.disk_usage(str(get_settings().output_dir))
+        return {
+            "total_gb": round(disk_usage.total / (1024**3), 2),
+            "used_gb": round(disk_usage.used / (1024**3), 2),
+            "free_gb": round(disk_usage.free / (1024**3), 2),
+            "used_percent": round((disk_usage.used / disk_usage.total) * 100, 1)
+        }
+    except Exception as e:
+        logger.warning(f"Failed to get disk usage: {e}")
+        return {"error": str(e)}
+
+
 async def collect_system_info(detailed: bool = True) -> Dict[str, Any]:
+    """시스템 정보 수집 (SYSTEM_INFO_CACHE_TTL 동안 캐싱, psutil 조회는 스레드에서 수행)"""
+    now = time.monotonic()
+    cached = _system_info_cache.get(detailed)
+    if cached and now - cached[0] < SYSTEM_INFO_CACHE_TTL:
+        return cached[1]
+    
+    info = await asyncio.to_thread(_collect_system_info_sync, detailed)
+    if "error" not in info:
+        _system_info_cache[detailed] = (now, info)
+    return info
+
+
+def _collect_system_info_sync(detailed: bool = True) -> Dict[str, Any]:
     """시스템 정보 수집"""
     try:
         info = {
-            "platform": platform.platform(),
-            "python_version": sys.version,
-            "architecture": platform.architecture()[0]
+            "platform": _PLATFORM,
+            "python_version": _PYTHON_VERSION,
+            "architecture": _ARCHITECTURE
         }
         
         if detailed:
             try:
                 # 메모리 정보
-                memory = psutil.virtual_memory()
+                memory = _virtual_memory()
                 info["memory"] = {
                     "total_gb": round(memory.total / (1024**3), 2),
                     "used_gb": round(memory.used / (1024**3), 2),
@@ -330,18 +437,18 @@ async def collect_system_info(detailed: bool = True) -> Dict[str, Any]:
                 
                 # CPU 정보
                 info["cpu"] = {
-                    "cores": psutil.cpu_count(logical=False),
-                    "threads": psutil.cpu_count(logical=True),
-                    "usage_percent": psutil.cpu_percent(interval=1)
+                    "cores": _CPU_CORES,
+                    "threads": _CPU_THREADS,
+                    "usage_percent": psutil.cpu_percent(interval=None)
                 }
                 
-                # 프로세스 정보
-                process = psutil.Process()
+                # 프로세스 정보 (as_dict는 oneshot으로 /proc/<pid> 파일을 한 번만 읽음)
+                process_info = _process.as_dict(attrs=["memory_info", "cpu_percent"])
                 info["process"] = {
-                    "pid": process.pid,
-                    "memory_mb": round(process.memory_info().rss / (1024**2), 1),
-                    "cpu_percent": round(process.cpu_percent(), 1),
-                    "create_time": datetime.fromtimestamp(process.create_time()).isoformat()
+                    "pid": _process.pid,
+                    "memory_mb": round(process_info["memory_info"].rss / (1024**2), 1),
+                    "cpu_percent": round(process_info["cpu_percent"], 1),
+                    "create_time": _PROCESS_CREATE_TIME
                 }
                 
             except Exception as e:
@@ -355,28 +462,38 @@ async def collect_system_info(detailed: bool = True) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-async def collect_recent_history() -> Dict[str, Any]:
+async def collect_recent_history(history: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """최근 작업 히스토리 수집 (파일 읽기는 스레드에서 수행)"""
+    return await asyncio.to_thread(_collect_recent_history_sync, history)
+
+
+def _collect_recent_history_sync(history: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """최근 작업 히스토리 수집"""
     try:
-        file_manager = get_file_manager()
+        if history is None:
+            history = get_file_manager().get_image_history()
         
-        # 각 작업 유형별로 최근 5개씩 수집
-        history = {}
+        # 이미 최신순으로 정렬된 기록에서 작업 유형별로 최근 5개만 취함
+        # (유형별 순회는 5개를 찾는 즉시 중단되므로 전체 기록을 끝까지 훑지 않음)
+        recent_history = {}
         
-        for op_type in ["generated", "edited", "blended"]:
-            recent_items = file_manager.get_image_history(operation_type=op_type, limit=5)
-            history[f"recent_{op_type}"] = [
+        for op_type in _OPERATION_TYPES:
+            recent_items = islice(
+                (item for item in history if item.get("operation_type") == op_type),
+                5
+            )
+            recent_history[f"recent_{op_type}"] = [
                 {
                     "filename": item.get("filename"),
                     "created_at": item.get("created_at"),
-                    "prompt": item.get("prompt", "")[:100],  # 처음 100글자만
+                    "prompt": (item.get("prompt") or "")[:100],  # 처음 100글자만
                     "file_size": item.get("file_size"),
                     "processing_time": item.get("generation_time")
                 }
                 for item in recent_items
             ]
         
-        return history
+        return recent_history
         
     except Exception as e:
         logger.error(f"Failed to collect recent history: {e}")
@@ -384,36 +501,15 @@ async def collect_recent_history() -> Dict[str, Any]:
 
 
 def calculate_overall_status(api_status: Dict, storage_stats: Dict, system_info: Dict) -> str:
-    """전체 상태 판정"""
-    try:
-        # API 상태 확인
-        api_healthy = api_status.get("api_accessible", False)
-        
-        # 스토리지 상태 확인
-        storage_ok = True
-        disk_usage = storage_stats.get("disk_usage", {})
-        if isinstance(disk_usage, dict) and "used_percent" in disk_usage:
-            if disk_usage["used_percent"] > 90:  # 90% 이상 사용 시 경고
-                storage_ok = False
-        
-        # 메모리 상태 확인
-        memory_ok = True
-        memory_info = system_info.get("memory", {})
-        if isinstance(memory_info, dict) and "percent_used" in memory_info:
-            if memory_info["percent_used"] > 85:  # 85% 이상 사용 시 경고
-                memory_ok = False
-        
-        # 종합 판정
-        if api_healthy and storage_ok and memory_ok:
-            return "healthy"
-        elif api_healthy:
-            return "degraded"
-        else:
-            return "unhealthy"
-            
-    except Exception as e:
-        logger.error(f"Failed to calculate overall status: {e}")
-        return "unknown"
+    """전체 상태 판정 (API/스토리지/메모리 상태 비트 조합으로 판정표 조회)"""
+    disk_usage = storage_stats.get("disk_usage") or {}
+    memory_info = system_info.get("memory") or {}
+    
+    api_healthy = bool(api_status.get("api_accessible", False))
+    storage_ok = disk_usage.get("used_percent", 0) <= 90  # 90% 초과 사용 시 경고
+    memory_ok = memory_info.get("percent_used", 0) <= 85  # 85% 초과 사용 시 경고
+    
+    return _OVERALL_STATUS_TABLE[(api_healthy << 2) | (storage_ok << 1) | memory_ok]
 
 
 def calculate_uptime() -> float:
@@ -422,30 +518,42 @@ def calculate_uptime() -> float:
 
 
 def format_uptime(uptime_seconds: float) -> str:
-    """가동 시간을 읽기 쉬운 형식으로 변환"""
-    try:
-        uptime_timedelta = timedelta(seconds=int(uptime_seconds))
-        days = uptime_timedelta.days
-        hours, remainder = divmod(uptime_timedelta.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        
-        return " ".join(parts) if parts else "< 1m"
-        
-    except Exception as e:
-        logger.error(f"Failed to format uptime: {e}")
-        return f"{int(uptime_seconds)}s"
+    """가동 시간을 읽기 쉬운 형식으로 변환 (0인 단위는 생략)"""
+    days, seconds = divmod(int(uptime_seconds), 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes = seconds // 60
+    
+    uptime_text = (
+        (f"{days}d " if days else "")
+        + (f"{hours}h " if hours else "")
+        + (f"{minutes}m" if minutes else "")
+    )
+    return uptime_text.rstrip() or "< 1m"
+
+
+def _virtual_memory() -> Any:
+    """psutil.virtual_memory() 결과 (HEALTH_SUMMARY_CACHE_TTL 동안 재사용)"""
+    global _memory_snapshot
+    
+    now = time.monotonic()
+    if _memory_snapshot is None or now - _memory_snapshot[0] >= HEALTH_SUMMARY_CACHE_TTL:
+        _memory_snapshot = (now, psutil.virtual_memory())
+    return _memory_snapshot[1]
 
 
 def get_health_summary() -> Dict[str, Any]:
-    """간단한 상태 요약 정보 (동기 함수)"""
+    """
+    간단한 상태 요약 정보 (동기 함수, HEALTH_SUMMARY_CACHE_TTL 동안 캐싱)
+    
+    호출자가 결과를 수정해도 캐시에 영향이 없도록 항상 사본을 반환하며,
+    캐시된 요약을 반환할 때도 timestamp는 호출 시각으로 갱신합니다.
+    """
+    global _health_summary_cache
+    
+    now = time.monotonic()
+    if _health_summary_cache and now - _health_summary_cache[0] < HEALTH_SUMMARY_CACHE_TTL:
+        return {**_health_summary_cache[1], "timestamp": datetime.now().isoformat()}
+    
     try:
         uptime = calculate_uptime()
         
@@ -461,13 +569,14 @@ def get_health_summary() -> Dict[str, Any]:
         
         # 간단한 시스템 정보
         try:
-            memory = psutil.virtual_memory()
+            memory = _virtual_memory()
             summary["memory_usage_percent"] = round(memory.percent, 1)
             summary["memory_available_gb"] = round(memory.available / (1024**3), 2)
         except Exception as e:
             logger.debug(f"Could not get memory info: {e}")
         
-        return summary
+        _health_summary_cache = (now, summary)
+        return dict(summary)
         
     except Exception as e:
         logger.error(f"Failed to get health summary: {e}")
@@ -482,6 +591,7 @@ def reset_server_start_time() -> None:
     """서버 시작 시간 재설정 (서버 재시작 시 사용)"""
     global _server_start_time
     _server_start_time = time.time()
+    _build_server_info_static.cache_clear()
     logger.info("Server start time reset")
 
 
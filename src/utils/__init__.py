@@ -5,6 +5,7 @@
 - image_handler: 이미지 처리 및 변환
 - prompt_optimizer: 프롬프트 최적화
 - file_manager: 파일 관리 및 저장
+- response_cache: API 응답 캐시
 """
 
-__all__ = ["image_handler", "prompt_optimizer", "file_manager"]
\ No newline at end of file
+__all__ = ["image_handler", "prompt_optimizer", "file_manager", "response_cache"]
\ No newline at end of file
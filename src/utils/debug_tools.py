@@ -4,41 +4,267 @@
 이미지 파일 문제 진단, Base64 검증, 파일 무결성 확인 등의 기능을 제공합니다.
 """
 
-import base64
+import binascii
+import functools
 import hashlib
 import logging
 import mimetypes
+import mmap
+import multiprocessing
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Any, Iterator, Optional, List, Tuple, Union
+
+try:
+    import pybase64 as base64  # SIMD 가속 Base64 (선택적 의존성)
+except ImportError:
+    import base64
 
 from PIL import Image
-import magic  # python-magic
+
+try:
+    import magic  # python-magic
+    _MAGIC = magic.Magic(mime=True)  # libmagic 데이터베이스는 한 번만 로드
+except Exception:
+    _MAGIC = None
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Base64 알파벳 (디코딩 실패 시 원인 분석용, bytes.translate 삭제 대상)
+_B64_ALNUM = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+
+# Base64(표준/URL-safe) 알파벳과 공백 문자 (앞부분 사전 검사용)
+_B64_CHARS = _B64_ALNUM + b'+/=-_\r\n\t '
+_B64_PREFILTER_SIZE = 64
+
+# libmagic에 전달할 헤더 크기 (내용 판별은 파일 앞부분만 사용)
+_MAGIC_HEADER_SIZE = 4096
+
+# 누락된 분석 결과 대신 사용하는 읽기 전용 빈 dict (조회마다 {}를 만들지 않음)
+_EMPTY = MappingProxyType({})
+
+# EXIF 존재 여부를 검사할 헤더 크기
+_EXIF_SCAN_SIZE = 4096
+
+# 문제가 될 수 있는 PNG 청크 (Google이 사용하는 비표준 텍스트 청크들)
+_PROBLEMATIC_PNG_CHUNKS = frozenset({b'zTXt', b'iTXt', b'tEXt'})
+
+# 이미지 파일 시그니처 (순서 고정: WebP는 RIFF 매칭 후 추가 검증)
+_SIGNATURES = (
+    ('png', b'\x89PNG\r\n\x1a\n'),
+    ('jpeg', b'\xff\xd8\xff'),
+    ('webp', b'RIFF'),
+    ('gif', b'GIF8'),
+    ('bmp', b'BM'),
+)
+
+# 시그니처 앞 2바이트 -> (형식, 전체 시그니처) 조회 테이블 (앞 2바이트가 모두 서로 다름)
+_SIG_TABLE = {signature[:2]: (fmt, signature) for fmt, signature in _SIGNATURES}
+
+# 시그니처 형식 -> Pillow 형식 이름 (Image.open 플러그인 탐색 범위 제한용)
+_PILLOW_FORMATS = {
+    'png': 'PNG',
+    'jpeg': 'JPEG',
+    'webp': 'WEBP',
+    'gif': 'GIF',
+    'bmp': 'BMP'
+}
+
+# 시그니처 형식 -> MIME 타입
+_SIG_TO_MIME = {
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+    'webp': 'image/webp',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp'
+}
+
+
+def _detect_signature(header: bytes) -> Optional[str]:
+    """
+    헤더 바이트로 이미지 형식 판별 (앞 2바이트 조회 후 전체 시그니처 확인)
+    
+    Args:
+        header: 파일 앞부분 바이트
+        
+    Returns:
+        Optional[str]: 형식 이름 (일치하는 시그니처가 없으면 None)
+    """
+    entry = _SIG_TABLE.get(header[:2])
+    if entry is not None and header.startswith(entry[1]):
+        return entry[0]
+    return None
+
+
+def _decode_base64(clean_string: bytes) -> Tuple[bool, bool, Optional[bytes], Optional[str]]:
+    """
+    Base64 디코딩 및 알파벳 판별
+    
+    validate=True 디코딩이 알파벳 검사를 겸하므로 정상 입력은 추가 검사 없이 처리하고,
+    실패한 경우에만 알파벳을 검사해 URL-safe/패딩 누락 입력을 다시 디코딩합니다.
+    
+    Args:
+        clean_string: 공백이 제거된 Base64 바이트열
+        
+    Returns:
+        Tuple: (표준 알파벳 여부, URL-safe 알파벳 여부, 디코딩 결과, 오류 메시지)
+    """
+    try:
+        decoded = base64.b64decode(clean_string, validate=True)
+        is_url_safe = b'+' not in clean_string and b'/' not in clean_string
+        return True, is_url_safe, decoded, None
+    except (binascii.Error, ValueError):
+        pass
+    
+    # 공통 영숫자를 한 번에 지우고 남은 (대개 짧은) 바이트로 두 알파벳을 판별 (패딩은 끝에 최대 2개)
+    body = clean_string.rstrip(b'=')
+    padding_ok = len(clean_string) - len(body) <= 2
+    rest = body.translate(None, _B64_ALNUM)
+    is_standard = padding_ok and not rest.translate(None, b'+/')
+    is_url_safe = padding_ok and not rest.translate(None, b'-_')
+    if not (is_standard or is_url_safe):
+        return False, False, None, None
+    
+    try:
+        # 패딩 추가
+        padding_needed = len(clean_string) % 4
+        if padding_needed:
+            clean_string += b'=' * (4 - padding_needed)
+        
+        # 표준 알파벳이 아니면 '-' 또는 '_'를 포함한 URL-safe 입력
+        if not is_standard:
+            decoded = base64.urlsafe_b64decode(clean_string)
+        else:
+            decoded = base64.b64decode(clean_string)
+        return is_standard, is_url_safe, decoded, None
+    except Exception as decode_error:
+        return is_standard, is_url_safe, None, str(decode_error)
+
+
+def _open_image(data: Union[bytes, BinaryIO], image_format: Optional[str] = None) -> Image.Image:
+    """
+    입력을 복사하지 않고 Pillow로 이미지 열기
+    
+    파일 객체는 그대로 넘겨 Pillow가 필요한 부분만 읽게 하고, bytes는 BytesIO로 감쌉니다.
+    (BytesIO는 쓰기 전까지 bytes 버퍼를 공유하므로 복사가 일어나지 않음)
+    메모리 맵은 끝을 넘는 seek에서 예외가 발생해 Pillow 오류가 달라지므로 넘기지 않습니다.
+    image_format을 주면 해당 Pillow 플러그인만 시도합니다.
+    """
+    formats = [image_format] if image_format else None
+    if isinstance(data, bytes):
+        return Image.open(BytesIO(data), formats=formats)
+    return Image.open(data, formats=formats)
+
+
+def _has_exif(header: bytes, fmt: Optional[str]) -> bool:
+    """
+    헤더 바이트에서 EXIF 존재 여부 확인 (EXIF 태그 파싱 없음)
+    
+    Args:
+        header: 파일 앞부분 바이트
+        fmt: Pillow 형식 이름 (JPEG, PNG, WEBP)
+        
+    Returns:
+        bool: EXIF 포함 여부
+    """
+    if fmt == 'JPEG':
+        # APP1 세그먼트의 Exif 식별자
+        return header.find(b'Exif\x00\x00') >= 0
+    if fmt == 'PNG':
+        return header.find(b'eXIf') >= 0
+    if fmt == 'WEBP':
+        # EXIF 청크는 이미지 데이터 뒤에 오므로 VP8X 헤더의 EXIF 플래그로 판단
+        return header[12:16] == b'VP8X' and len(header) > 20 and bool(header[20] & 0x08)
+    return False
+
+
+# 진단 결과 캐시: (경로, mtime_ns, 크기) -> 피클된 진단 결과 (파일이 바뀌면 키가 달라짐)
+_DIAGNOSIS_CACHE_SIZE = 4096
+_diagnosis_cache: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_diagnosis_cache_lock = threading.Lock()
+
+
+def _diagnosis_cache_key(file_path: Union[str, Path], stat_result: os.stat_result) -> Tuple[str, int, int]:
+    """진단 결과 캐시 키"""
+    return str(file_path), stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _get_cached_diagnosis(key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """캐시된 진단 결과 조회 (호출자가 수정해도 되도록 매번 새 dict로 복원)"""
+    with _diagnosis_cache_lock:
+        payload = _diagnosis_cache.get(key)
+        if payload is None:
+            return None
+        _diagnosis_cache.move_to_end(key)
+    return pickle.loads(payload)
+
+
+def _cache_diagnosis(key: Tuple[str, int, int], diagnosis: Dict[str, Any]) -> None:
+    """진단 결과 캐시 저장 (오류 결과는 저장하지 않음)"""
+    if 'error' in diagnosis:
+        return
+    
+    payload = pickle.dumps(diagnosis, protocol=pickle.HIGHEST_PROTOCOL)
+    with _diagnosis_cache_lock:
+        _diagnosis_cache[key] = payload
+        _diagnosis_cache.move_to_end(key)
+        if len(_diagnosis_cache) > _DIAGNOSIS_CACHE_SIZE:
+            _diagnosis_cache.popitem(last=False)
+
+
+def _scan_png_chunks(data: Union[bytes, mmap.mmap], targets: frozenset) -> List[str]:
+    """
+    PNG 청크 스트림을 직접 순회하며 대상 청크 타입 찾기 (청크 데이터는 읽지 않음)
+    
+    Args:
+        data: PNG 파일 바이트 (메모리 맵 가능)
+        targets: 찾을 청크 타입 집합 (예: {b'tEXt'})
+        
+    Returns:
+        List[str]: 발견된 청크 타입 (처음 나온 순서, 중복 없음)
+    """
+    found = []
+    size = len(data)
+    pos = 8  # PNG 시그니처 다음
+    while pos + 8 <= size:
+        length = int.from_bytes(data[pos:pos + 4], 'big')
+        chunk_type = data[pos + 4:pos + 8]
+        if chunk_type == b'IEND':
+            break
+        if chunk_type in targets:
+            name = chunk_type.decode('ascii')
+            if name not in found:
+                found.append(name)
+        pos += 12 + length  # 길이 + 타입 + 데이터 + CRC
+    return found
+
 
 class ImageDiagnostics:
     """이미지 파일 진단 도구"""
     
     def __init__(self):
         self.settings = get_settings()
-        self.signatures = {
-            'png': b'\x89PNG\r\n\x1a\n',
-            'jpeg': b'\xff\xd8\xff',
-            'webp': b'RIFF',
-            'gif': b'GIF8',
-            'bmp': b'BM'
-        }
+        self.signatures = _SIGNATURES
     
-    def diagnose_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def diagnose_file(
+        self,
+        file_path: Union[str, Path],
+        stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """
         파일 종합 진단
         
         Args:
             file_path: 진단할 파일 경로
+            stat_result: 이미 조회한 파일 stat 정보 (디렉토리 탐색 결과 재사용)
             
         Returns:
             Dict: 진단 결과
@@ -46,41 +272,72 @@ class ImageDiagnostics:
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
-                return {
-                    'status': 'error',
-                    'error': 'File not found',
-                    'file_path': str(file_path)
-                }
+            if stat_result is None:
+                # exists() 후 stat()을 다시 부르지 않고 한 번의 stat으로 존재 여부 확인
+                try:
+                    stat_result = file_path.stat()
+                except FileNotFoundError:
+                    return {
+                        'status': 'error',
+                        'error': 'File not found',
+                        'file_path': str(file_path)
+                    }
+            
+            # 변경되지 않은 파일은 이전 진단 결과 재사용
+            cache_key = _diagnosis_cache_key(file_path, stat_result)
+            cached = _get_cached_diagnosis(cache_key)
+            if cached is not None:
+                return cached
             
             # 기본 파일 정보
-            stat = file_path.stat()
             file_info = {
                 'file_path': str(file_path),
-                'file_size': stat.st_size,
-                'file_size_mb': round(stat.st_size / 1024 / 1024, 3),
+                'file_size': stat_result.st_size,
+                'file_size_mb': round(stat_result.st_size / 1024 / 1024, 3),
                 'extension': file_path.suffix.lower(),
-                'modified_time': stat.st_mtime
+                'modified_time': stat_result.st_mtime
             }
             
-            # 파일 내용 읽기
+            # 파일 내용은 메모리 맵으로 접근하고 (실제로 읽은 페이지만 메모리에 올라감)
+            # Pillow에는 파일 객체를 넘겨 지연 로딩
             with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            # 진단 실행
-            diagnostics = {
-                **file_info,
-                'signature_analysis': self._analyze_file_signature(file_data),
-                'base64_analysis': self._analyze_base64_content(file_data),
-                'pillow_analysis': self._analyze_with_pillow(file_data),
-                'mime_analysis': self._analyze_mime_type(file_path, file_data),
-                'metadata_analysis': self._analyze_metadata(file_data),
-                'recommendations': []
-            }
+                try:
+                    file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # 빈 파일은 매핑할 수 없음
+                    file_data = b''
+                
+                try:
+                    # 무결성 확인용 해시 (매핑된 버퍼를 한 번의 C 호출로 해싱)
+                    file_info['sha256'] = hashlib.sha256(file_data).hexdigest()
+                    
+                    # 진단 실행
+                    signature_analysis = self._analyze_file_signature(file_data)
+                    # 알려진 시그니처가 없으면 Pillow 열기를 생략하고, 있으면 해당 플러그인만 시도
+                    detected_format = signature_analysis.get('detected_format')
+                    
+                    pillow_analysis, metadata_analysis = self._analyze_image(
+                        f, detected_format is not None, file_data,
+                        image_format=_PILLOW_FORMATS.get(detected_format)
+                    )
+                    
+                    diagnostics = {
+                        **file_info,
+                        'signature_analysis': signature_analysis,
+                        'base64_analysis': self._analyze_base64_content(file_data),
+                        'pillow_analysis': pillow_analysis,
+                        'mime_analysis': self._analyze_mime_type(file_path, file_data, detected_format),
+                        'metadata_analysis': metadata_analysis,
+                        'recommendations': []
+                    }
+                finally:
+                    if isinstance(file_data, mmap.mmap):
+                        file_data.close()
             
             # 권장사항 생성
             diagnostics['recommendations'] = self._generate_recommendations(diagnostics)
             
+            _cache_diagnosis(cache_key, diagnostics)
             return diagnostics
             
         except Exception as e:
@@ -91,7 +348,7 @@ class ImageDiagnostics:
                 'file_path': str(file_path) if 'file_path' in locals() else None
             }
     
-    def _analyze_file_signature(self, data: bytes) -> Dict[str, Any]:
+    def _analyze_file_signature(self, data: Union[bytes, mmap.mmap]) -> Dict[str, Any]:
         """파일 시그니처 분석"""
         try:
             if len(data) < 8:
@@ -101,12 +358,7 @@ class ImageDiagnostics:
                 }
             
             header = data[:16]  # 16바이트 헤더
-            detected_format = None
-            
-            for fmt, signature in self.signatures.items():
-                if data.startswith(signature):
-                    detected_format = fmt
-                    break
+            detected_format = _detect_signature(header)
             
             # WebP 추가 검증
             if detected_format == 'webp' and len(data) > 12:
@@ -123,103 +375,145 @@ class ImageDiagnostics:
         except Exception as e:
             return {'error': str(e)}
     
-    def _analyze_base64_content(self, data: bytes) -> Dict[str, Any]:
+    def _analyze_base64_content(self, data: Union[bytes, mmap.mmap]) -> Dict[str, Any]:
         """Base64 내용 분석"""
         try:
-            # 텍스트로 디코딩 시도
-            try:
-                text_content = data.decode('utf-8')
-                is_text = True
-            except:
-                text_content = data.decode('utf-8', errors='replace')
-                is_text = False
+            # 앞부분에 알파벳 밖의 바이트가 있으면 (일반 이미지 바이너리) 전체 검사 생략
+            prefix = data[:_B64_PREFILTER_SIZE]
+            if prefix.translate(None, _B64_CHARS):
+                return {
+                    'is_likely_text': prefix.isascii(),
+                    'content_length': len(data),
+                    'is_base64_pattern': False,
+                    'is_url_safe_base64': False,
+                    'base64_decode_test': None,
+                    'decoded_signature': None
+                }
             
-            # Base64 패턴 검사
-            import re
-            base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-            url_safe_pattern = re.compile(r'^[A-Za-z0-9_-]*={0,2}$')
+            # 사전 검사를 통과한 경우에만 전체 내용을 메모리로 읽음
+            data = bytes(data)
             
-            text_content_clean = text_content.strip()
+            # Base64는 ASCII 전용이므로 문자열로 디코딩하지 않고 바이트 그대로 검사
+            content_clean = data.strip()
+            is_standard, is_url_safe, decoded, decode_error = _decode_base64(content_clean)
             
             analysis = {
-                'is_likely_text': is_text,
-                'content_length': len(text_content_clean),
-                'is_base64_pattern': base64_pattern.match(text_content_clean) is not None,
-                'is_url_safe_base64': url_safe_pattern.match(text_content_clean) is not None,
+                'is_likely_text': data.isascii(),
+                'content_length': len(content_clean),
+                'is_base64_pattern': is_standard,
+                'is_url_safe_base64': is_url_safe,
                 'base64_decode_test': None,
                 'decoded_signature': None
             }
             
             # Base64 디코딩 테스트
-            if analysis['is_base64_pattern'] or analysis['is_url_safe_base64']:
-                try:
-                    # URL-safe 변환
-                    if '-' in text_content_clean or '_' in text_content_clean:
-                        text_content_clean = text_content_clean.replace('-', '+').replace('_', '/')
-                    
-                    # 패딩 추가
-                    padding_needed = len(text_content_clean) % 4
-                    if padding_needed:
-                        text_content_clean += '=' * (4 - padding_needed)
-                    
-                    decoded = base64.b64decode(text_content_clean)
-                    analysis['base64_decode_test'] = 'success'
-                    analysis['decoded_size'] = len(decoded)
-                    
-                    # 디코딩된 데이터의 시그니처 확인
-                    if len(decoded) >= 8:
-                        header = decoded[:8]
-                        for fmt, signature in self.signatures.items():
-                            if header.startswith(signature):
-                                analysis['decoded_signature'] = fmt
-                                break
-                    
-                except Exception as decode_error:
-                    analysis['base64_decode_test'] = f'failed: {decode_error}'
+            if decoded is not None:
+                analysis['base64_decode_test'] = 'success'
+                analysis['decoded_size'] = len(decoded)
+                
+                # 디코딩된 데이터의 시그니처 확인
+                if len(decoded) >= 8:
+                    analysis['decoded_signature'] = _detect_signature(decoded[:8])
+            elif decode_error is not None:
+                analysis['base64_decode_test'] = f'failed: {decode_error}'
             
             return analysis
             
         except Exception as e:
             return {'error': str(e)}
     
-    def _analyze_with_pillow(self, data: bytes) -> Dict[str, Any]:
-        """Pillow를 사용한 이미지 분석"""
-        try:
-            analysis = {
-                'pillow_can_open': False,
-                'format': None,
-                'mode': None,
-                'size': None,
-                'has_transparency': None,
-                'verification_status': None
-            }
+    def _analyze_image(
+        self,
+        data: Union[bytes, BinaryIO],
+        signature_valid: bool = True,
+        raw: Optional[Union[bytes, mmap.mmap]] = None,
+        image_format: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Pillow 이미지 분석 및 메타데이터 분석 (이미지는 한 번만 열기)
+        
+        Args:
+            data: 이미지 바이트 또는 파일 객체
+            signature_valid: 알려진 시그니처 여부 (False면 열기 생략)
+            raw: 바이트 수준 검사(EXIF, PNG 청크)용 원본 내용 (없으면 data가 bytes일 때 사용)
+            image_format: 시도할 Pillow 형식 이름 (없으면 모든 플러그인 탐색)
             
-            try:
-                with Image.open(BytesIO(data)) as img:
-                    analysis['pillow_can_open'] = True
-                    analysis['format'] = img.format
-                    analysis['mode'] = img.mode
-                    analysis['size'] = img.size
-                    analysis['has_transparency'] = img.mode in ['RGBA', 'LA'] or 'transparency' in img.info
+        Returns:
+            Tuple[Dict, Dict]: (Pillow 분석 결과, 메타데이터 분석 결과)
+        """
+        pillow_analysis = {
+            'pillow_can_open': False,
+            'format': None,
+            'mode': None,
+            'size': None,
+            'has_transparency': None,
+            'verification_status': None
+        }
+        metadata_analysis = {
+            'has_exif': False,
+            'metadata_size_estimate': 0,
+            'problematic_chunks': []
+        }
+        
+        if not signature_valid:
+            pillow_analysis['skipped'] = 'no_valid_signature'
+            metadata_analysis['skipped'] = 'no_valid_signature'
+            return pillow_analysis, metadata_analysis
+        
+        try:
+            with _open_image(data, image_format) as img:
+                pillow_analysis['pillow_can_open'] = True
+                pillow_analysis['format'] = img.format
+                pillow_analysis['mode'] = img.mode
+                pillow_analysis['size'] = img.size
+                pillow_analysis['has_transparency'] = img.mode in ['RGBA', 'LA'] or 'transparency' in img.info
+                
+                # 메타데이터는 verify() 전에 추출 (verify 후에는 이미지 상태를 사용할 수 없음)
+                try:
+                    if raw is None:
+                        raw = data if isinstance(data, bytes) else b''
                     
-                    # 검증 시도
-                    try:
-                        img_copy = img.copy()
-                        img_copy.verify()
-                        analysis['verification_status'] = 'passed'
-                    except Exception as verify_error:
-                        analysis['verification_status'] = f'failed: {verify_error}'
-                        
-            except Exception as pillow_error:
-                analysis['pillow_error'] = str(pillow_error)
-            
-            return analysis
-            
-        except Exception as e:
-            return {'error': str(e)}
+                    # EXIF 데이터 확인 (태그를 파싱하지 않고 원본 바이트만 검사)
+                    if 'exif' in img.info or _has_exif(raw[:_EXIF_SCAN_SIZE], img.format):
+                        metadata_analysis['has_exif'] = True
+                    
+                    # PIL info 확인
+                    if img.info:
+                        metadata_analysis['pil_info_keys'] = list(img.info.keys())
+                        metadata_analysis['metadata_size_estimate'] = sum(
+                            len(str(k)) + len(str(v)) 
+                            for k, v in img.info.items()
+                        )
+                    
+                    # PNG 특정 청크 확인 (문제가 될 수 있는 청크)
+                    if img.format == 'PNG':
+                        metadata_analysis['problematic_chunks'] = _scan_png_chunks(
+                            raw, _PROBLEMATIC_PNG_CHUNKS
+                        )
+                except Exception as img_error:
+                    metadata_analysis['image_analysis_error'] = str(img_error)
+                
+                # 검증 시도 (copy()는 픽셀 전체를 디코딩하므로 헤더만 다시 열어 verify)
+                try:
+                    with _open_image(data, image_format) as verify_img:
+                        verify_img.verify()
+                    pillow_analysis['verification_status'] = 'passed'
+                except Exception as verify_error:
+                    pillow_analysis['verification_status'] = f'failed: {verify_error}'
+                    
+        except Exception as pillow_error:
+            pillow_analysis['pillow_error'] = str(pillow_error)
+            metadata_analysis['image_analysis_error'] = str(pillow_error)
+        
+        return pillow_analysis, metadata_analysis
     
-    def _analyze_mime_type(self, file_path: Path, data: bytes) -> Dict[str, Any]:
-        """MIME 타입 분석"""
+    def _analyze_mime_type(
+        self,
+        file_path: Path,
+        data: Union[bytes, mmap.mmap],
+        detected_format: Optional[str]
+    ) -> Dict[str, Any]:
+        """MIME 타입 분석 (detected_format: _analyze_file_signature의 판별 결과)"""
         try:
             analysis = {}
             
@@ -228,59 +522,13 @@ class ImageDiagnostics:
             
             # python-magic을 사용한 내용 기반 MIME 타입 (사용 가능한 경우)
             try:
-                analysis['content_mime'] = magic.from_buffer(data, mime=True)
+                analysis['content_mime'] = _MAGIC.from_buffer(data[:_MAGIC_HEADER_SIZE])
             except:
                 analysis['content_mime'] = 'unavailable (python-magic not installed)'
             
-            # 간단한 시그니처 기반 추측
+            # 시그니처 기반 추측 (시그니처 분석 결과 재사용)
             if len(data) >= 8:
-                header = data[:8]
-                if header.startswith(b'\x89PNG'):
-                    analysis['signature_mime'] = 'image/png'
-                elif header.startswith(b'\xff\xd8\xff'):
-                    analysis['signature_mime'] = 'image/jpeg'
-                elif header.startswith(b'RIFF') and len(data) > 12 and data[8:12] == b'WEBP':
-                    analysis['signature_mime'] = 'image/webp'
-                else:
-                    analysis['signature_mime'] = 'unknown'
-            
-            return analysis
-            
-        except Exception as e:
-            return {'error': str(e)}
-    
-    def _analyze_metadata(self, data: bytes) -> Dict[str, Any]:
-        """메타데이터 분석"""
-        try:
-            analysis = {
-                'has_exif': False,
-                'metadata_size_estimate': 0,
-                'problematic_chunks': []
-            }
-            
-            try:
-                with Image.open(BytesIO(data)) as img:
-                    # EXIF 데이터 확인
-                    if hasattr(img, '_getexif') and img._getexif():
-                        analysis['has_exif'] = True
-                    
-                    # PIL info 확인
-                    if img.info:
-                        analysis['pil_info_keys'] = list(img.info.keys())
-                        analysis['metadata_size_estimate'] = sum(
-                            len(str(k)) + len(str(v)) 
-                            for k, v in img.info.items()
-                        )
-                    
-                    # PNG 특정 청크 확인 (문제가 될 수 있는 청크)
-                    if img.format == 'PNG':
-                        problematic_chunks = ['zTXt', 'iTXt', 'tEXt']  # Google이 사용하는 비표준 청크들
-                        for chunk in problematic_chunks:
-                            if chunk in img.info:
-                                analysis['problematic_chunks'].append(chunk)
-                                
-            except Exception as img_error:
-                analysis['image_analysis_error'] = str(img_error)
+                analysis['signature_mime'] = _SIG_TO_MIME.get(detected_format, 'unknown')
             
             return analysis
             
@@ -292,15 +540,18 @@ class ImageDiagnostics:
         recommendations = []
         
         try:
+            base64_analysis = diagnostics.get('base64_analysis') or _EMPTY
+            signature_analysis = diagnostics.get('signature_analysis') or _EMPTY
+            pillow_analysis = diagnostics.get('pillow_analysis') or _EMPTY
+            metadata_analysis = diagnostics.get('metadata_analysis') or _EMPTY
+            
             # Base64 문제 감지
-            base64_analysis = diagnostics.get('base64_analysis', {})
             if base64_analysis.get('is_likely_text') and base64_analysis.get('is_base64_pattern'):
                 recommendations.append(
                     "파일이 Base64 텍스트로 저장되어 있습니다. 바이너리로 디코딩하여 다시 저장하세요."
                 )
             
             # 시그니처 불일치 감지
-            signature_analysis = diagnostics.get('signature_analysis', {})
             extension = diagnostics.get('extension', '').lower()
             detected_format = signature_analysis.get('detected_format')
             
@@ -316,27 +567,27 @@ class ImageDiagnostics:
                     )
             
             # Pillow 검증 실패
-            pillow_analysis = diagnostics.get('pillow_analysis', {})
-            if not pillow_analysis.get('pillow_can_open'):
+            pillow_can_open = pillow_analysis.get('pillow_can_open')
+            if not pillow_can_open:
                 recommendations.append(
                     "Pillow가 파일을 열 수 없습니다. 파일이 손상되었거나 지원하지 않는 형식일 수 있습니다."
                 )
-            elif pillow_analysis.get('verification_status', '').startswith('failed'):
+            elif (pillow_analysis.get('verification_status') or '').startswith('failed'):
                 recommendations.append(
                     "이미지 검증에 실패했습니다. Pillow로 재처리하여 메타데이터를 정리하세요."
                 )
             
             # 메타데이터 문제
-            metadata_analysis = diagnostics.get('metadata_analysis', {})
-            if metadata_analysis.get('problematic_chunks'):
+            problematic_chunks = metadata_analysis.get('problematic_chunks')
+            if problematic_chunks:
                 recommendations.append(
-                    f"문제가 될 수 있는 PNG 청크가 발견되었습니다: {metadata_analysis['problematic_chunks']}. "
+                    f"문제가 될 수 있는 PNG 청크가 발견되었습니다: {problematic_chunks}. "
                     "메타데이터를 제거하고 다시 저장하세요."
                 )
             
             # 기본 권장사항
             if not recommendations:
-                if pillow_analysis.get('pillow_can_open'):
+                if pillow_can_open:
                     recommendations.append("파일이 정상적으로 보입니다.")
                 else:
                     recommendations.append("추가 조사가 필요합니다.")
@@ -373,8 +624,6 @@ def validate_base64_string(base64_string: str) -> Dict[str, Any]:
         Dict: 검증 결과
     """
     try:
-        import re
-        
         result = {
             'is_valid_base64': False,
             'is_url_safe': False,
@@ -385,45 +634,21 @@ def validate_base64_string(base64_string: str) -> Dict[str, Any]:
         }
         
         clean_string = base64_string.strip()
+        if not clean_string.isascii():
+            # Base64 알파벳 밖의 문자 포함
+            return result
         
-        # 패턴 검사
-        base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-        url_safe_pattern = re.compile(r'^[A-Za-z0-9_-]*={0,2}$')
-        
-        result['is_valid_base64'] = base64_pattern.match(clean_string) is not None
-        result['is_url_safe'] = url_safe_pattern.match(clean_string) is not None
+        is_standard, is_url_safe, decoded, decode_error = _decode_base64(clean_string.encode('ascii'))
+        result['is_valid_base64'] = is_standard
+        result['is_url_safe'] = is_url_safe
+        result['error'] = decode_error
         
-        if result['is_valid_base64'] or result['is_url_safe']:
-            try:
-                # URL-safe 변환
-                if result['is_url_safe']:
-                    clean_string = clean_string.replace('-', '+').replace('_', '/')
-                
-                # 패딩 추가
-                padding_needed = len(clean_string) % 4
-                if padding_needed:
-                    clean_string += '=' * (4 - padding_needed)
-                
-                decoded = base64.b64decode(clean_string)
-                result['decode_success'] = True
-                result['decoded_size'] = len(decoded)
-                
-                # 이미지 시그니처 확인
-                signatures = {
-                    'png': b'\x89PNG\r\n\x1a\n',
-                    'jpeg': b'\xff\xd8\xff',
-                    'webp': b'RIFF',
-                    'gif': b'GIF8',
-                    'bmp': b'BM'
-                }
-                
-                for fmt, signature in signatures.items():
-                    if decoded.startswith(signature):
-                        result['detected_image_format'] = fmt
-                        break
-                
-            except Exception as decode_error:
-                result['error'] = str(decode_error)
+        if decoded is not None:
+            result['decode_success'] = True
+            result['decoded_size'] = len(decoded)
+            
+            # 이미지 시그니처 확인
+            result['detected_image_format'] = _detect_signature(decoded[:8])
         
         return result
         
@@ -431,6 +656,75 @@ def validate_base64_string(base64_string: str) -> Dict[str, Any]:
         return {'error': f"Validation failed: {str(e)}"}
 
 
+def _walk_with_exts(root: Union[str, Path], exts: set) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    확장자가 일치하는 파일을 한 번의 디렉토리 순회로 찾기
+    
+    Args:
+        root: 탐색할 디렉토리
+        exts: 소문자 확장자 집합 (예: {'.png'})
+        
+    Yields:
+        Tuple[str, os.stat_result]: (파일 경로, stat 정보)
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (os.path.splitext(entry.name)[1].lower() in exts
+                          and entry.is_file()):
+                        yield entry.path, entry.stat()
+        except OSError as e:
+            logger.warning(f"Failed to scan directory: {e}")
+
+
+# 리포트 병렬 진단 설정 (파일 수가 적으면 프로세스 기동 비용이 더 큼)
+_REPORT_PARALLEL_MIN_FILES = 8
+_REPORT_CHUNK_SIZE = 8
+_REPORT_MAX_WORKERS = 4
+
+# 리포트용 프로세스 풀 (첫 사용 시 한 번 생성해 재사용)
+# 서버 프로세스에는 백그라운드 스레드가 있으므로 fork 대신 spawn으로 작업 프로세스 시작
+_report_executor: Optional[ProcessPoolExecutor] = None
+_report_executor_lock = threading.Lock()
+
+
+def _get_report_executor() -> ProcessPoolExecutor:
+    """리포트 진단용 프로세스 풀 반환 (spawn 컨텍스트, 작업자 수 제한)"""
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is None:
+            _report_executor = ProcessPoolExecutor(
+                max_workers=min(_REPORT_MAX_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _report_executor
+
+
+def _discard_report_executor() -> None:
+    """사용할 수 없게 된 프로세스 풀 정리 (다음 리포트에서 새로 생성)"""
+    global _report_executor
+    with _report_executor_lock:
+        executor, _report_executor = _report_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_process_diagnostics() -> 'ImageDiagnostics':
+    """프로세스별 ImageDiagnostics 인스턴스"""
+    return ImageDiagnostics()
+
+
+def _diagnose_one(item: Tuple[str, os.stat_result]) -> Dict[str, Any]:
+    """리포트용 단일 파일 진단 (프로세스 풀 작업 단위)"""
+    file_path, stat_result = item
+    return _get_process_diagnostics().diagnose_file(file_path, stat_result)
+
+
 def create_test_image_report(output_dir: Union[str, Path]) -> Dict[str, Any]:
     """
     출력 디렉토리의 이미지들에 대한 진단 보고서 생성
@@ -452,12 +746,8 @@ def create_test_image_report(output_dir: Union[str, Path]) -> Dict[str, Any]:
         
         # 이미지 파일 찾기
         image_extensions = {'.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp'}
-        image_files = []
-        
-        for ext in image_extensions:
-            image_files.extend(output_dir.rglob(f'*{ext}'))
+        image_files = list(_walk_with_exts(output_dir, image_extensions))
         
-        diagnostics = ImageDiagnostics()
         results = {
             'total_files': len(image_files),
             'directory': str(output_dir),
@@ -471,25 +761,45 @@ def create_test_image_report(output_dir: Union[str, Path]) -> Dict[str, Any]:
             }
         }
         
-        for file_path in image_files:
-            diagnosis = diagnostics.diagnose_file(file_path)
+        # 변경되지 않은 파일은 캐시된 진단 결과 사용
+        cache_keys = [_diagnosis_cache_key(path, stat_result) for path, stat_result in image_files]
+        diagnoses = [_get_cached_diagnosis(key) for key in cache_keys]
+        misses = [i for i, diagnosis in enumerate(diagnoses) if diagnosis is None]
+        
+        # 나머지 파일별 진단은 서로 독립적이므로 프로세스 풀로 병렬 실행
+        if len(misses) >= _REPORT_PARALLEL_MIN_FILES:
+            try:
+                computed = _get_report_executor().map(
+                    _diagnose_one, [image_files[i] for i in misses], chunksize=_REPORT_CHUNK_SIZE
+                )
+                for i, diagnosis in zip(misses, computed):
+                    # 작업 프로세스의 캐시는 현재 프로세스와 공유되지 않으므로 여기에 저장
+                    _cache_diagnosis(cache_keys[i], diagnosis)
+                    diagnoses[i] = diagnosis
+            except Exception as e:
+                logger.warning(f"Parallel diagnosis unavailable, falling back to serial: {e}")
+                _discard_report_executor()
+        
+        for i in misses:
+            if diagnoses[i] is None:
+                diagnoses[i] = _diagnose_one(image_files[i])
+        
+        for diagnosis in diagnoses:
             results['files'].append(diagnosis)
             
             # 요약 통계 업데이트
-            if len(diagnosis.get('recommendations', [])) <= 1 and 'error' not in diagnosis:
+            if len(diagnosis.get('recommendations') or ()) <= 1 and 'error' not in diagnosis:
                 results['summary']['healthy'] += 1
             else:
                 results['summary']['problematic'] += 1
             
             # 특정 문제 카운트
-            base64_analysis = diagnosis.get('base64_analysis', {})
+            base64_analysis = diagnosis.get('base64_analysis') or _EMPTY
             if (base64_analysis.get('is_likely_text') and 
                 base64_analysis.get('is_base64_pattern')):
                 results['summary']['base64_text_files'] += 1
             
-            signature_analysis = diagnosis.get('signature_analysis', {})
-            pillow_analysis = diagnosis.get('pillow_analysis', {})
-            
+            pillow_analysis = diagnosis.get('pillow_analysis') or _EMPTY
             if not pillow_analysis.get('pillow_can_open', True):
                 results['summary']['pillow_failures'] += 1
         
@@ -4,16 +4,29 @@
 이미지 파일의 저장, 로딩, 캐싱, 메타데이터 관리 등을 담당합니다.
 """
 
+import atexit
 import hashlib
 import json
 import logging
 import shutil
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Union, Tuple
 import os
 import tempfile
+import threading
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
 
 from ..config import get_settings
 from ..constants import (
@@ -23,11 +36,133 @@ from ..constants import (
     CACHE_PREFIX,
     CACHE_EXPIRY_TIMES,
     CACHE_FILE_EXTENSIONS,
-    ERROR_CODES
+    CACHE_MAX_ENTRIES,
+    ERROR_CODES,
+    METADATA_FLUSH_INTERVAL,
+    METADATA_FLUSH_BATCH_SIZE,
+    DIRECTORY_SCAN_WORKERS,
+    FILE_DELETE_WORKERS,
+    FILE_DELETE_PARALLEL_MIN
 )
 
 logger = logging.getLogger(__name__)
 
+# 저장 중 이미지 해시 계산용 (해시 함수는 GIL을 놓으므로 파일 쓰기와 겹쳐 실행, 스레드는 첫 사용 시 생성)
+_hash_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-manager-hash")
+
+
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """
+    JSON 직렬화 (orjson이 설치되어 있으면 사용)
+    
+    Args:
+        data: 직렬화할 데이터
+        indent: 2칸 들여쓰기 여부
+        
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: Union[bytes, str]) -> Any:
+    """JSON 역직렬화 (orjson이 설치되어 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# 이미지 내용 해시 알고리즘 (메타데이터의 hash_algo로 함께 기록, 이전 기록은 SHA-256)
+CONTENT_HASH_ALGO = "blake2b-128"
+
+
+def content_hash(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    이미지 내용 해시 (BLAKE2b 128비트, 표준 라이브러리만 사용)
+    
+    중복/식별용 해시이므로 저장 경로(ImageHandler, FileManager)가 모두 이 함수를 사용해야
+    설치 환경과 관계없이 같은 바이트에 같은 값이 기록됩니다.
+    
+    Args:
+        data: 해시할 바이트 데이터
+        
+    Returns:
+        str: hex 해시
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _prompt_hash(prompt: str) -> str:
+    """파일명용 프롬프트 해시 (배치/후보 간 같은 프롬프트는 한 번만 계산)"""
+    return hashlib.md5(prompt.encode('utf-8')).hexdigest()[:8]
+
+
+def _scan_tree(root: str) -> List[Tuple[Path, int, float, float]]:
+    """
+    디렉토리 하위의 모든 파일 수집 (os.scandir 재귀, 파일당 stat 1회)
+    
+    Args:
+        root: 탐색할 디렉토리
+        
+    Returns:
+        List: (경로, 크기, 수정 시각, 생성 시각) 튜플 리스트
+    """
+    files = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((Path(entry.path), stat.st_size, stat.st_mtime, stat.st_ctime))
+        except FileNotFoundError:
+            continue
+    return files
+
+
+def _unlink(path: Union[str, Path]) -> Optional[Exception]:
+    """파일 삭제 (실패해도 예외를 던지지 않고 반환해 일괄 삭제가 중단되지 않도록 함)"""
+    try:
+        os.unlink(path)
+        return None
+    except Exception as e:
+        return e
+
+
+def _unlink_many(paths: List[Union[str, Path]]) -> List[Optional[Exception]]:
+    """
+    여러 파일 삭제 (개수가 많으면 스레드에서 병렬 unlink, unlink는 GIL을 놓음)
+    
+    Args:
+        paths: 삭제할 파일 경로 리스트
+        
+    Returns:
+        List: 경로별 삭제 실패 예외 (성공은 None, 입력 순서 유지)
+    """
+    if len(paths) < FILE_DELETE_PARALLEL_MIN:
+        return [_unlink(path) for path in paths]
+    
+    with ThreadPoolExecutor(max_workers=FILE_DELETE_WORKERS) as executor:
+        return list(executor.map(_unlink, paths))
+
+
+def _created_at_ts(record: Dict[str, Any]) -> float:
+    """기록의 생성 시각 (epoch 초, created_at_ts가 없는 이전 기록은 created_at을 파싱)"""
+    created_at_ts = record.get("created_at_ts")
+    if created_at_ts is not None:
+        return created_at_ts
+    try:
+        return datetime.fromisoformat(record.get("created_at", "")).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
 
 class FileManagerError(Exception):
     """파일 관리 관련 예외"""
@@ -62,10 +197,40 @@ class FileManager:
         # 디렉토리 생성
         self._ensure_directories()
         
-        # 메타데이터 파일
+        # 메타데이터 파일 (append-only JSONL, metadata.json은 이전 형식으로 최초 1회 이전)
         self.metadata_file = self.output_dir / "metadata.json"
+        self.metadata_jsonl = self.output_dir / "metadata.jsonl"
         self.cache_index_file = self.cache_dir / "cache_index.json"
         
+        # 편집 그래프 (원본 → 편집 결과, append-only JSONL)
+        self.edit_graph_file = self.output_dir / ".edit_graph.jsonl"
+        # (저장은 작업 스레드에서 동시에 일어나므로 파일 기록/로드/재구축은 _edit_graph_lock 안에서 수행)
+        self._edit_graph: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._edit_graph_signature: Optional[Tuple[int, int]] = None
+        self._edit_graph_lock = threading.Lock()
+        
+        # 이미지 기록 캐시 (created_at_ts 오름차순, 메타데이터 파일 변경 시에만 다시 읽음)
+        self._history: Optional[List[Dict[str, Any]]] = None
+        self._history_keys: List[float] = []
+        self._history_signature: Optional[Tuple[int, int]] = None
+        self._history_offset = 0  # 기록 캐시에 반영된 JSONL 바이트 수
+        self._metadata_migrated = False
+        self._metadata_lock = threading.Lock()
+        
+        # 기록 조회 결과 LRU ((limit, 작업 유형) -> 최신순 기록, 기록 캐시가 바뀌면 비움)
+        self._history_queries: "OrderedDict[Tuple[Optional[int], Optional[str]], List[Dict[str, Any]]]" = OrderedDict()
+        self._history_queries_size = CACHE_MAX_ENTRIES["history_query"]
+        
+        # 프롬프트 단어 역색인 (단어 → _prompt_entries 위치, 검색 시 지연 생성 후 추가분만 반영)
+        self._prompt_index: Optional[Dict[str, List[int]]] = None
+        self._prompt_entries: List[Tuple[Dict[str, Any], frozenset]] = []
+        
+        # 지연 기록 큐 (메타데이터 로그 줄과 캐시 인덱스 항목을 모아 백그라운드에서 한 번에 기록)
+        self._pending_metadata: List[Dict[str, Any]] = []
+        self._pending_cache_entries: Dict[str, Dict[str, Any]] = {}
+        self._flush_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        
         logger.info("File manager initialized")
     
     def _ensure_directories(self) -> None:
@@ -91,7 +256,8 @@ class FileManager:
         prompt: Optional[str] = None,
         extension: str = "png",
         include_timestamp: bool = True,
-        include_hash: bool = True
+        include_hash: bool = True,
+        suffix: Optional[str] = None
     ) -> str:
         """
         파일명 생성
@@ -102,6 +268,7 @@ class FileManager:
             extension: 파일 확장자
             include_timestamp: 타임스탬프 포함 여부
             include_hash: 해시 포함 여부
+            suffix: 파일명 끝에 붙일 구분자 (같은 초에 저장되는 후보 이미지 구분용)
             
         Returns:
             str: 생성된 파일명
@@ -123,9 +290,7 @@ class FileManager:
             
             if include_hash and prompt:
                 # 프롬프트 기반 해시 생성
-                hash_input = prompt.encode('utf-8')
-                hash_value = hashlib.md5(hash_input).hexdigest()[:8]
-                components["hash"] = hash_value
+                components["hash"] = _prompt_hash(prompt)
             else:
                 components["hash"] = ""
             
@@ -135,6 +300,9 @@ class FileManager:
             # 패턴에 따라 파일명 생성
             filename = pattern.format(**components)
             
+            if suffix:
+                filename = f"{filename}_{suffix}"
+            
             # 불필요한 언더스코어 제거
             filename = filename.replace("__", "_").strip("_")
             
@@ -185,7 +353,10 @@ class FileManager:
         operation_type: str,
         metadata: Dict[str, Any],
         prompt: Optional[str] = None,
-        output_format: str = "png"
+        output_format: str = "png",
+        created_at: Optional[str] = None,
+        filename_suffix: Optional[str] = None,
+        precomputed_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         이미지와 메타데이터를 함께 저장
@@ -196,6 +367,9 @@ class FileManager:
             metadata: 메타데이터
             prompt: 원본 프롬프트
             output_format: 출력 형식
+            created_at: 생성 시각 (ISO 형식, 생략 시 현재 시각)
+            filename_suffix: 파일명 구분자 (generate_filename의 suffix)
+            precomputed_hash: 호출자가 이미 계산한 image_data의 content_hash() 값
             
         Returns:
             Dict: 저장 결과 정보
@@ -205,7 +379,8 @@ class FileManager:
             filename = self.generate_filename(
                 operation_type=operation_type,
                 prompt=prompt,
-                extension=output_format
+                extension=output_format,
+                suffix=filename_suffix
             )
             
             # 파일 경로 결정
@@ -213,24 +388,25 @@ class FileManager:
             subdir.mkdir(exist_ok=True)
             file_path = subdir / filename
             
+            # 해시가 없으면 파일 쓰기와 동시에 계산
+            hash_future = None
+            if not precomputed_hash:
+                hash_future = _hash_executor.submit(content_hash, image_data)
+            
             # 이미지 파일 저장 (바이너리 모드 강제)
+            # 쓰기 실패는 예외로 드러나므로 저장 후 exists/stat로 다시 확인하지 않고
+            # write가 보고한 바이트 수로 크기를 검증
             with open(file_path, 'wb') as f:
-                f.write(image_data)
-            
-            # 저장 후 파일 무결성 검증
-            if not file_path.exists():
-                raise FileManagerError("File was not created after write operation")
+                actual_size = f.write(image_data)
             
             # 파일 크기 검증
-            actual_size = file_path.stat().st_size
             if actual_size != len(image_data):
                 logger.warning(f"File size mismatch: expected {len(image_data)}, got {actual_size}")
             
-            # 파일 시그니처 검증 (간단한 검증)
+            # 파일 시그니처 검증 (기록한 바이트와 동일하므로 디스크에서 다시 읽지 않음)
             try:
-                with open(file_path, 'rb') as f:
-                    file_header = f.read(8)
-                    
+                file_header = bytes(image_data[:8])
+                
                 # 기본적인 이미지 시그니처 검증
                 signatures = {
                     'png': b'\x89PNG\r\n\x1a\n',
@@ -257,17 +433,28 @@ class FileManager:
                 "filename": filename,
                 "filepath": str(file_path),
                 "operation_type": operation_type,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at or datetime.now().isoformat(),
                 "file_size": len(image_data),
                 "format": output_format,
                 "prompt": prompt,
-                "hash": hashlib.sha256(image_data).hexdigest(),
+                "hash": precomputed_hash or hash_future.result(),
+                "hash_algo": CONTENT_HASH_ALGO,
                 **metadata
             }
             
+            # 통계 집계 시 ISO 문자열을 다시 파싱하지 않도록 epoch 시각도 함께 기록
+            try:
+                file_metadata["created_at_ts"] = datetime.fromisoformat(file_metadata["created_at"]).timestamp()
+            except (TypeError, ValueError):
+                file_metadata["created_at_ts"] = time.time()
+            
             # 메타데이터 저장
             self._save_metadata(file_metadata)
             
+            # 편집 결과는 편집 그래프에도 기록
+            if operation_type == "edited" and file_metadata.get("original_image"):
+                self._append_edit_graph(file_metadata)
+            
             # 캐시 정보 업데이트 (필요시)
             if self.settings.enable_cache:
                 self._update_cache_index(file_path, file_metadata)
@@ -287,29 +474,177 @@ class FileManager:
     
     def _save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
-        메타데이터를 JSON 파일에 저장
+        메타데이터를 JSONL 로그 기록 대기열에 추가 (기록은 flush에서 일괄 수행)
         
         Args:
             metadata: 저장할 메타데이터
         """
+        with self._metadata_lock:
+            self._pending_metadata.append(metadata)
+            self._schedule_flush()
+    
+    def flush(self) -> None:
+        """대기 중인 메타데이터와 캐시 인덱스 항목을 디스크에 기록"""
+        with self._metadata_lock:
+            self._flush_metadata()
+            self._flush_cache_index()
+    
+    def _schedule_flush(self) -> None:
+        """백그라운드 기록 스레드 시작 및 대기열이 차면 즉시 기록 요청 (_metadata_lock 안에서 호출)"""
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_worker,
+                name="file-manager-flush",
+                daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self.flush)
+        
+        if len(self._pending_metadata) + len(self._pending_cache_entries) >= METADATA_FLUSH_BATCH_SIZE:
+            self._flush_event.set()
+    
+    def _flush_worker(self) -> None:
+        """주기적으로 (또는 요청 시) 대기열을 기록하는 백그라운드 루프"""
+        while True:
+            self._flush_event.wait(METADATA_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            self.flush()
+    
+    def _flush_metadata(self) -> None:
+        """
+        대기 중인 메타데이터를 한 번의 write + fsync로 로그에 추가 (_metadata_lock 안에서 호출)
+        
+        기록에 실패하면 로그를 기록 전 크기로 되돌리고 항목을 대기열 앞에 다시 넣어
+        다음 flush에서 재시도합니다. 프로세스가 강제 종료되면 마지막 기록 이후
+        (최대 METADATA_FLUSH_INTERVAL) 대기 중이던 항목은 유실될 수 있습니다.
+        """
+        if not self._pending_metadata:
+            return
+        
+        records, self._pending_metadata = self._pending_metadata, []
         try:
-            # 기존 메타데이터 로드
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    all_metadata = json.load(f)
-            else:
-                all_metadata = {"images": [], "last_updated": None}
-            
-            # 새 메타데이터 추가
-            all_metadata["images"].append(metadata)
-            all_metadata["last_updated"] = datetime.now().isoformat()
+            self._migrate_legacy_metadata()
+            history_current = (
+                self._history is not None
+                and self._history_signature == self._metadata_signature()
+            )
             
-            # 저장
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(all_metadata, f, indent=2, ensure_ascii=False)
+            data = b"".join(_dump_json(record, indent=False) + b"\n" for record in records)
+            # 버퍼 없이 기록하여 실패 시 되돌린 뒤 남은 버퍼가 다시 기록되지 않도록 함
+            with open(self.metadata_jsonl, 'ab', buffering=0) as f:
+                start_size = f.seek(0, os.SEEK_END)
+                try:
+                    written = f.write(data)
+                    if written != len(data):
+                        raise OSError(f"Short write: {written}/{len(data)} bytes")
+                    os.fsync(f.fileno())
+                except Exception:
+                    # 일부만 기록된 줄이 재시도 시 중복/손상되지 않도록 잘라냄
+                    f.truncate(start_size)
+                    raise
                 
         except Exception as e:
-            logger.error(f"Failed to save metadata: {e}")
+            # 기록하지 못한 항목은 버리지 않고 다음 flush에서 재시도
+            self._pending_metadata[:0] = records
+            logger.error(f"Failed to save metadata ({len(records)} records queued for retry): {e}")
+            return
+        
+        # 로드된 기록이 최신 상태였다면 다시 읽지 않도록 함께 갱신
+        # (최신이 아니면 다음 조회 시 추가된 부분만 읽음)
+        if history_current:
+            for record in records:
+                created_at_ts = _created_at_ts(record)
+                record["created_at_ts"] = created_at_ts
+                index = bisect_right(self._history_keys, created_at_ts)
+                self._history_keys.insert(index, created_at_ts)
+                self._history.insert(index, record)
+            self._index_prompts(records)
+            self._history_queries.clear()
+            self._history_offset += len(data)
+            self._history_signature = self._metadata_signature()
+    
+    def _migrate_legacy_metadata(self) -> None:
+        """이전 형식(metadata.json) 기록을 JSONL 로그로 이전 (_metadata_lock 안에서 호출)"""
+        if self._metadata_migrated:
+            return
+        
+        if not self.metadata_jsonl.exists() and self.metadata_file.exists():
+            with open(self.metadata_file, 'rb') as f:
+                images = _load_json(f.read()).get("images", [])
+            
+            temp_file = self.metadata_jsonl.with_suffix(".jsonl.tmp")
+            with open(temp_file, 'wb') as f:
+                for image in images:
+                    f.write(_dump_json(image, indent=False) + b"\n")
+            os.replace(temp_file, self.metadata_jsonl)
+            logger.info(f"Migrated {len(images)} metadata records to {self.metadata_jsonl.name}")
+        
+        self._metadata_migrated = True
+    
+    def _metadata_signature(self) -> Optional[Tuple[int, int]]:
+        """메타데이터 로그 변경 감지용 (수정 시각 ns, 크기)"""
+        try:
+            stat = self.metadata_jsonl.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _load_history(self) -> List[Dict[str, Any]]:
+        """
+        이미지 기록 로드 (파일 변경 시에만 읽음, _metadata_lock 안에서 호출)
+        
+        로그는 append-only이므로 파일이 커졌다면 이전에 읽은 위치 이후만 읽습니다.
+        기록 대기 중인 메타데이터는 먼저 로그에 기록합니다.
+        
+        Returns:
+            List: created_at_ts 오름차순으로 정렬된 이미지 기록 (캐시 자체이므로 수정 금지)
+        """
+        self._flush_metadata()
+        self._migrate_legacy_metadata()
+        
+        signature = self._metadata_signature()
+        if signature is None:
+            return []
+        if self._history is not None and signature == self._history_signature:
+            return self._history
+        
+        incremental = self._history is not None and signature[1] > self._history_offset
+        start = self._history_offset if incremental else 0
+        
+        with open(self.metadata_jsonl, 'rb') as f:
+            f.seek(start)
+            data = f.read()
+        
+        # 마지막 줄이 아직 쓰는 중(개행 없음)이면 다음 로드에서 읽음
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = _load_json(line)
+            except ValueError as e:
+                logger.warning(f"Skipping corrupt metadata record: {e}")
+                continue
+            record["created_at_ts"] = _created_at_ts(record)
+            records.append(record)
+        
+        if incremental:
+            for record in records:
+                index = bisect_right(self._history_keys, record["created_at_ts"])
+                self._history_keys.insert(index, record["created_at_ts"])
+                self._history.insert(index, record)
+            self._index_prompts(records)
+        else:
+            records.sort(key=itemgetter("created_at_ts"))
+            self._history = records
+            self._history_keys = [record["created_at_ts"] for record in records]
+            self._prompt_index = None
+        
+        self._history_queries.clear()
+        self._history_offset = start + end
+        self._history_signature = signature
+        return self._history
     
     def get_image_history(
         self,
@@ -324,37 +659,190 @@ class FileManager:
             operation_type: 필터링할 작업 유형
             
         Returns:
-            List: 이미지 기록 리스트
+            List: 이미지 기록 리스트 (최신순, 호출자가 수정해도 캐시에 영향이 없도록 항목별 사본)
         """
         try:
-            if not self.metadata_file.exists():
-                return []
-            
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                all_metadata = json.load(f)
-            
-            images = all_metadata.get("images", [])
-            
-            # 작업 유형 필터링
-            if operation_type:
-                images = [img for img in images if img.get("operation_type") == operation_type]
+            with self._metadata_lock:
+                history = self._load_history()
+                
+                # 기록이 바뀌지 않았다면 같은 조건의 이전 조회 결과 재사용
+                query_key = (limit, operation_type)
+                cached = self._history_queries.get(query_key)
+                if cached is not None:
+                    self._history_queries.move_to_end(query_key)
+                    return [dict(image) for image in cached]
+                
+                # 캐시된 기록을 최신순으로 순회하며 필터/개수 제한 적용
+                # (전체 사본을 만들지 않고 limit개를 채우면 중단)
+                images = reversed(history)
+                
+                # 작업 유형 필터링
+                if operation_type:
+                    images = (img for img in images if img.get("operation_type") == operation_type)
+                
+                # 개수 제한
+                images = list(islice(images, limit) if limit else images)
+                
+                self._history_queries[query_key] = images
+                if len(self._history_queries) > self._history_queries_size:
+                    self._history_queries.popitem(last=False)
+                
+                return [dict(image) for image in images]
             
-            # 최신순 정렬
-            images.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        except Exception as e:
+            logger.error(f"Failed to get image history: {e}")
+            return []
+    
+    def _history_count(self) -> int:
+        """이미지 기록 개수 (목록 사본 없이 캐시에서 바로 계산)"""
+        with self._metadata_lock:
+            return len(self._load_history())
+    
+    def get_history_since(
+        self,
+        since_ts: float,
+        operation_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        특정 시각 이후의 이미지 기록 조회 (정렬된 시각 목록에서 이진 탐색)
+        
+        Args:
+            since_ts: 기준 시각 (epoch 초, 이 시각 이후 기록만 반환)
+            operation_type: 필터링할 작업 유형
             
-            # 개수 제한
-            if limit:
-                images = images[:limit]
+        Returns:
+            List: 이미지 기록 리스트 (최신순, 항목별 사본)
+        """
+        try:
+            with self._metadata_lock:
+                history = self._load_history()
+                images = history[bisect_right(self._history_keys, since_ts):]
             
-            return images
+            return [
+                dict(img) for img in reversed(images)
+                if not operation_type or img.get("operation_type") == operation_type
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get image history: {e}")
             return []
     
+    def get_children(self, image_path: str) -> List[Dict[str, Any]]:
+        """
+        특정 이미지를 원본으로 사용한 편집 결과 조회
+        
+        Args:
+            image_path: 원본 이미지 절대 경로
+            
+        Returns:
+            List: 편집 그래프 항목 리스트 (생성 순)
+        """
+        try:
+            with self._edit_graph_lock:
+                return list(self._load_edit_graph().get(image_path, []))
+        except Exception as e:
+            logger.error(f"Failed to get edit children: {e}")
+            return []
+    
+    def _append_edit_graph(self, metadata: Dict[str, Any]) -> None:
+        """
+        편집 그래프에 항목 추가
+        
+        Args:
+            metadata: 저장된 편집 이미지 메타데이터
+        """
+        entry = {
+            "parent": metadata.get("original_image"),
+            "child": metadata.get("filepath"),
+            "created_at": metadata.get("created_at"),
+            "prompt": metadata.get("prompt")
+        }
+        
+        try:
+            with self._edit_graph_lock:
+                # 그래프 파일이 아직 없으면 기존 기록(방금 저장한 항목 포함)으로 구성
+                if not self.edit_graph_file.exists():
+                    self._rebuild_edit_graph()
+                    return
+                
+                graph_current = (
+                    self._edit_graph is not None
+                    and self._edit_graph_signature == self._edit_graph_file_signature()
+                )
+                
+                with open(self.edit_graph_file, 'ab') as f:
+                    f.write(_dump_json(entry, indent=False) + b"\n")
+                
+                # 로드된 그래프가 추가 전에 최신 상태였을 때만 다시 읽지 않도록 함께 갱신
+                # (그 사이 다른 기록이 있었다면 다음 로드에서 파일 전체를 다시 읽음)
+                if graph_current:
+                    self._edit_graph.setdefault(entry["parent"], []).append(entry)
+                    self._edit_graph_signature = self._edit_graph_file_signature()
+                
+        except Exception as e:
+            logger.error(f"Failed to update edit graph: {e}")
+    
+    def _edit_graph_file_signature(self) -> Optional[Tuple[int, int]]:
+        """편집 그래프 파일 변경 감지용 (수정 시각 ns, 크기)"""
+        try:
+            stat = self.edit_graph_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _load_edit_graph(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        편집 그래프 로드 (파일 변경 시에만 다시 읽음, _edit_graph_lock 안에서 호출)
+        
+        Returns:
+            Dict: 원본 경로 → 편집 항목 리스트
+        """
+        if not self.edit_graph_file.exists():
+            self._rebuild_edit_graph()
+        
+        signature = self._edit_graph_file_signature()
+        if self._edit_graph is not None and signature == self._edit_graph_signature:
+            return self._edit_graph
+        
+        graph: Dict[str, List[Dict[str, Any]]] = {}
+        with open(self.edit_graph_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = _load_json(line)
+                graph.setdefault(entry.get("parent"), []).append(entry)
+        
+        self._edit_graph = graph
+        self._edit_graph_signature = signature
+        return graph
+    
+    def _rebuild_edit_graph(self) -> None:
+        """기존 메타데이터 기록으로 편집 그래프 파일 생성 (_edit_graph_lock 안에서 호출)"""
+        edits = self.get_image_history(operation_type="edited")
+        edits.reverse()  # 생성 순으로 기록
+        
+        with open(self.edit_graph_file, 'wb') as f:
+            for edit in edits:
+                if not edit.get("original_image"):
+                    continue
+                entry = {
+                    "parent": edit.get("original_image"),
+                    "child": edit.get("filepath"),
+                    "created_at": edit.get("created_at"),
+                    "prompt": edit.get("prompt")
+                }
+                f.write(_dump_json(entry, indent=False) + b"\n")
+        
+        self._edit_graph = None
+        logger.info(f"Rebuilt edit graph from history: {len(edits)} edits")
+    
     def find_images_by_prompt(self, prompt: str, similarity_threshold: float = 0.8) -> List[Dict[str, Any]]:
         """
-        프롬프트로 이미지 검색
+        프롬프트로 이미지 검색 (단어 집합 Jaccard 유사도)
+        
+        임계값이 0보다 크면 검색 프롬프트와 공통 단어가 있는 기록만 역색인에서 찾아
+        공통 단어 수로 유사도를 계산합니다.
         
         Args:
             prompt: 검색할 프롬프트
@@ -364,25 +852,31 @@ class FileManager:
             List: 매칭되는 이미지 리스트
         """
         try:
-            images = self.get_image_history()
-            matches = []
-            
-            prompt_lower = prompt.lower()
+            query_tokens = frozenset(prompt.lower().split())
             
-            for image in images:
-                image_prompt = image.get("prompt", "")
-                if not image_prompt:
-                    continue
+            with self._metadata_lock:
+                entries = self._load_prompt_index()
                 
-                # 간단한 유사도 계산 (실제로는 더 정교한 방법 사용)
-                similarity = self._calculate_prompt_similarity(prompt_lower, image_prompt.lower())
+                if similarity_threshold > 0:
+                    # 공통 단어가 없으면 유사도가 0이므로 후보에서 제외
+                    shared = Counter()
+                    for token in query_tokens:
+                        shared.update(self._prompt_index.get(token, ()))
+                    candidates = shared.items()
+                else:
+                    candidates = ((i, len(query_tokens & tokens)) for i, (_, tokens) in enumerate(entries))
                 
-                if similarity >= similarity_threshold:
-                    image["similarity"] = similarity
-                    matches.append(image)
+                matches = []
+                for position, common in candidates:
+                    image, tokens = entries[position]
+                    similarity = common / (len(query_tokens) + len(tokens) - common)
+                    
+                    if similarity >= similarity_threshold:
+                        # 기록 캐시의 항목을 수정하지 않도록 사본에 유사도 추가
+                        matches.append({**image, "similarity": similarity})
             
-            # 유사도순 정렬
-            matches.sort(key=lambda x: x.get("similarity", 0), reverse=True)
+            # 유사도순 정렬 (같으면 최신순)
+            matches.sort(key=lambda x: (x["similarity"], x.get("created_at_ts", 0)), reverse=True)
             
             return matches
             
@@ -390,27 +884,34 @@ class FileManager:
             logger.error(f"Failed to find images by prompt: {e}")
             return []
     
-    def _calculate_prompt_similarity(self, prompt1: str, prompt2: str) -> float:
+    def _load_prompt_index(self) -> List[Tuple[Dict[str, Any], frozenset]]:
         """
-        프롬프트 유사도 계산 (간단한 방법)
+        프롬프트 역색인 로드 (없으면 기록 캐시로 생성, _metadata_lock 안에서 호출)
         
-        Args:
-            prompt1: 첫 번째 프롬프트
-            prompt2: 두 번째 프롬프트
-            
         Returns:
-            float: 유사도 (0.0-1.0)
+            List: (이미지 기록, 소문자 단어 집합) 리스트 (역색인 위치의 대상)
         """
-        words1 = set(prompt1.split())
-        words2 = set(prompt2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        history = self._load_history()
+        if self._prompt_index is None:
+            self._prompt_index = {}
+            self._prompt_entries = []
+            self._index_prompts(history)
+        return self._prompt_entries
+    
+    def _index_prompts(self, records: List[Dict[str, Any]]) -> None:
+        """기록들의 프롬프트 단어를 역색인에 추가 (역색인이 생성된 경우에만, _metadata_lock 안에서 호출)"""
+        if self._prompt_index is None:
+            return
         
-        return len(intersection) / len(union)
+        for record in records:
+            tokens = frozenset((record.get("prompt") or "").lower().split())
+            if not tokens:
+                continue
+            
+            position = len(self._prompt_entries)
+            self._prompt_entries.append((record, tokens))
+            for token in tokens:
+                self._prompt_index.setdefault(token, []).append(position)
     
     def cleanup_temp_files(self, max_age_hours: int = 24) -> int:
         """
@@ -427,20 +928,22 @@ class FileManager:
                 return 0
             
             deleted_count = 0
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-            
-            for file_path in self.temp_dir.iterdir():
-                if file_path.is_file():
-                    # 파일 생성 시간 확인
-                    file_time = datetime.fromtimestamp(file_path.stat().st_ctime)
-                    
-                    if file_time < cutoff_time:
-                        try:
-                            file_path.unlink()
-                            deleted_count += 1
-                            logger.debug(f"Deleted temp file: {file_path}")
-                        except Exception as e:
-                            logger.warning(f"Failed to delete temp file {file_path}: {e}")
+            # 파일마다 datetime을 만들지 않고 epoch 초로 직접 비교
+            cutoff_ts = time.time() - max_age_hours * 3600
+            
+            with os.scandir(self.temp_dir) as entries:
+                # 파일 생성 시간 확인
+                expired_paths = [
+                    entry.path for entry in entries
+                    if entry.is_file() and entry.stat().st_ctime < cutoff_ts
+                ]
+            
+            for file_path, error in zip(expired_paths, _unlink_many(expired_paths)):
+                if error is not None:
+                    logger.warning(f"Failed to delete temp file {file_path}: {error}")
+                    continue
+                deleted_count += 1
+                logger.debug(f"Deleted temp file: {file_path}")
             
             logger.info(f"Cleaned up {deleted_count} temporary files")
             return deleted_count
@@ -460,39 +963,45 @@ class FileManager:
             if not self.settings.enable_cache:
                 return {"status": "disabled"}
             
-            cache_stats = self._get_cache_stats()
+            # 캐시 디렉토리를 한 번만 탐색하고 이후 단계는 메모리에서 처리
+            cache_files = self._walk_cache()
+            cache_stats = self._get_cache_stats(cache_files)
+            deleted_paths = set()
             deleted_files = 0
             freed_space = 0
             
             # 만료된 파일 삭제
-            expired_files = self._find_expired_cache_files()
-            for file_path, size in expired_files:
-                try:
-                    file_path.unlink()
-                    deleted_files += 1
-                    freed_space += size
-                    logger.debug(f"Deleted expired cache file: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete cache file {file_path}: {e}")
+            expired_files = self._find_expired_cache_files(cache_files)
+            errors = _unlink_many([file_path for file_path, _ in expired_files])
+            for (file_path, size), error in zip(expired_files, errors):
+                if error is not None:
+                    logger.warning(f"Failed to delete cache file {file_path}: {error}")
+                    continue
+                deleted_paths.add(file_path)
+                deleted_files += 1
+                freed_space += size
+                logger.debug(f"Deleted expired cache file: {file_path}")
             
             # 크기 제한 초과시 오래된 파일 삭제
             max_cache_size = self.settings.max_cache_size * 1024 * 1024  # MB to bytes
             current_size = cache_stats["total_size"] - freed_space
             
             if current_size > max_cache_size:
-                old_files = self._get_oldest_cache_files(current_size - max_cache_size)
-                for file_path, size in old_files:
-                    try:
-                        file_path.unlink()
-                        deleted_files += 1
-                        freed_space += size
-                        current_size -= size
-                        logger.debug(f"Deleted old cache file: {file_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete cache file {file_path}: {e}")
-            
-            # 캐시 인덱스 업데이트
-            self._rebuild_cache_index()
+                remaining_files = [f for f in cache_files if f[0] not in deleted_paths]
+                old_files = self._get_oldest_cache_files(current_size - max_cache_size, remaining_files)
+                errors = _unlink_many([file_path for file_path, _ in old_files])
+                for (file_path, size), error in zip(old_files, errors):
+                    if error is not None:
+                        logger.warning(f"Failed to delete cache file {file_path}: {error}")
+                        continue
+                    deleted_paths.add(file_path)
+                    deleted_files += 1
+                    freed_space += size
+                    current_size -= size
+                    logger.debug(f"Deleted old cache file: {file_path}")
+            
+            # 캐시 인덱스 업데이트 (남은 파일 목록 재사용)
+            self._rebuild_cache_index([f for f in cache_files if f[0] not in deleted_paths])
             
             result = {
                 "status": "completed",
@@ -509,62 +1018,90 @@ class FileManager:
             logger.error(f"Failed to manage cache: {e}")
             return {"status": "error", "message": str(e)}
     
-    def _get_cache_stats(self) -> Dict[str, Any]:
-        """캐시 통계 정보 반환"""
-        try:
-            if not self.cache_dir.exists():
-                return {"total_files": 0, "total_size": 0}
-            
-            total_files = 0
-            total_size = 0
+    def _walk_cache(self, directory: Optional[Path] = None) -> List[Tuple[Path, int, float, float]]:
+        """
+        디렉토리의 모든 파일을 한 번에 수집
+        
+        최상위 하위 디렉토리가 여러 개면 각 하위 트리를 스레드에서 병렬로 탐색합니다
+        (scandir/stat 시스템 호출은 GIL을 놓으므로 스레드로 겹쳐 실행 가능).
+        
+        Args:
+            directory: 탐색할 디렉토리 (기본값: 캐시 디렉토리)
             
-            for file_path in self.cache_dir.rglob("*"):
-                if file_path.is_file():
-                    total_files += 1
-                    total_size += file_path.stat().st_size
+        Returns:
+            List: (경로, 크기, 수정 시각, 생성 시각) 튜플 리스트
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory or self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((Path(entry.path), stat.st_size, stat.st_mtime, stat.st_ctime))
+        except FileNotFoundError:
+            return files
+        
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(DIRECTORY_SCAN_WORKERS, len(subdirs))) as executor:
+                for subtree_files in executor.map(_scan_tree, subdirs):
+                    files.extend(subtree_files)
+        else:
+            for subdir in subdirs:
+                files.extend(_scan_tree(subdir))
+        return files
+    
+    def _get_cache_stats(self, cache_files: Optional[List[Tuple[Path, int, float, float]]] = None) -> Dict[str, Any]:
+        """캐시 통계 정보 반환 (cache_files: _walk_cache 결과, 없으면 새로 탐색)"""
+        try:
+            if cache_files is None:
+                cache_files = self._walk_cache()
             
-            return {"total_files": total_files, "total_size": total_size}
+            return {
+                "total_files": len(cache_files),
+                "total_size": sum(size for _, size, _, _ in cache_files)
+            }
             
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
             return {"total_files": 0, "total_size": 0}
     
-    def _find_expired_cache_files(self) -> List[Tuple[Path, int]]:
-        """만료된 캐시 파일 찾기"""
+    def _find_expired_cache_files(
+        self,
+        cache_files: Optional[List[Tuple[Path, int, float, float]]] = None
+    ) -> List[Tuple[Path, int]]:
+        """만료된 캐시 파일 찾기 (cache_files: _walk_cache 결과, 없으면 새로 탐색)"""
         try:
-            expired_files = []
-            cutoff_time = datetime.now() - timedelta(hours=self.settings.cache_expiry)
-            
-            for file_path in self.cache_dir.rglob("*"):
-                if file_path.is_file():
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_time:
-                        expired_files.append((file_path, file_path.stat().st_size))
+            if cache_files is None:
+                cache_files = self._walk_cache()
             
-            return expired_files
+            cutoff_ts = time.time() - self.settings.cache_expiry * 3600
+            return [(file_path, size) for file_path, size, mtime, _ in cache_files if mtime < cutoff_ts]
             
         except Exception as e:
             logger.error(f"Failed to find expired cache files: {e}")
             return []
     
-    def _get_oldest_cache_files(self, target_size: int) -> List[Tuple[Path, int]]:
-        """가장 오래된 캐시 파일들을 목표 크기만큼 반환"""
+    def _get_oldest_cache_files(
+        self,
+        target_size: int,
+        cache_files: Optional[List[Tuple[Path, int, float, float]]] = None
+    ) -> List[Tuple[Path, int]]:
+        """가장 오래된 캐시 파일들을 목표 크기만큼 반환 (cache_files: _walk_cache 결과, 없으면 새로 탐색)"""
         try:
-            files_with_time = []
-            
-            for file_path in self.cache_dir.rglob("*"):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    files_with_time.append((file_path, stat.st_size, stat.st_mtime))
+            if cache_files is None:
+                cache_files = self._walk_cache()
             
             # 시간순 정렬 (오래된 것부터)
-            files_with_time.sort(key=lambda x: x[2])
+            files_with_time = sorted(cache_files, key=itemgetter(2))
             
             # 목표 크기만큼 선택
             selected_files = []
             accumulated_size = 0
             
-            for file_path, size, _ in files_with_time:
+            for file_path, size, _, _ in files_with_time:
                 selected_files.append((file_path, size))
                 accumulated_size += size
                 if accumulated_size >= target_size:
@@ -577,41 +1114,70 @@ class FileManager:
             return []
     
     def _update_cache_index(self, file_path: Path, metadata: Dict[str, Any]) -> None:
-        """캐시 인덱스 업데이트"""
+        """캐시 인덱스 기록 대기열에 항목 추가 (기록은 flush에서 일괄 수행)"""
+        with self._metadata_lock:
+            self._pending_cache_entries[str(file_path)] = {
+                "added_at": datetime.now().isoformat(),
+                "metadata": metadata
+            }
+            self._schedule_flush()
+    
+    def _flush_cache_index(self) -> None:
+        """
+        대기 중인 캐시 인덱스 항목을 한 번에 기록 (_metadata_lock 안에서 호출)
+        
+        기록에 실패하면 항목을 대기열에 다시 넣어 다음 flush에서 재시도합니다.
+        """
+        if not self._pending_cache_entries:
+            return
+        
+        entries, self._pending_cache_entries = self._pending_cache_entries, {}
         try:
             if self.cache_index_file.exists():
-                with open(self.cache_index_file, 'r', encoding='utf-8') as f:
-                    cache_index = json.load(f)
+                with open(self.cache_index_file, 'rb') as f:
+                    cache_index = _load_json(f.read())
             else:
                 cache_index = {"files": {}, "last_updated": None}
             
-            cache_index["files"][str(file_path)] = {
-                "added_at": datetime.now().isoformat(),
-                "metadata": metadata
-            }
+            cache_index["files"].update(entries)
             cache_index["last_updated"] = datetime.now().isoformat()
             
-            with open(self.cache_index_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_index, f, indent=2, ensure_ascii=False)
+            with open(self.cache_index_file, 'wb') as f:
+                f.write(_dump_json(cache_index))
+                f.flush()
+                os.fsync(f.fileno())
                 
         except Exception as e:
-            logger.error(f"Failed to update cache index: {e}")
+            # 기록하지 못한 항목은 버리지 않고 다음 flush에서 재시도 (이후 추가된 항목이 우선)
+            entries.update(self._pending_cache_entries)
+            self._pending_cache_entries = entries
+            logger.error(f"Failed to update cache index ({len(entries)} entries queued for retry): {e}")
     
-    def _rebuild_cache_index(self) -> None:
-        """캐시 인덱스 재구축"""
+    def _rebuild_cache_index(self, cache_files: Optional[List[Tuple[Path, int, float, float]]] = None) -> None:
+        """캐시 인덱스 재구축 (cache_files: _walk_cache 결과, 없으면 새로 탐색)"""
         try:
-            cache_index = {"files": {}, "last_updated": datetime.now().isoformat()}
-            
-            # 실제 파일들을 스캔하여 인덱스 재구축
-            for file_path in self.cache_dir.rglob("*"):
-                if file_path.is_file():
-                    cache_index["files"][str(file_path)] = {
-                        "added_at": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat(),
-                        "size": file_path.stat().st_size
+            if cache_files is None:
+                cache_files = self._walk_cache()
+            
+            # 실제 파일 목록으로 인덱스 재구축
+            cache_index = {
+                "files": {
+                    str(file_path): {
+                        "added_at": datetime.fromtimestamp(ctime).isoformat(),
+                        "size": size
                     }
+                    for file_path, size, _, ctime in cache_files
+                },
+                "last_updated": datetime.now().isoformat()
+            }
             
-            with open(self.cache_index_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_index, f, indent=2, ensure_ascii=False)
+            # 백그라운드 flush의 읽기-수정-쓰기와 겹치지 않도록 같은 잠금 안에서 기록하며,
+            # 대기 중인 항목을 먼저 기록해 재구축 결과가 나중에 덮이지 않도록 함
+            with self._metadata_lock:
+                self._flush_metadata()
+                self._flush_cache_index()
+                with open(self.cache_index_file, 'wb') as f:
+                    f.write(_dump_json(cache_index))
                 
             logger.info("Cache index rebuilt")
             
@@ -633,7 +1199,7 @@ class FileManager:
                 "output_stats": self._get_directory_stats(self.output_dir),
                 "cache_stats": self._get_directory_stats(self.cache_dir),
                 "temp_stats": self._get_directory_stats(self.temp_dir),
-                "total_images": len(self.get_image_history())
+                "total_images": self._history_count()
             }
             
             return stats
@@ -648,16 +1214,11 @@ class FileManager:
             if not directory.exists():
                 return {"files": 0, "size_mb": 0.0, "exists": False}
             
-            total_files = 0
-            total_size = 0
-            
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    total_files += 1
-                    total_size += file_path.stat().st_size
+            files = self._walk_cache(directory)
+            total_size = sum(size for _, size, _, _ in files)
             
             return {
-                "files": total_files,
+                "files": len(files),
                 "size_mb": round(total_size / 1024 / 1024, 2),
                 "exists": True
             }
@@ -8,6 +8,7 @@ import hashlib
 import logging
 import mimetypes
 import os
+import re
 from io import BytesIO
 from pathlib import Path
 from typing import Optional, Tuple, Union, Dict, Any, List
@@ -27,9 +28,44 @@ from ..constants import (
     ERROR_CODES,
     GEMINI_DEFAULT_RESOLUTION
 )
+from .file_manager import content_hash
 
 logger = logging.getLogger(__name__)
 
+# 이미지 파일 시그니처 (앞 2바이트 -> (형식, 전체 시그니처))
+_IMAGE_SIGNATURES = {
+    b'\x89P': ('png', b'\x89PNG\r\n\x1a\n'),
+    b'\xff\xd8': ('jpeg', b'\xff\xd8\xff'),
+    b'RI': ('webp', b'RIFF'),
+    b'GI': ('gif', b'GIF8'),
+    b'BM': ('bmp', b'BM')
+}
+
+# base64 문자열 패턴 (표준 / URL-safe)
+_BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+_URL_SAFE_BASE64_PATTERN = re.compile(r'[A-Za-z0-9_-]*={0,2}')
+
+
+def _detect_signature(data: bytes) -> Optional[str]:
+    """
+    파일 시그니처로 이미지 형식 감지
+    
+    Args:
+        data: 이미지 데이터 (앞 12바이트 이상이면 충분)
+        
+    Returns:
+        Optional[str]: 감지된 형식 (없으면 None)
+    """
+    # 앞 2바이트로 후보를 한 번에 찾은 뒤 전체 시그니처 비교
+    candidate = _IMAGE_SIGNATURES.get(data[:2])
+    if not candidate or not data.startswith(candidate[1]):
+        return None
+    
+    # WebP 추가 검증
+    if candidate[0] == 'webp' and len(data) >= 12 and data[8:12] != b'WEBP':
+        return None
+    return candidate[0]
+
 
 class ImageHandlerError(Exception):
     """이미지 처리 관련 예외"""
@@ -151,8 +187,9 @@ class ImageHandler:
         format: str = None,
         quality: Union[str, int] = None,
         remove_metadata: bool = True,
+        return_hash: bool = False,
         **kwargs
-    ) -> Path:
+    ) -> Union[Path, Tuple[Path, str, int]]:
         """
         이미지 저장 (메타데이터 정리 및 호환성 개선)
         
@@ -162,10 +199,11 @@ class ImageHandler:
             format: 이미지 형식 (png, jpeg, webp)
             quality: 품질 설정
             remove_metadata: 메타데이터 제거 여부 (호환성 향상)
+            return_hash: True이면 인코딩된 버퍼의 내용 해시(content_hash)와 기록한 바이트 수도 함께 반환
             **kwargs: 추가 저장 옵션
             
         Returns:
-            Path: 저장된 파일 경로
+            Union[Path, Tuple[Path, str, int]]: 저장된 파일 경로 (return_hash=True이면 (경로, 해시, 파일 크기))
         """
         try:
             output_path = Path(output_path)
@@ -186,8 +224,9 @@ class ImageHandler:
             if remove_metadata:
                 try:
                     # 이미지 데이터만 복사하여 깨끗한 이미지 생성
-                    clean_image = Image.new(image.mode, image.size)
-                    clean_image.putdata(list(image.getdata()))
+                    # (픽셀 단위 파이썬 리스트 복사 대신 C 레벨 복사로 GIL을 오래 잡지 않도록 함)
+                    clean_image = image.copy()
+                    clean_image.info = {}
                     image = clean_image
                     logger.debug("Removed image metadata for better compatibility")
                 except Exception as meta_error:
@@ -223,24 +262,28 @@ class ImageHandler:
                 image = background
                 logger.debug("Converted RGBA to RGB for JPEG compatibility")
             
-            # 저장
-            image.save(output_path, format=format.upper(), **save_kwargs)
-            
-            # 저장 후 검증
-            if output_path.exists():
-                file_size = output_path.stat().st_size
-                logger.info(f"Saved image to {output_path} (format: {format}, size: {file_size} bytes)")
-                
-                # 저장된 파일 검증
-                try:
-                    with Image.open(output_path) as saved_img:
-                        saved_img.verify()
-                        logger.debug(f"Saved image verification passed")
-                except Exception as verify_error:
-                    logger.warning(f"Saved image verification failed: {verify_error}")
-            else:
-                raise ImageHandlerError("File was not created after save operation")
+            # 메모리 버퍼로 인코딩 (CPU 작업과 디스크 쓰기를 분리)
+            buffer = BytesIO()
+            image.save(buffer, format=format.upper(), **save_kwargs)
             
+            # 인코딩 결과 검증 (디스크에서 다시 읽지 않고 버퍼로 확인)
+            try:
+                buffer.seek(0)
+                with Image.open(buffer) as saved_img:
+                    saved_img.verify()
+                    logger.debug(f"Saved image verification passed")
+            except Exception as verify_error:
+                logger.warning(f"Saved image verification failed: {verify_error}")
+            
+            # 한 번의 쓰기로 저장
+            with open(output_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+            
+            logger.info(f"Saved image to {output_path} (format: {format}, size: {buffer.getbuffer().nbytes} bytes)")
+            
+            if return_hash:
+                # 저장된 파일을 다시 읽거나 stat하지 않고 메모리의 인코딩 결과로 해시와 크기 계산
+                return output_path, content_hash(buffer.getbuffer()), buffer.getbuffer().nbytes
             return output_path
             
         except Exception as e:
@@ -253,8 +296,9 @@ class ImageHandler:
         output_path: Union[str, Path],
         format: str = None,
         quality: Union[str, int] = None,
-        process_with_pillow: bool = True
-    ) -> Path:
+        process_with_pillow: bool = True,
+        return_hash: bool = False
+    ) -> Union[Path, Tuple[Path, str, int]]:
         """
         바이트 데이터를 이미지 파일로 저장 (Pillow 처리 옵션)
         
@@ -264,9 +308,10 @@ class ImageHandler:
             format: 원하는 출력 형식
             quality: 품질 설정
             process_with_pillow: Pillow로 재처리하여 호환성 개선
+            return_hash: True이면 기록된 바이트의 내용 해시(content_hash)와 바이트 수도 함께 반환
             
         Returns:
-            Path: 저장된 파일 경로
+            Union[Path, Tuple[Path, str, int]]: 저장된 파일 경로 (return_hash=True이면 (경로, 해시, 파일 크기))
         """
         try:
             output_path = Path(output_path)
@@ -279,7 +324,8 @@ class ImageHandler:
                         output_path=output_path,
                         format=format,
                         quality=quality,
-                        remove_metadata=True
+                        remove_metadata=True,
+                        return_hash=return_hash
                     )
             else:
                 # 직접 바이너리 저장 (빠르지만 호환성 문제 가능)
@@ -289,6 +335,8 @@ class ImageHandler:
                     f.write(image_bytes)
                 
                 logger.info(f"Saved raw bytes to {output_path} ({len(image_bytes)} bytes)")
+                if return_hash:
+                    return output_path, content_hash(image_bytes), len(image_bytes)
                 return output_path
                 
         except Exception as e:
@@ -420,53 +468,62 @@ class ImageHandler:
         """
         return base64.b64encode(image_bytes).decode('utf-8')
     
-    def base64_to_bytes(self, base64_string: Union[str, bytes]) -> bytes:
+    def base64_to_bytes(self, base64_string: Union[str, bytes], validate: bool = False) -> bytes:
         """
         base64 문자열을 바이트로 변환 (URL-safe 형식 지원)
         
         Args:
             base64_string: base64 인코딩된 문자열 또는 바이트
+            validate: True이면 알파벳 외 문자를 디코딩 중에 거부 (별도 사전 검사 불필요)
             
         Returns:
             bytes: 디코딩된 바이트 데이터
         """
         try:
-            # 타입 체크 및 변환
-            if isinstance(base64_string, bytes):
-                try:
-                    base64_string = base64_string.decode('utf-8')
-                except UnicodeDecodeError:
+            # 타입 체크 및 변환 (문자열 복사 없이 바이트 단위로 처리)
+            if isinstance(base64_string, (bytes, bytearray, memoryview)):
+                data = bytes(base64_string)
+                if not data.isascii():
                     # 이미 바이너리 데이터인 경우 그대로 반환
-                    return base64_string
-            elif not isinstance(base64_string, str):
+                    return data
+            elif isinstance(base64_string, str):
+                # data URI 형식이면 접두사 제거
+                if base64_string.startswith('data:'):
+                    base64_string = base64_string.partition(',')[2]
+                data = base64_string.encode('ascii')
+            else:
                 raise ImageHandlerError(f"Invalid base64 input type: {type(base64_string)}")
             
-            # 문자열 전처리
-            clean_string = base64_string.strip()
+            # 문자열 전처리 (앞뒤 공백이 있을 때만 복사)
+            if data[:1].isspace() or data[-1:].isspace():
+                data = data.strip()
             
-            # URL-safe base64를 표준 base64로 변환
-            if '-' in clean_string or '_' in clean_string:
+            # URL-safe base64는 디코딩 시 altchars로 한 번에 변환
+            altchars = None
+            if b'-' in data or b'_' in data:
                 logger.debug("Detected URL-safe base64, converting to standard format")
-                # URL-safe base64 문자를 표준 base64 문자로 변환
-                clean_string = clean_string.replace('-', '+').replace('_', '/')
+                altchars = b'-_'
             
             # 패딩 추가 (필요한 경우)
-            padding_needed = len(clean_string) % 4
+            padding_needed = len(data) % 4
             if padding_needed:
-                clean_string += '=' * (4 - padding_needed)
+                data += b'=' * (4 - padding_needed)
                 logger.debug(f"Added {4 - padding_needed} padding characters")
             
             # 첫 번째 디코딩 시도 (표준 base64)
             try:
-                decoded_bytes = base64.b64decode(clean_string)
+                decoded_bytes = base64.b64decode(data, altchars=altchars, validate=validate)
                 logger.debug(f"Successfully decoded base64 string ({len(decoded_bytes)} bytes)")
                 return decoded_bytes
             except Exception as decode_error:
+                if validate:
+                    # 검증 모드에서는 알파벳 외 문자를 버리는 관대한 디코딩으로 재시도하지 않음
+                    raise
                 logger.warning(f"Standard base64 decode failed: {decode_error}, trying urlsafe decode")
                 
                 # 두 번째 시도: URL-safe 디코딩
                 try:
-                    decoded_bytes = base64.urlsafe_b64decode(clean_string)
+                    decoded_bytes = base64.urlsafe_b64decode(data)
                     logger.debug(f"Successfully decoded URL-safe base64 string ({len(decoded_bytes)} bytes)")
                     return decoded_bytes
                 except Exception as urlsafe_error:
@@ -489,24 +546,7 @@ class ImageHandler:
         """
         try:
             # 파일 시그니처 확인
-            signatures = {
-                'png': b'\x89PNG\r\n\x1a\n',
-                'jpeg': b'\xff\xd8\xff',
-                'webp': b'RIFF',
-                'gif': b'GIF8',
-                'bmp': b'BM'
-            }
-            
-            detected_format = None
-            for fmt, signature in signatures.items():
-                if data.startswith(signature):
-                    detected_format = fmt
-                    break
-                    
-            # WebP 추가 검증
-            if detected_format == 'webp' and len(data) > 12:
-                if data[8:12] != b'WEBP':
-                    detected_format = None
+            detected_format = _detect_signature(data)
             
             # 크기 검증
             size_mb = len(data) / (1024 * 1024)
@@ -558,32 +598,23 @@ class ImageHandler:
             bool: Base64 문자열 여부
         """
         try:
-            # Base64 문자만 포함하는지 확인
-            import re
-            base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-            url_safe_pattern = re.compile(r'^[A-Za-z0-9_-]*={0,2}$')
-            
             clean_data = data.strip()
             
             # 최소 길이 확인 (실제 이미지 데이터면 상당히 길어야 함)
             if len(clean_data) < 100:
                 return False
-                
-            # 패턴 매칭
-            is_standard_base64 = base64_pattern.match(clean_data) is not None
-            is_url_safe_base64 = url_safe_pattern.match(clean_data) is not None
             
-            if is_standard_base64 or is_url_safe_base64:
-                # 실제 디코딩이 가능한지 테스트
-                try:
-                    test_decode = self.base64_to_bytes(clean_data)
-                    # 디코딩된 데이터가 이미지 시그니처를 가지는지 확인
-                    validation = self.validate_image_data(test_decode)
-                    return validation.get('has_signature', False)
-                except:
-                    return False
+            # 패턴 매칭 (Base64 문자만 포함하는지 확인)
+            if (_BASE64_PATTERN.fullmatch(clean_data) is None
+                    and _URL_SAFE_BASE64_PATTERN.fullmatch(clean_data) is None):
+                return False
             
-            return False
+            # 전체를 검증 디코딩하여 뒷부분이 손상된 데이터도 거부한 뒤 이미지 시그니처 확인
+            try:
+                decoded = self.base64_to_bytes(clean_data, validate=True)
+            except ImageHandlerError:
+                return False
+            return _detect_signature(decoded) is not None
             
         except Exception as e:
             logger.debug(f"Base64 string detection failed: {e}")
@@ -623,6 +654,77 @@ class ImageHandler:
             logger.warning(f"Failed to extract image info: {e}")
             return {"size": image.size, "mode": image.mode}
     
+    def get_image_info_fast(self, source: Union[str, Path, bytes]) -> Dict[str, Any]:
+        """
+        이미지 헤더만 읽어 정보 추출 (픽셀 디코딩 없음)
+        
+        파일 경로인 경우 load_image()와 같은 존재/크기/형식 검증을 수행합니다.
+        
+        Args:
+            source: 이미지 소스 (파일 경로 또는 바이트)
+            
+        Returns:
+            Dict: 이미지 정보 (size, width, height, mode, format, has_transparency)
+            
+        Raises:
+            ImageHandlerError: 검증 또는 헤더 파싱 실패 시
+        """
+        try:
+            if isinstance(source, (str, Path)):
+                path = Path(source)
+                if not path.exists():
+                    raise ImageHandlerError(
+                        f"Image file not found: {path}",
+                        ERROR_CODES["IMAGE_CORRUPT"]["code"]
+                    )
+                
+                size_mb = path.stat().st_size / (1024 * 1024)
+                if size_mb > GEMINI_MAX_IMAGE_SIZE_MB:
+                    raise ImageHandlerError(
+                        f"Image file too large: {size_mb:.2f}MB (max: {GEMINI_MAX_IMAGE_SIZE_MB}MB)",
+                        ERROR_CODES["IMAGE_TOO_LARGE"]["code"]
+                    )
+                
+                if path.suffix.lower() not in SUPPORTED_INPUT_FORMATS:
+                    raise ImageHandlerError(
+                        f"Unsupported image format: {path.suffix}",
+                        ERROR_CODES["IMAGE_FORMAT_UNSUPPORTED"]["code"]
+                    )
+                
+                fp = path
+            elif isinstance(source, bytes):
+                if len(source) > GEMINI_MAX_IMAGE_SIZE_MB * 1024 * 1024:
+                    raise ImageHandlerError(
+                        f"Image data too large: {len(source) / 1024 / 1024:.2f}MB",
+                        ERROR_CODES["IMAGE_TOO_LARGE"]["code"]
+                    )
+                fp = BytesIO(source)
+            else:
+                raise ImageHandlerError(
+                    f"Unsupported source type: {type(source)}",
+                    ERROR_CODES["IMAGE_FORMAT_UNSUPPORTED"]["code"]
+                )
+            
+            # Image.open()은 헤더만 파싱하므로 load()를 호출하지 않으면 디코딩되지 않음
+            with Image.open(fp) as image:
+                return {
+                    "size": image.size,
+                    "width": image.width,
+                    "height": image.height,
+                    "mode": image.mode,
+                    "format": image.format,
+                    "has_transparency": image.mode in ["RGBA", "LA"] or "transparency" in image.info
+                }
+            
+        except Exception as e:
+            if isinstance(e, ImageHandlerError):
+                raise
+            logger.error(f"Failed to read image header: {e}")
+            raise ImageHandlerError(
+                f"Failed to load image: {str(e)}",
+                ERROR_CODES["IMAGE_CORRUPT"]["code"]
+            )
+    
     def create_thumbnail(
         self,
         image: Image.Image,
@@ -7,6 +7,8 @@ PDF 가이드의 권장사항을 바탕으로 Gemini 2.5 Flash Image에 최적
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
@@ -20,6 +22,7 @@ from ..constants import (
     TRANSLATION_RECOMMENDED,
     MAX_PROMPT_LENGTH,
     MIN_PROMPT_LENGTH,
+    CACHE_MAX_ENTRIES,
     ERROR_CODES
 )
 
@@ -62,6 +65,14 @@ class PromptOptimizer:
         # 번역 캐시 (간단한 인메모리 캐시)
         self._translation_cache = {}
         
+        # 최적화 결과 캐시 (입력 튜플 키, LRU)
+        # 편집 도구는 워커 스레드에서도 호출하므로 LRU 조작과 통계 갱신은 잠금 안에서 수행
+        self._optimization_cache_lock = threading.Lock()
+        self._optimization_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._optimization_cache_size = CACHE_MAX_ENTRIES["prompt"]
+        self._optimization_cache_hits = 0
+        self._optimization_cache_misses = 0
+        
         logger.info("Prompt optimizer initialized")
     
     def optimize_prompt(
@@ -92,6 +103,72 @@ class PromptOptimizer:
         Raises:
             PromptOptimizerError: 최적화 실패 시
         """
+        # 최적화는 입력에 대해 결정적이므로 동일한 입력은 캐시에서 반환
+        # (추가 키워드는 입력 순서대로 프롬프트에 붙으므로 정렬하지 않고 순서를 키에 포함)
+        cache_key = (
+            prompt,
+            category,
+            aspect_ratio,
+            style,
+            quality_level,
+            tuple(additional_keywords) if additional_keywords else ()
+        )
+        with self._optimization_cache_lock:
+            cached = self._optimization_cache.get(cache_key)
+            if cached is not None:
+                self._optimization_cache.move_to_end(cache_key)
+                self._optimization_cache_hits += 1
+            else:
+                self._optimization_cache_misses += 1
+        
+        if cached is not None:
+            logger.debug(f"Optimized prompt cache hit: '{prompt[:50]}...'")
+            return cached
+        
+        # 최적화 자체는 잠금 밖에서 수행 (같은 입력이 동시에 들어오면 결과가 같으므로 마지막 값을 저장)
+        optimized = self._optimize_uncached(
+            prompt, category, aspect_ratio, style, quality_level, additional_keywords
+        )
+        
+        with self._optimization_cache_lock:
+            self._optimization_cache[cache_key] = optimized
+            self._optimization_cache.move_to_end(cache_key)
+            if len(self._optimization_cache) > self._optimization_cache_size:
+                self._optimization_cache.popitem(last=False)
+        
+        return optimized
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        최적화 결과 캐시 통계 반환
+        
+        Returns:
+            Dict: 캐시 크기 및 적중률 정보
+        """
+        with self._optimization_cache_lock:
+            hits = self._optimization_cache_hits
+            misses = self._optimization_cache_misses
+            size = len(self._optimization_cache)
+        
+        lookups = hits + misses
+        return {
+            "size": size,
+            "max_size": self._optimization_cache_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
+    
+    def _optimize_uncached(
+        self,
+        prompt: str,
+        category: PromptCategory,
+        aspect_ratio: Optional[str],
+        style: Optional[str],
+        quality_level: Optional[str],
+        additional_keywords: Optional[List[str]]
+    ) -> str:
+        """캐시를 거치지 않는 실제 최적화 파이프라인"""
         try:
             # 1. 기본 검증
             self._validate_prompt(prompt)
@@ -0,0 +1,219 @@
+"""
+API 응답 캐시 유틸리티
+
+동일한 입력으로 Gemini API를 다시 호출하지 않도록 이전에 저장된 결과를
+인메모리 LRU와 디스크(JSON 사이드카 파일)에 캐싱합니다.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+from ..config import get_settings
+from ..constants import CACHE_PREFIX, CACHE_MAX_ENTRIES, CACHE_FILE_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    응답 캐시 클래스
+
+    키는 입력(이미지 바이트, 프롬프트, 옵션 등)의 SHA-256 해시이며,
+    값은 저장된 결과 파일을 가리키는 JSON 직렬화 가능한 dict입니다.
+    """
+
+    def __init__(self, settings=None):
+        """
+        응답 캐시 초기화
+
+        Args:
+            settings: 설정 객체
+        """
+        self.settings = settings or get_settings()
+
+        self.enabled = bool(self.settings.enable_cache)
+        self.ttl = self.settings.cache_expiry * 60 * 60  # 시간 -> 초
+        self.cache_dir = Path(self.settings.cache_dir) / "responses"
+
+        # (namespace, key) -> (만료 시각, 값)
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._max_entries = CACHE_MAX_ENTRIES["response"]
+
+        logger.info(f"Response cache initialized (enabled: {self.enabled})")
+
+    @staticmethod
+    def make_key(*parts: Union[str, bytes, None]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            *parts: 키를 구성하는 값들 (None은 빈 값으로 처리)
+
+        Returns:
+            str: SHA-256 hex 키
+        """
+        hasher = hashlib.sha256()
+        for part in parts:
+            if part is None:
+                part = b""
+            elif isinstance(part, str):
+                part = part.encode("utf-8")
+            hasher.update(part)
+            hasher.update(b"|")
+        return hasher.hexdigest()
+
+    def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회
+
+        Args:
+            namespace: 캐시 네임스페이스 (generate, edit, blend)
+            key: 캐시 키
+
+        Returns:
+            Optional[Dict]: 캐시된 값 (없거나 만료된 경우 None)
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        memory_key = (namespace, key)
+
+        entry = self._memory.get(memory_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(memory_key)
+                logger.debug(f"Response cache hit (memory): {namespace}/{key[:12]}")
+                return value
+            del self._memory[memory_key]
+
+        # 디스크 캐시 조회
+        entry_file = self._entry_path(namespace, key)
+        try:
+            with open(entry_file, 'rb') as f:
+                raw = f.read()
+            stored = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read response cache entry {entry_file}: {e}")
+            return None
+
+        expires_at = stored.get("expires_at", 0)
+        if expires_at <= now:
+            self._discard(namespace, key)
+            return None
+
+        value = stored.get("value")
+        self._remember(memory_key, expires_at, value)
+        logger.debug(f"Response cache hit (disk): {namespace}/{key[:12]}")
+        return value
+
+    def set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+        """
+        캐시 저장
+
+        Args:
+            namespace: 캐시 네임스페이스
+            key: 캐시 키
+            value: 저장할 값 (JSON 직렬화 가능해야 함)
+        """
+        if not self.enabled:
+            return
+
+        expires_at = time.time() + self.ttl
+        self._remember((namespace, key), expires_at, value)
+
+        entry_file = self._entry_path(namespace, key)
+        try:
+            entry = {"expires_at": expires_at, "value": value}
+            if orjson is not None:
+                data = orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(entry, ensure_ascii=False, default=str).encode('utf-8')
+
+            entry_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(entry_file, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            logger.warning(f"Failed to write response cache entry {entry_file}: {e}")
+
+    def invalidate(self, namespace: str, key: str) -> None:
+        """
+        캐시 항목 제거 (결과 파일이 사라진 경우 등)
+
+        Args:
+            namespace: 캐시 네임스페이스
+            key: 캐시 키
+        """
+        self._discard(namespace, key)
+
+    def clear(self) -> int:
+        """
+        전체 캐시 삭제
+
+        Returns:
+            int: 삭제된 디스크 항목 수
+        """
+        self._memory.clear()
+
+        removed = 0
+        if self.cache_dir.exists():
+            for entry_file in self.cache_dir.rglob(f"*{CACHE_FILE_EXTENSIONS['metadata']}"):
+                try:
+                    entry_file.unlink()
+                    removed += 1
+                except Exception as e:
+                    logger.warning(f"Failed to delete response cache entry {entry_file}: {e}")
+
+        logger.info(f"Response cache cleared: {removed} entries removed")
+        return removed
+
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        """디스크 캐시 항목 경로"""
+        return self.cache_dir / namespace / f"{CACHE_PREFIX}{key}{CACHE_FILE_EXTENSIONS['metadata']}"
+
+    def _remember(self, memory_key: Tuple[str, str], expires_at: float, value: Dict[str, Any]) -> None:
+        """인메모리 LRU에 항목 추가"""
+        self._memory[memory_key] = (expires_at, value)
+        self._memory.move_to_end(memory_key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _discard(self, namespace: str, key: str) -> None:
+        """인메모리/디스크 항목 제거"""
+        self._memory.pop((namespace, key), None)
+        try:
+            self._entry_path(namespace, key).unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to delete response cache entry: {e}")
+
+
+# 전역 응답 캐시 인스턴스 (싱글톤)
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    응답 캐시 인스턴스 반환 (싱글톤 패턴)
+
+    Returns:
+        ResponseCache: 응답 캐시 인스턴스
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -173,7 +173,7 @@ class TestImageHandler:
         
         assert "Unsupported output format" in str(exc_info.value)
     
-    def test_save_image_jpeg_mode_conversion(self, handler, mock_image):
+    def test_save_image_jpeg_mode_conversion(self, handler, mock_image, tmp_path):
         """JPEG 저장 시 모드 변환 테스트"""
         mock_image.mode = "RGBA"
         mock_image.split.return_value = [Mock(), Mock(), Mock(), Mock()]  # RGBA 채널들
@@ -187,13 +187,29 @@ class TestImageHandler:
             
             handler.save_image(
                 mock_image,
-                "output.jpg",
+                tmp_path / "output.jpg",
                 format="jpeg"
             )
             
             # 배경 이미지 생성 확인
             background_image.paste.assert_called()
     
+    def test_save_bytes_as_image_return_hash(self, handler, tmp_path):
+        """바이트 저장 시 기록된 파일 내용의 해시와 크기 반환 테스트"""
+        from src.utils.file_manager import content_hash
+        buffer = BytesIO()
+        Image.new('RGB', (16, 16), (0, 255, 0)).save(buffer, format='PNG')
+        
+        output_path, saved_hash, saved_size = handler.save_bytes_as_image(
+            buffer.getvalue(),
+            tmp_path / "output.png",
+            format="png",
+            return_hash=True
+        )
+        
+        assert saved_hash == content_hash(output_path.read_bytes())
+        assert saved_size == output_path.stat().st_size
+    
     def test_resize_image_with_target_size(self, handler, mock_image):
         """이미지 크기 조정 - 목표 크기 테스트"""
         with patch('PIL.ImageOps.fit', return_value=mock_image) as mock_fit:
@@ -253,6 +269,19 @@ class TestImageHandler:
         
         assert result == test_bytes
     
+    def test_is_base64_string(self, handler):
+        """이미지 base64 문자열 판별 테스트 (표준 / URL-safe / 비이미지)"""
+        import base64
+        buffer = BytesIO()
+        Image.new('RGB', (64, 64), (255, 0, 0)).save(buffer, format='PNG')
+        png_bytes = buffer.getvalue() + b"\x00" * 100
+        
+        assert handler.is_base64_string(base64.b64encode(png_bytes).decode('ascii'))
+        assert handler.is_base64_string(base64.urlsafe_b64encode(png_bytes).decode('ascii'))
+        assert not handler.is_base64_string(base64.b64encode(png_bytes).decode('ascii') + "A")
+        assert not handler.is_base64_string(base64.b64encode(b"x" * 200).decode('ascii'))
+        assert not handler.is_base64_string("!" * 200)
+    
     def test_base64_to_bytes_invalid(self, handler):
         """base64를 바이트로 변환 실패 테스트"""
         invalid_base64 = "invalid_base64!@#"
@@ -276,6 +305,22 @@ class TestImageHandler:
             assert result["mode"] == "RGB"
             assert "exif" in result
     
+    def test_get_image_info_fast(self, handler, tmp_path):
+        """헤더 기반 이미지 정보 추출 테스트"""
+        image_path = tmp_path / "sample.png"
+        Image.new('RGBA', (32, 16)).save(image_path)
+        
+        result = handler.get_image_info_fast(str(image_path))
+        
+        assert result["size"] == (32, 16)
+        assert result["format"] == "PNG"
+        assert result["has_transparency"] is True
+    
+    def test_get_image_info_fast_invalid_data(self, handler):
+        """헤더 기반 이미지 정보 추출 - 이미지가 아닌 데이터"""
+        with pytest.raises(ImageHandlerError):
+            handler.get_image_info_fast(b"not an image")
+    
     def test_create_thumbnail(self, handler, mock_image):
         """썸네일 생성 테스트"""
         result = handler.create_thumbnail(mock_image, (256, 256))